@@ -0,0 +1,80 @@
+# benchmarks/import_time.py
+"""
+Checks that importing the framework stays within a time budget.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py --budget-ms 150
+
+Each import is timed in a fresh interpreter, several times, and the median is compared
+with the budget. The script also checks that the light imports do not pull in modules
+that are only needed once an app runs (Qt, YAML, NumPy). It exits with status 1 when an
+import is over budget or loads one of those modules, so it can gate a CI job.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Statement -> modules it must not load
+IMPORTS = {
+    'import framework': ('yaml', 'PySide6', 'numpy'),
+    'from framework.widgets import Text': ('yaml', 'PySide6', 'numpy'),
+    'from framework.widgets import Container, Column, Row': ('yaml', 'PySide6', 'numpy'),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def measure(statement, runs):
+    """
+    Times an import statement in fresh interpreters.
+
+    Args:
+        statement (str): The import statement.
+        runs (int): The number of interpreters to start.
+
+    Returns:
+        tuple: The median time in milliseconds and the modules loaded by the last run.
+    """
+    times = []
+    modules = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', PROBE.format(statement=statement)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        times.append(report['ms'])
+        modules = report['modules']
+    return statistics.median(times), modules
+
+
+def run(budget_ms, runs):
+    failed = False
+    for statement, forbidden in IMPORTS.items():
+        median_ms, modules = measure(statement, runs)
+        loaded = [name for name in forbidden if name in modules]
+        over = median_ms > budget_ms
+        status = 'FAIL' if over or loaded else 'ok'
+        print(f"{status:<5} {statement:<52} {median_ms:>8.1f} ms" + (f"   loads {', '.join(loaded)}" if loaded else ''))
+        failed = failed or over or bool(loaded)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=150.0)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    sys.exit(run(args.budget_ms, args.runs))
@@ -0,0 +1,72 @@
+# benchmarks/replay.py
+"""
+Replays recorded or scripted interactions against an app and reports latency percentiles.
+
+Run from the repository root:
+
+    python benchmarks/replay.py main:Application events.jsonl --repeat 20
+    python benchmarks/replay.py main:Application events.jsonl --window --output web/replay.json
+
+The app is given as `module:Class`; the class is instantiated and its `run()` method is
+called, as in the app's own `__main__` block. The events file holds one JSON event per
+line (as written by `framework.replay.EventRecorder`) or a JSON list, for example:
+
+    {"callback": "on_tab_selected", "args": [1], "delay_ms": 0}
+    {"script": "toggleDrawer('left');", "label": "drawer:left"}
+
+Headless runs time each callback from dispatch to the last patch script; `--window` runs
+time each event in the page from the bridge call to the DOM patch and the next paint.
+With `--max-p95-ms`, the script exits with status 1 when the p95 latency is higher, so it
+can gate a CI job.
+"""
+import argparse
+import importlib
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from framework.replay import ReplayHarness, load_events
+
+
+def run(app, events_file, repeat, window, output, max_p95_ms):
+    from framework.core import Framework
+
+    module_name, _, class_name = app.partition(':')
+    app_class = getattr(importlib.import_module(module_name), class_name or 'Application')
+    application = app_class()
+
+    harness = ReplayHarness(Framework.instance(), load_events(events_file), repeat=repeat, headless=not window, output=output)
+    harness.install()
+    try:
+        application.run()
+    except SystemExit:
+        pass  # The window closes once the report is in
+
+    report = harness.report
+    if report is None:
+        print("No replay report; was the window closed early?")
+        return 1
+    latency = report['latency']
+    print(f"{report['mode']}: {report['events']} events, {report['skipped']} skipped, {report['throughput_per_s']:.1f} events/s")
+    for label, summary in [('all', latency)] + sorted(report['by_label'].items()):
+        if summary['count']:
+            print(f"  {label:<32} n={summary['count']:<5} p50 {summary['p50_ms']:>7.2f} ms   p95 {summary['p95_ms']:>7.2f} ms   p99 {summary['p99_ms']:>7.2f} ms")
+    if output:
+        print(f"Report written to {output}")
+    if max_p95_ms is not None and latency['count'] and latency['p95_ms'] > max_p95_ms:
+        print(f"FAIL p95 {latency['p95_ms']:.2f} ms is over {max_p95_ms:.2f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('app', help="The app class as module:Class, e.g. main:Application")
+    parser.add_argument('events', help="A JSON or JSON lines events file")
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--window', action='store_true', help="Replay in a real window instead of headless")
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--max-p95-ms', type=float, default=None)
+    args = parser.parse_args()
+    sys.exit(run(args.app, args.events, args.repeat, args.window, args.output, args.max_p95_ms))
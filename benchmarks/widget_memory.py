@@ -0,0 +1,89 @@
+# benchmarks/widget_memory.py
+"""
+Measures the memory used per widget instance.
+
+Run from the repository root:
+
+    python benchmarks/widget_memory.py --count 100000
+
+Run it on two revisions to compare before and after a change to the widget classes.
+Widgets are created against a minimal host object instead of a full Framework, so no
+window is opened.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from framework.base import Widget
+from framework.id_manager import IDManager
+
+
+class BenchmarkHost:
+    """
+    The minimal part of the Framework interface that widgets use while being constructed.
+    """
+    def __init__(self):
+        self.id_manager = IDManager()
+        self.widget_registry = {}
+        self.window = None
+        self.id = 'benchmark'
+
+    def register_widget(self, widget, parent_widget=None):
+        self.widget_registry[widget.widget_id()] = widget
+
+
+def measure(label, factory, count):
+    """
+    Creates `count` widgets with `factory` and reports the memory they use.
+
+    Args:
+        label (str): The name printed for this measurement.
+        factory (callable): Called with the index, returns one widget.
+        count (int): The number of widgets to create.
+
+    Returns:
+        float: Bytes allocated per widget.
+    """
+    host = BenchmarkHost()
+    Widget.set_framework(host)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    widgets = [factory(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # The registry entries and ID strings are not part of the widget itself
+    registry_bytes = sys.getsizeof(host.widget_registry) + sum(sys.getsizeof(k) for k in host.widget_registry)
+    per_widget = (allocated - registry_bytes - sys.getsizeof(widgets)) / count
+    has_dict = hasattr(widgets[0], '__dict__')
+    print(f"{label:<28} {per_widget:>10.1f} bytes/widget   {elapsed * 1e6 / count:>8.2f} us/widget   __dict__: {has_dict}")
+    return per_widget
+
+
+def run(count):
+    from framework.widgets import Text, Container, Column, Row, SizedBox, Icon
+    from framework.styles import TextStyle, EdgeInsets
+
+    style = TextStyle(fontSize=14)
+    padding = EdgeInsets.all(8)
+
+    print(f"Creating {count} widgets per class")
+    measure('Text', lambda i: Text(f'Item {i}', style=style), count)
+    measure('Container(Text)', lambda i: Container(child=Text(f'Item {i}'), padding=padding), count)
+    measure('Row(Text, SizedBox)', lambda i: Row(children=[Text(f'Item {i}'), SizedBox(width=8)]), count)
+    measure('Column(Icon, Text)', lambda i: Column(children=[Icon('home'), Text(f'Item {i}')]), count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    run(parser.parse_args().count)
@@ -1,7 +1,11 @@
 # framework/api.py
+import logging
+
 # Import the Api class from webwidget
 from .window.webwidget import Api as WebWidgetApi
 
+logger = logging.getLogger(__name__)
+
 # Extend the WebWidgetApi class
 class Api(WebWidgetApi):
     """
@@ -23,6 +27,6 @@ class Api(WebWidgetApi):
         """
         A custom method added to the extended API.
 
-        Prints a message to the console.
+        Logs a debug message.
         """
-        print("This is a custom method in the extended API.")
+        logger.debug("This is a custom method in the extended API.")
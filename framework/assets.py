@@ -0,0 +1,342 @@
+# framework/assets.py
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image as PILImage, ImageFilter, ImageOps
+except ImportError:  # Optional: without Pillow the original files are served
+    PILImage = None
+    ImageFilter = None
+    ImageOps = None
+
+# File extensions and Pillow format names of the supported output formats
+_FORMATS = {'webp': 'WEBP', 'jpeg': 'JPEG', 'jpg': 'JPEG', 'png': 'PNG'}
+
+
+class ImagePipeline:
+    """
+    A singleton producing resized, re-encoded derivatives of asset images.
+
+    A derivative is identified by the source file's content hash and the requested
+    (width, height, fit, format), and is stored under `cache_dir` with that hash as its
+    name, so a changed source gets new derivatives and unchanged ones are never rebuilt.
+    Derivatives are built in a worker pool; until one is ready, `request()` returns None
+    and the caller keeps showing the original file. A source that cannot be decoded is
+    not tried again until its content changes.
+
+    Without Pillow installed, no derivatives are produced.
+
+    Attributes:
+        assets_dir (str): The directory holding the original assets.
+        cache_dir (str): The directory, inside `assets_dir`, holding the derivatives.
+        image_format (str): The output format ('webp', 'jpeg' or 'png').
+        quality (int): The encoder quality for lossy formats.
+        ready_listener (callable): Called as `ready_listener(widget_id, name)` from a worker
+            thread when a derivative requested for a widget has been written.
+        info_listener (callable): Called as `info_listener(widget_id, info)` from a worker
+            thread when image info requested for a widget has been computed.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the singleton instance of the ImagePipeline class.
+
+        Returns:
+            ImagePipeline: The singleton instance.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, assets_dir='assets', cache_dir='.cache', image_format='webp', quality=82, max_workers=2):
+        """
+        Initializes the pipeline.
+
+        Args:
+            assets_dir (str): The directory holding the original assets. Defaults to 'assets'.
+            cache_dir (str): The derivative directory, relative to `assets_dir`. Defaults to '.cache'.
+            image_format (str): The output format. Defaults to 'webp'.
+            quality (int): The encoder quality for lossy formats. Defaults to 82.
+            max_workers (int): The size of the worker pool. Defaults to 2.
+        """
+        self.assets_dir = assets_dir
+        self.cache_dir = cache_dir
+        self.image_format = image_format if image_format in _FORMATS else 'webp'
+        self.quality = quality
+        self.ready_listener = None
+        self.info_listener = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pythra-images')
+        self._pending = {}  # Derivative name -> widget IDs waiting for it
+        self._digests = {}  # Source path -> (mtime, size, content hash)
+        self._info = {}  # Content hash -> image info (size and placeholder)
+        self._pending_info = {}  # Content hash -> widget IDs waiting for its info
+        self._failed = set()  # Derivative names and content hashes whose build failed
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        """
+        bool: Whether derivatives can be built (Pillow is installed).
+        """
+        return PILImage is not None
+
+    def configure(self, assets_dir=None, cache_dir=None, image_format=None, quality=None, max_workers=None):
+        """
+        Updates the pipeline settings, typically from the application's config.
+
+        Args:
+            assets_dir (str, optional): The directory holding the original assets.
+            cache_dir (str, optional): The derivative directory, relative to `assets_dir`.
+            image_format (str, optional): The output format.
+            quality (int, optional): The encoder quality for lossy formats.
+            max_workers (int, optional): The size of the worker pool.
+        """
+        if assets_dir:
+            self.assets_dir = assets_dir
+        if cache_dir:
+            self.cache_dir = cache_dir
+        if image_format in _FORMATS:
+            self.image_format = image_format
+        if quality:
+            self.quality = quality
+        if max_workers:
+            self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pythra-images')
+
+    def source_digest(self, file_name):
+        """
+        Returns the content hash of an asset, recomputed only when the file changes.
+
+        Args:
+            file_name (str): The asset path, relative to `assets_dir`.
+
+        Returns:
+            str or None: The hex digest, or None if the file does not exist.
+        """
+        path = os.path.join(self.assets_dir, file_name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        cached = self._digests.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                digest.update(block)
+        digest = digest.hexdigest()
+        self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def derivative_name(self, file_name, width, height, fit, image_format=None):
+        """
+        Returns the cache file name of a derivative.
+
+        Args:
+            file_name (str): The asset path, relative to `assets_dir`.
+            width (int): The target width in pixels, or None.
+            height (int): The target height in pixels, or None.
+            fit (str): An `ImageFit` value.
+            image_format (str, optional): The output format. Defaults to `image_format`.
+
+        Returns:
+            str or None: The derivative path relative to `assets_dir`, or None if the source is missing.
+        """
+        source = self.source_digest(file_name)
+        if source is None:
+            return None
+        image_format = image_format or self.image_format
+        key = hashlib.sha256(f"{source}:{width}:{height}:{fit}:{image_format}:{self.quality}".encode('utf-8'))
+        return f"{self.cache_dir}/{key.hexdigest()[:24]}.{image_format}"
+
+    def image_info(self, file_name, placeholder_size=16, widget_id=None):
+        """
+        Returns the intrinsic size of an asset and a tiny blurred placeholder for it.
+
+        The info is computed once per source content and kept in memory and in `cache_dir`.
+        Computing it decodes the image, so on a cache miss it is scheduled in the worker pool
+        and None is returned; the widget is reported to `info_listener` once it is ready.
+
+        Args:
+            file_name (str): The asset path, relative to `assets_dir`.
+            placeholder_size (int): The longest side of the placeholder in pixels. Defaults to 16.
+            widget_id (str, optional): A widget to report to `info_listener` once the info is ready.
+
+        Returns:
+            dict or None: A dict with 'width', 'height' and 'placeholder' (a data URI), or None
+                if it is not ready yet, Pillow is missing or the file cannot be read.
+        """
+        if not self.enabled:
+            return None
+        source = self.source_digest(file_name)
+        if source is None:
+            return None
+        info = self._info.get(source)
+        if info is not None or source in self._failed:
+            return info
+
+        try:
+            with open(self._info_path(source), 'r') as f:
+                info = json.load(f)
+        except (IOError, ValueError):
+            with self._lock:
+                waiting = self._pending_info.get(source)
+                if waiting is None:
+                    self._pending_info[source] = waiting = set()
+                    self._executor.submit(self._build_info_file, file_name, source, placeholder_size)
+                if widget_id:
+                    waiting.add(widget_id)
+            return None
+        self._info[source] = info
+        return info
+
+    def _info_path(self, source):
+        return os.path.join(self.assets_dir, self.cache_dir, f"{source[:24]}.json")
+
+    def _build_info_file(self, file_name, source, placeholder_size):
+        """
+        Computes and caches the info of one asset and notifies the widgets waiting for it.
+        Runs in the worker pool.
+        """
+        info = self._build_info(file_name, placeholder_size)
+        if info is not None:
+            info_path = self._info_path(source)
+            try:
+                os.makedirs(os.path.dirname(info_path), exist_ok=True)
+                with open(info_path, 'w') as f:
+                    json.dump(info, f)
+            except IOError as e:
+                logger.warning("Could not cache image info for %s: %s", file_name, e)
+            self._info[source] = info
+        with self._lock:
+            if info is None:
+                self._failed.add(source)  # Keyed by content, so a fixed file is read again
+            waiting = self._pending_info.pop(source, ())
+        if info is not None and self.info_listener:
+            for widget_id in waiting:
+                self.info_listener(widget_id, info)
+
+    def _build_info(self, file_name, placeholder_size):
+        try:
+            with PILImage.open(os.path.join(self.assets_dir, file_name)) as source:
+                width, height = source.size
+                if source.getexif().get(0x0112, 1) in (5, 6, 7, 8):  # EXIF orientation rotates by 90 degrees
+                    width, height = height, width
+                # JPEG sources can be decoded at a fraction of their size directly
+                source.draft('RGB', (placeholder_size * 4, placeholder_size * 4))
+                thumb = ImageOps.exif_transpose(source).convert('RGB')
+                thumb.thumbnail((placeholder_size, placeholder_size))
+                thumb = thumb.filter(ImageFilter.GaussianBlur(1))
+                buffer = io.BytesIO()
+                thumb.save(buffer, format='JPEG', quality=40)
+        except Exception as e:
+            logger.warning("Could not read image %s: %s", file_name, e)
+            return None
+        placeholder = 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+        return {'width': width, 'height': height, 'placeholder': placeholder}
+
+    def request(self, file_name, width=None, height=None, fit='contain', image_format=None, widget_id=None):
+        """
+        Returns a derivative of an asset, scheduling it to be built if it does not exist yet.
+
+        Args:
+            file_name (str): The asset path, relative to `assets_dir`.
+            width (int, optional): The target width in pixels.
+            height (int, optional): The target height in pixels.
+            fit (str): An `ImageFit` value. Defaults to 'contain'.
+            image_format (str, optional): The output format. Defaults to `image_format`.
+            widget_id (str, optional): A widget to report to `ready_listener` once the derivative is built.
+
+        Returns:
+            str or None: The derivative path relative to `assets_dir` if it is ready, otherwise None.
+        """
+        if not self.enabled or not (width or height) or fit == 'none':
+            return None
+        name = self.derivative_name(file_name, width, height, fit, image_format)
+        if name is None or name in self._failed:
+            return None
+        if os.path.exists(os.path.join(self.assets_dir, name)):
+            return name
+
+        with self._lock:
+            waiting = self._pending.get(name)
+            if waiting is None:
+                self._pending[name] = waiting = set()
+                self._executor.submit(self._build, file_name, name, width, height, fit)
+            if widget_id:
+                waiting.add(widget_id)
+        return None
+
+    def _build(self, file_name, name, width, height, fit):
+        """
+        Writes one derivative and notifies the widgets waiting for it. Runs in the worker pool.
+        """
+        target = os.path.join(self.assets_dir, name)
+        try:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with PILImage.open(os.path.join(self.assets_dir, file_name)) as source:
+                image = self._resize(ImageOps.exif_transpose(source), width, height, fit)
+                image_format = _FORMATS[name.rsplit('.', 1)[1]]
+                if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+                    image = image.convert('RGB')
+                tmp_path = target + '.tmp'
+                image.save(tmp_path, format=image_format, quality=self.quality)
+                os.replace(tmp_path, target)
+        except Exception as e:
+            logger.warning("Could not build image derivative for %s: %s", file_name, e)
+            with self._lock:
+                self._failed.add(name)  # The name holds the content hash, so a fixed file is built again
+                self._pending.pop(name, None)
+            return
+
+        with self._lock:
+            waiting = self._pending.pop(name, ())
+        logger.debug("Image derivative %s written for %s", name, file_name)
+        if self.ready_listener:
+            for widget_id in waiting:
+                self.ready_listener(widget_id, name)
+
+    @staticmethod
+    def _resize(image, width, height, fit):
+        """
+        Scales an image to the target box following CSS `object-fit` semantics. Never upscales.
+
+        Args:
+            image (PIL.Image.Image): The source image.
+            width (int): The target width, or None to follow the aspect ratio.
+            height (int): The target height, or None to follow the aspect ratio.
+            fit (str): An `ImageFit` value.
+
+        Returns:
+            PIL.Image.Image: The resized image.
+        """
+        src_width, src_height = image.size
+        width = int(width or src_width * height / src_height)
+        height = int(height or src_height * width / src_width)
+        if width >= src_width and height >= src_height:
+            return image.copy()
+        if fit == 'cover':
+            scale = max(width / src_width, height / src_height)
+            if scale >= 1:
+                return image.copy()
+            return ImageOps.fit(image, (width, height), method=PILImage.LANCZOS)
+        if fit == 'fill':
+            return image.resize((min(width, src_width), min(height, src_height)), PILImage.LANCZOS)
+        # contain / scale-down: fit inside the box, keeping the aspect ratio
+        image = image.copy()
+        image.thumbnail((width, height), PILImage.LANCZOS)
+        return image
+
+
+image_pipeline = ImagePipeline.instance()
@@ -0,0 +1,142 @@
+# framework/atomic_css.py
+import re
+import threading
+
+
+def split_declarations(css_text):
+    """
+    Splits a CSS declaration block into normalised `property: value` declarations.
+
+    Semicolons inside parentheses or quotes (as in `url(data:...;base64,...)`) are kept.
+    When a property appears more than once, the last declaration wins, as it would in a rule.
+
+    Args:
+        css_text (str): Declarations such as "padding: 20px; margin: 0px;".
+
+    Returns:
+        tuple: The declarations, in order, each formatted as 'property: value'.
+    """
+    parts = []
+    current = []
+    depth = 0
+    quote = None
+    for char in css_text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(0, depth - 1)
+        elif char == ';' and depth == 0:
+            parts.append(''.join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append(''.join(current))
+
+    declarations = {}
+    for part in parts:
+        prop, sep, value = part.partition(':')
+        prop = prop.strip().lower()
+        value = re.sub(r'\s+', ' ', value.strip())
+        if not sep or not prop or not value:
+            continue
+        declarations.pop(prop, None)  # Re-insert so the last occurrence keeps its position
+        declarations[prop] = f"{prop}: {value}"
+    return tuple(declarations.values())
+
+
+class AtomicStyleSheet:
+    """
+    A singleton registry compiling CSS declarations into reusable single-declaration classes.
+
+    With the atomic style backend, a widget's style is not one rule per distinct style key
+    but a list of classes, one per declaration (`padding: 20px` -> `atom-3`). The
+    stylesheet therefore grows with the number of distinct declarations rather than with
+    their combinations, and a new combination of known declarations needs no new CSS.
+
+    Rules are emitted in registration order, so when two declarations of a widget overlap
+    (a shorthand and a longhand), the one registered later takes precedence.
+
+    Attributes:
+        enabled (bool): Whether widgets compile their styles to atomic classes.
+        prefix (str): The prefix of the generated class names.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the singleton instance of the AtomicStyleSheet class.
+
+        Returns:
+            AtomicStyleSheet: The singleton instance.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, prefix='atom'):
+        self.enabled = False
+        self.prefix = prefix
+        self._classes = {}  # Declaration -> class name
+        self._rules = []  # Rule strings in registration order
+        self._lists = {}  # Declaration block -> space separated class list
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __contains__(self, css_class):
+        return css_class.startswith(self.prefix + '-') and css_class[len(self.prefix) + 1:].isdigit()
+
+    def class_for(self, declaration):
+        """
+        Returns the atomic class for one declaration, registering it if needed.
+
+        Args:
+            declaration (str): A normalised 'property: value' declaration.
+
+        Returns:
+            str: The class name.
+        """
+        css_class = self._classes.get(declaration)
+        if css_class is None:
+            with self._lock:
+                css_class = self._classes.get(declaration)
+                if css_class is None:
+                    css_class = f"{self.prefix}-{len(self._rules)}"
+                    self._rules.append(f".{css_class} {{ {declaration}; }}")
+                    self._classes[declaration] = css_class
+        return css_class
+
+    def classes_for(self, css_text):
+        """
+        Compiles a declaration block into a class list.
+
+        Args:
+            css_text (str): Declarations such as "padding: 20px; margin: 0px;".
+
+        Returns:
+            str: Space separated atomic class names.
+        """
+        classes = self._lists.get(css_text)
+        if classes is None:
+            classes = ' '.join(self.class_for(declaration) for declaration in split_declarations(css_text))
+            self._lists[css_text] = classes
+        return classes
+
+    def css(self):
+        """
+        Returns the complete atomic stylesheet.
+
+        Returns:
+            str: All registered rules, one per line.
+        """
+        return '\n'.join(self._rules)
+
+
+atomic_styles = AtomicStyleSheet.instance()
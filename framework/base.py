@@ -3,22 +3,47 @@
 
 import weakref
 
+from .atomic_css import atomic_styles
+
+
+
+def style_field(index):
+    """
+    Creates a read-only property returning one field of a widget's interned `style_key`.
+
+    Widgets whose style values are part of their `style_key` read them through these
+    properties instead of keeping a second copy on every instance.
+
+    Args:
+        index (int): The position of the field in the style key tuple.
+
+    Returns:
+        property: The property object.
+    """
+    def getter(self):
+        return self.style_key[index]
+    return property(getter)
 
 
 class Widget:
     """
     The Base class for widgets.
 
+    The base class uses `__slots__`, so subclasses that also declare `__slots__` carry no
+    per-instance `__dict__`. Subclasses without `__slots__` behave as ordinary classes.
+
     Attributes:
         _framework_ref (weakref.ref): Weak reference to the framework managing the widget.
         _parent (Widget): Reference to the parent widget.
-        _children (list): List of child widgets.
+        _children (tuple): Tuple of child widgets.
 
     Raises:
         NotImplementedError: Raised when a required method is not implemented.
     """
+    __slots__ = ('_id', '_parent', '_children', '__weakref__')
 
     _framework_ref = None
+    css_rules = {}  # Shared CSS class -> rule string, for all widget classes, in registration order
 
     @classmethod
     def set_framework(cls, framework):
@@ -46,7 +71,7 @@ class Widget:
         framework = self._framework_ref()
         #self._key = key
         self._parent = None  # Reference to the parent widget
-        self._children = []  # List of child widgets
+        self._children = ()  # Tuple of child widgets
 
         if framework:
             # Use the framework's IDManager to generate or validate the widget ID
@@ -58,6 +83,69 @@ class Widget:
         else:
             self._id = None  # In case the framework is not set, set ID to None
 
+    @classmethod
+    def _intern_style(cls, style_key, prefix):
+        """
+        Returns the canonical style key and shared CSS class for a style key.
+
+        The first widget with a given key registers it in the class's `shared_styles` and
+        formats its rule once, with `css_rule()`, into `Widget.css_rules`; later widgets reuse
+        the stored tuple, so identical styles share one object and stylesheet generation
+        only joins or looks up the stored rules.
+
+        With the atomic style backend, widget classes that define `css_declarations(style_key)`
+        get a list of atomic classes (one per declaration) instead of a per-key class.
+
+        Args:
+            style_key (tuple): The style values of the widget.
+            prefix (str): The CSS class prefix, e.g. 'shared-text'.
+
+        Returns:
+            tuple: The canonical style key and its CSS class name.
+        """
+        canonical = cls._style_keys.get(style_key)
+        if canonical is None:
+            canonical = cls._style_keys[style_key] = style_key
+            if atomic_styles.enabled and hasattr(cls, 'css_declarations'):
+                cls.shared_styles[style_key] = atomic_styles.classes_for(cls.css_declarations(style_key))
+            else:
+                css_class = cls.shared_styles[style_key] = f"{prefix}-{len(cls.shared_styles)}"
+                rule = cls.css_rule(css_class, style_key)
+                if rule:
+                    Widget.css_rules[css_class] = rule
+        return canonical, cls.shared_styles[canonical]
+
+    @classmethod
+    def css_rule(cls, css_class, style_key):
+        """
+        Formats the shared rule of a style key. Called once, when the key is registered.
+
+        The default wraps `css_declarations(style_key)` in a rule for the class; widgets
+        whose styles need more than one rule (descendant selectors) override this.
+
+        Args:
+            css_class (str): The shared CSS class of the style.
+            style_key (tuple): The style values.
+
+        Returns:
+            str or None: The CSS, or None if the class defines no declarations.
+        """
+        declarations = getattr(cls, 'css_declarations', None)
+        if declarations is None:
+            return None
+        return f".{css_class} {{ {declarations(style_key)} }}"
+
+    @classmethod
+    def shared_css(cls):
+        """
+        Returns the rules of every style registered by this widget class.
+
+        Returns:
+            str: The stored rules, in registration order.
+        """
+        rules = Widget.css_rules
+        return "\n".join(rules[css_class] for css_class in cls.shared_styles.values() if css_class in rules)
+
     def widget_id(self):
         """
         Get the unique ID of the widget.
@@ -122,17 +210,38 @@ class Widget:
         Args:
             child_widget (Widget): The child widget instance to add.
         """
-        self._children.append(child_widget)
+        self._children = self._children + (child_widget,)
         child_widget.set_parent(self)
 
+    def set_children(self, children):
+        """
+        Set all child widgets at once, skipping empty entries.
+
+        Args:
+            children (iterable): The child widget instances.
+        """
+        self._children = tuple(child for child in children if child)
+        for child in self._children:
+            child.set_parent(self)
+
+    def _first_child(self):
+        """
+        Returns the first child widget, used as the `child` property of single-child widgets.
+
+        Returns:
+            Widget: The child widget, or None.
+        """
+        children = self._children
+        return children[0] if children else None
+
     def get_children(self):
         """
         Get the list of child widgets.
 
         Returns:
-            list: A list of child widgets.
+            tuple: The child widgets.
         """
-        return self._children 
+        return self._children
 
     def remove_child(self, child_widget):
         """
@@ -141,14 +250,14 @@ class Widget:
         Args:
             child_widget (Widget): The child widget instance to remove.
         """
-        self._children.remove(child_widget)
+        self._children = tuple(child for child in self._children if child is not child_widget)
         child_widget.set_parent(None)
 
     def remove_all_children(self):
         """
         Removes all children from the current widget.
         """
-        self._children.clear() 
+        self._children = ()
 
     
 
@@ -1,12 +1,14 @@
-import yaml
-
 class Config:
     """
     A Singleton class for managing configuration settings loaded from a YAML file.
 
+    The file is read on the first access to a setting, not when the instance is created,
+    so importing modules that hold a Config costs no file access or YAML import.
+
     Attributes:
         _instance (Config): The single instance of the Config class.
         initialized (bool): Indicates if the instance has been initialized.
+        config_file (str): The path of the YAML file.
         config (dict): A dictionary holding the configuration settings.
     """
 
@@ -34,8 +36,19 @@ class Config:
         # Only initialize the instance once
         if not hasattr(self, 'initialized'):
             self.initialized = True  # Mark the instance as initialized
-            with open(config_file, 'r') as file:
-                self.config = yaml.safe_load(file)
+            self.config_file = config_file
+            self._config = None
+
+    @property
+    def config(self):
+        """
+        dict: The configuration settings, loaded from `config_file` on first access.
+        """
+        if self._config is None:
+            import yaml  # Deferred with the file read
+            with open(self.config_file, 'r') as file:
+                self._config = yaml.safe_load(file) or {}
+        return self._config
 
     def get(self, key, default=None):
         """
@@ -50,3 +63,5 @@ class Config:
         """
         return self.config.get(key, default)
 
+
+config = Config()
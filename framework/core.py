@@ -7,16 +7,29 @@ import os
 import inspect
 import sys
 import webview
-from .widgets import *
+from PySide6.QtCore import QTimer
+from .widgets import AssetImage, Icon, Scaffold
 from .api import Api
-from .config import Config
+from .config import Config, config
 from .server import AssetServer
+from .snapshot import StartupSnapshot, state_snapshot
+from .assets import image_pipeline
+from .atomic_css import atomic_styles
+from .icons import IconSubsetter, FONT_AWESOME_CDN
+from .instrumentation import instrumentation, configure_logging, LogSink, JsonLinesSink, OverlaySink
+from .tracing import tracer
+from .diagnostics import diagnostics
 from .base import Widget
 from .state import StatefulWidget
 from .pyx.widget_registry import WidgetRegistry
 from .window import webwidget
 #import webview
 import weakref
+import logging
+import atexit
+import json
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -79,10 +92,10 @@ class Framework:
     update_widget(widget_id, widget):
         Updates the widget in the registry by its widget ID.
 
-    delete_widget(widget_id):
-        Deletes a widget (and its children recursively) from the registry.
+    delete_widget(widget_id, keep=None):
+        Deletes a widget (and its children recursively) from the registry, except the widgets reused in `keep`.
 
-    _delete_widget_children(widget):
+    _delete_widget_children(widget, kept):
         Recursively deletes the children of a widget.
 
     get_size():
@@ -135,6 +148,8 @@ class Framework:
         self.end_drawer = None
         self.bottom_sheet = None
         self.snack_bar = None
+        self._atomic_rules_written = 0  # Atomic rules in the written stylesheet
+        self.replay_harness = None  # Set by ReplayHarness.install()
         self.asset_server = AssetServer(directory='assets', port=config.get('assets_server_port'))
         self.asset_server.start()
         self.id_manager = IDManager()  # Initialize IDManager
@@ -148,10 +163,120 @@ class Framework:
         os.makedirs('web', exist_ok=True)
         self.widgets = []
         self.registry = WidgetRegistry()
+        configure_logging(config.get('log_level', 'WARNING'))
+        atomic_styles.enabled = config.get('style_backend', 'shared') == 'atomic'
+        self._setup_instrumentation()
+        self._setup_image_pipeline()
+        self._setup_state_snapshot()
+
+    def _setup_image_pipeline(self):
+        """
+        Configures the image derivative pipeline from the config and routes finished
+        derivatives to the page.
+        """
+        image_pipeline.configure(
+            assets_dir=config.get('assets_dir', 'assets'),
+            image_format=config.get('image_format', 'webp'),
+            quality=config.get('image_quality', 82),
+            max_workers=config.get('image_workers', 2),
+        )
+        image_pipeline.ready_listener = self._on_image_derivative_ready
+        image_pipeline.info_listener = self._on_image_info_ready
+
+    def _on_image_derivative_ready(self, widget_id, name):
+        """
+        Swaps an image on the page to a derivative that has just been built.
+
+        Called from the pipeline's worker threads; the DOM update runs on the main thread.
+
+        Args:
+            widget_id (str): The ID of the Image widget that requested the derivative.
+            name (str): The derivative path, relative to the assets directory.
+        """
+        src = json.dumps(AssetImage(name).get_source())
+        # Lazy images that have not started loading yet keep their source in data-src
+        script = (
+            f"var img = document.getElementById('{widget_id}');"
+            f"if (img && img.dataset.src) {{ img.dataset.src = {src}; }} else if (img) {{ img.src = {src}; }}"
+        )
+
+        def swap():
+            if self.window:
+                self.window.evaluate_js(self.id, script)
+        webwidget.call_on_main_thread(swap)
+
+    def _on_image_info_ready(self, widget_id, info):
+        """
+        Gives a lazy image its intrinsic size and blurred placeholder once they are computed.
+
+        Called from the pipeline's worker threads; the DOM update runs on the main thread.
+
+        Args:
+            widget_id (str): The ID of the Image widget that requested the info.
+            info (dict): The 'width', 'height' and 'placeholder' of the image.
+        """
+        placeholder = json.dumps(f"url('{info['placeholder']}') center / cover no-repeat")
+        # An image that has already loaded needs neither
+        script = (
+            f"var img = document.getElementById('{widget_id}');"
+            f"if (img && img.dataset.src) {{ img.setAttribute('width', {int(info['width'])});"
+            f"img.setAttribute('height', {int(info['height'])}); img.style.background = {placeholder}; }}"
+        )
+
+        def patch():
+            if self.window:
+                self.window.evaluate_js(self.id, script)
+        webwidget.call_on_main_thread(patch)
+
+    def _setup_state_snapshot(self):
+        """
+        Enables persisted State fields when `state_snapshot` is set in the config.
+
+        The state file is written at exit and every `state_snapshot_interval` seconds (0 only
+        writes it at exit).
+        """
+        self._state_snapshot_timer = None
+        if not config.get('state_snapshot', False):
+            return
+        state_snapshot.enable(config.get('state_file', 'web/state.pickle'))
+        atexit.register(state_snapshot.save)
+        interval = config.get('state_snapshot_interval', 30)
+        if interval:
+            self._state_snapshot_timer = QTimer()
+            self._state_snapshot_timer.timeout.connect(state_snapshot.save)
+            self._state_snapshot_timer.start(int(interval * 1000))
+
+    def _setup_instrumentation(self):
+        """
+        Adds the instrumentation sinks listed under `instrumentation_sinks` in the config.
+
+        Supported sink names are 'log', 'jsonl' (written to `instrumentation_file`) and 'overlay'.
+        Also enables tracing and the diagnostics shortcut when they are turned on in the config.
+        """
+        for name in config.get('instrumentation_sinks') or []:
+            if name == 'log':
+                instrumentation.add_sink(LogSink())
+            elif name == 'jsonl':
+                instrumentation.add_sink(JsonLinesSink(config.get('instrumentation_file', 'web/metrics.jsonl')))
+            elif name == 'overlay':
+                instrumentation.add_sink(OverlaySink(self))
+            else:
+                logger.warning("Unknown instrumentation sink: %s", name)
+
+        if config.get('tracing', False):
+            tracer.enable(self.api)
+            atexit.register(tracer.export, config.get('trace_file', 'web/trace.json'))
+
+        if config.get('diagnostics', False):
+            # Ctrl+Shift+D in the window (see pythraDiagnostics in main.js) dumps a report
+            path = config.get('diagnostics_file', 'web/diagnostics.json')
+            self.api.register_callback('__pythra_diagnostics', lambda: diagnostics.dump(path))
+            if config.get('diagnostics_tracemalloc', False):
+                diagnostics.start_tracing()
         
         
     def default_css(self, drawer_width, end_drawer_width):
-        print(drawer_width,' ||| ', end_drawer_width)
+        logger.debug("Drawer widths: %s ||| %s", drawer_width, end_drawer_width)
         return f"""
 * {{
     box-sizing: border-box;
@@ -170,6 +295,21 @@ body {{
     flex-direction: column;
     height: 100vh;
     position: relative;
+    --pythra-left-width: {drawer_width}px;
+    --pythra-right-width: {end_drawer_width}px;
+    --pythra-content-shift: 0px;
+}}
+
+.body.left-open {{
+    --pythra-content-shift: var(--pythra-left-width);
+}}
+
+.body.right-open {{
+    --pythra-content-shift: calc(-1 * var(--pythra-right-width));
+}}
+
+.body.left-open.right-open {{
+    --pythra-content-shift: calc(var(--pythra-left-width) - var(--pythra-right-width));
 }}
 
 .app-bar {{
@@ -180,7 +320,8 @@ body {{
     align-items: center;
     padding: 0 20px;
     position: relative;
-    transition: margin-left 0.3s, margin-right 0.3s;
+    transform: translateX(var(--pythra-content-shift));
+    transition: transform 0.3s;
 }}
 
 .drawer {{
@@ -219,7 +360,8 @@ body {{
     flex: 1;
     padding: 20px;
     background-color: #f0f0f0;
-    transition: margin-left 0.3s, margin-right 0.3s;
+    transform: translateX(var(--pythra-content-shift));
+    transition: transform 0.3s;
     overflow-y: auto;
 }}
 
@@ -237,9 +379,65 @@ body {{
     transition: transform 0.3s;
 }}
 
-.bottom-nav.hidden {{
+.bottom-nav.hidden,
+.body.left-open .bottom-nav,
+.body.right-open .bottom-nav {{
     transform: translateY(100%);
 }}
+
+.bottom-sheet {{
+    position: fixed;
+    left: 0;
+    bottom: 0;
+    width: 100%;
+    z-index: 900;
+    transform: translateY(100%);
+    transition: transform 0.3s ease;
+}}
+
+.bottom-sheet.open {{
+    transform: none;
+}}
+
+.bottom-sheet-barrier {{
+    position: fixed;
+    inset: 0;
+    z-index: 899;
+    opacity: 0;
+    pointer-events: none;
+    transition: opacity 0.3s;
+}}
+
+.bottom-sheet-barrier.open {{
+    opacity: 1;
+    pointer-events: auto;
+}}
+
+.snack-bar {{
+    position: absolute;
+    bottom: 20px;
+    left: 50%;
+    width: calc(100% - 48px);
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    border-radius: 4px;
+    box-shadow: 0px -2px 10px rgba(0, 0, 0, 0.3);
+    z-index: 999;
+    opacity: 0;
+    visibility: hidden;
+    pointer-events: none;
+    transform: translate(-50%, 20px);
+    transition: opacity 0.2s, transform 0.2s, visibility 0s 0.2s;
+}}
+
+.snack-bar.open {{
+    opacity: 1;
+    visibility: visible;
+    pointer-events: auto;
+    transform: translate(-50%, 0);
+    transition: opacity 0.2s, transform 0.2s;
+}}
         """
         
 
@@ -302,27 +500,48 @@ body {{
         """
         self.registry.update_widget(widget_id, widget)
 
-    def delete_widget(self, widget_id):
+    def delete_widget(self, widget_id, keep=None):
         #self.registry.delete_widget(widget_id)
         """
         Deletes a widget from the registry, including all of its children.
 
+        Widgets that are also part of `keep` (instances reused by the new tree of a rebuild)
+        are left registered and keep their children.
+
         Parameters:
         -----------
         widget_id : str
             The ID of the widget to delete.
+        keep : Widget, optional
+            The tree replacing the widget.
         """
         widget = self.get_widget(widget_id)
         if widget:
+            kept = self._tree_widgets(keep) if keep is not None else set()
+            if id(widget) in kept:
+                return  # Moved into the new tree as a whole
             # Recursively delete all children first
-            self._delete_widget_children(widget)
+            self._delete_widget_children(widget, kept)
             # Now delete the widget itself
             self.registry.delete_widget(widget_id)
             #print(f"Widget {widget_id} and its children deleted.")
         else:
-            print(f"Widget with ID {widget_id} not found.")
-
-    def _delete_widget_children(self, widget):
+            logger.warning("Widget with ID %s not found.", widget_id)
+
+    @staticmethod
+    def _tree_widgets(root):
+        """Returns the ids of the widget objects in a tree."""
+        found = set()
+        pending = [root]
+        while pending:
+            widget = pending.pop()
+            if id(widget) in found:
+                continue
+            found.add(id(widget))
+            pending.extend(widget.get_children() or ())
+        return found
+
+    def _delete_widget_children(self, widget, kept=frozenset()):
         """
         Recursively deletes the children of a widget.
 
@@ -330,10 +549,14 @@ body {{
         -----------
         widget : Widget
             The widget whose children will be deleted.
+        kept : set
+            The ids of widget objects still in use, which are skipped with their subtree.
         """
         children = widget.get_children() if widget.get_children() else []
         for child in children:
-            self._delete_widget_children(child)  # Recursively delete child's children
+            if getattr(child, 'keep_alive', False) or id(child) in kept:
+                continue  # Shared with the new tree (directly or through a keep-alive controller)
+            self._delete_widget_children(child, kept)  # Recursively delete child's children
             self.registry.delete_widget(child.widget_id())  # Delete child from registry
             #print("Child: ", child)
             #print("Widget Id: ",child.widget_id())
@@ -395,14 +618,19 @@ body {{
 
 
     def _recursive_collect_classes(self, widget, active_classes):
-        """Recursively traverses the widget tree and collects css_class attributes."""
+        """Recursively traverses the widget tree and collects css_class attributes.
+
+        Returns the number of widgets visited.
+        """
         if widget is None:
-            return
+            return 0
+        visited = 1
 
         # --- Check for the specific attribute holding the shared class ---
         # Adjust this if different widgets store their class name differently
         if hasattr(widget, 'css_class') and widget.css_class:
-            active_classes.add(widget.css_class)
+            # A class list with the atomic style backend
+            active_classes.update(widget.css_class.split())
         # Example: if Text widget used 'text_css_class':
         # elif hasattr(widget, 'text_css_class') and widget.text_css_class:
         #     active_classes.add(widget.text_css_class)
@@ -410,59 +638,45 @@ body {{
         # --- Recursively check children ---
         if hasattr(widget, 'get_children'): # Standard way from Base Widget
             for child in widget.get_children():
-                self._recursive_collect_classes(child, active_classes)
+                visited += self._recursive_collect_classes(child, active_classes)
         elif hasattr(widget, 'child') and widget.child: # For single child widgets like Container
-            self._recursive_collect_classes(widget.child, active_classes)
+            visited += self._recursive_collect_classes(widget.child, active_classes)
         elif hasattr(widget, 'children') and widget.children: # For multi-child widgets like Column/Row
             for child in widget.children:
-                self._recursive_collect_classes(child, active_classes)
+                visited += self._recursive_collect_classes(child, active_classes)
         # Add checks for other child attributes if necessary (e.g., appBar, drawer)
         if hasattr(widget, 'appBar') and widget.appBar:
-            self._recursive_collect_classes(widget.appBar, active_classes)
+            visited += self._recursive_collect_classes(widget.appBar, active_classes)
         if hasattr(widget, 'drawer') and widget.drawer:
-            self._recursive_collect_classes(widget.drawer, active_classes)
+            visited += self._recursive_collect_classes(widget.drawer, active_classes)
         # ... add other potential widget containers ...
+        return visited
 
 
     def _collect_active_css_classes(self, root_widget):
         """Starts the recursive collection of active CSS classes."""
         active_classes = set()
-        self._recursive_collect_classes(root_widget, active_classes)
-        # print(f"Active CSS classes found: {active_classes}") # Debug
+        nodes = self._recursive_collect_classes(root_widget, active_classes)
+        instrumentation.count('nodes_rendered', nodes)
+        logger.debug("Active CSS classes found: %s", active_classes)
         return active_classes
 
     def _generate_css_for_active_classes(self, active_classes):
-        """Generates CSS rules only for the classes found in the active tree."""
+        """
+        Returns the CSS rules for the classes found in the active tree.
+
+        Rules are formatted once, when a widget class registers a style (see
+        `Widget._intern_style`), so this only looks them up.
+        """
+        rules = Widget.css_rules
         all_css_rules = []
-        widget_classes_with_shared_styles = [Container, Text, Column, IconButton, Icon] # Maintain this list
-
-        # Create reverse lookup dictionaries for efficiency (class_name -> style_key)
-        reverse_lookups = {}
-        for widget_cls in widget_classes_with_shared_styles:
-            if hasattr(widget_cls, 'shared_styles') and isinstance(widget_cls.shared_styles, dict):
-                reverse_lookups[widget_cls] = {v: k for k, v in widget_cls.shared_styles.items()}
-
-        # Generate rules only for active classes
-        for css_class in active_classes:
-            generated = False
-            for widget_cls in widget_classes_with_shared_styles:
-                if widget_cls in reverse_lookups and css_class in reverse_lookups[widget_cls]:
-                    style_key = reverse_lookups[widget_cls][css_class]
-                    rule = None
-                    # Call the appropriate generator based on the class type
-                    if widget_cls == Container:
-                        rule = self._create_container_css_rule(style_key, css_class)
-                    # Add elif for Text, Column etc.
-                    # elif widget_cls == Text:
-                    #     rule = self._create_text_css_rule(style_key, css_class)
-
-                    if rule:
-                        all_css_rules.append(rule)
-                        generated = True
-                        break # Found the generator for this class, move to next active class
-            # if not generated: # Debugging if a class isn't found
-            #    print(f"Warning: No generator found for active CSS class: {css_class}")
 
+        # The atomic sheet grows only with distinct declarations, so it is written whole;
+        # a later update then still finds the rules used outside its subtree.
+        if atomic_styles.enabled:
+            all_css_rules.append(atomic_styles.css())
+
+        all_css_rules.extend(rules[css_class] for css_class in active_classes if css_class in rules)
 
         # --- Handle Instance-Specific Styles ---
         # Instance-specific styles (like Container foreground) CANNOT be cleaned up
@@ -474,73 +688,9 @@ body {{
 
         return "\n".join(all_css_rules)
 
-
     def _get_all_current_shared_css(self):
-        """Collects CSS rules from ALL known shared style dictionaries."""
-        all_css_rules = []
-        # --- Centralized CSS Generation (Simplified) ---
-        # This is where you'd ideally have a more robust way to find
-        # all widget classes with shared styles.
-        widget_classes_with_shared_styles = [Container, Text, Column, IconButton, Icon] # Add others as needed
-
-        for widget_cls in widget_classes_with_shared_styles:
-            if hasattr(widget_cls, 'shared_styles') and isinstance(widget_cls.shared_styles, dict):
-                # Need a way to generate the rule string from the key/class
-                # This requires refactoring the generation logic out of `to_css` methods
-                for style_key, css_class in widget_cls.shared_styles.items():
-                     # Assume a helper method exists per widget type or a general one
-                     # For now, let's reuse the Container example logic if possible
-                    if widget_cls == Container:
-                        rule = self._create_container_css_rule(style_key, css_class)
-                        if rule:
-                            all_css_rules.append(rule)
-                    # Add similar 'elif widget_cls == Text:' etc. using specific helpers
-                    # elif widget_cls == Text:
-                    #     rule = self._create_text_css_rule(style_key, css_class) # Example
-                    #     if rule: all_css_rules.append(rule)
-
-            # Handle instance-specific CSS if needed (like Container's foreground)
-            # This part is tricky with a full file overwrite. Instance-specific
-            # styles might be better handled inline or via dedicated classes added
-            # directly to the element, not in the shared file.
-            # Let's ignore foreground for this file-based approach for simplicity now.
-
-        return "\n".join(all_css_rules)
-
-    # Helper function (as before, needs refinement/expansion for other types)
-    def _create_container_css_rule(self, style_key, css_class):
-        try:
-            # Simplified access - real implementation might need more robust key unpacking
-            padding, color, decoration, width, height, margin, alignment, clipBehavior = style_key
-
-            padding_str = f'padding: {padding.to_css()};' if hasattr(padding, 'to_css') else (f'padding: {padding};' if padding else '')
-            margin_str = f'margin: {margin.to_css()};' if hasattr(margin, 'to_css') else (f'margin: {margin};' if margin else '')
-            width_str = f'width: {width}px;' if width is not None else ''
-            height_str = f'height: {height}px;' if height is not None else ''
-            color_str = f'background-color: {color};' if color else ''
-            decoration_str = decoration.to_css() if hasattr(decoration, 'to_css') else ''
-            clip_str = f'overflow: hidden;' if clipBehavior else '' # Assuming bool or similar
-            alignment_str = alignment.to_css() if hasattr(alignment, 'to_css') else ''
-
-            rule = f"""
-            .{css_class} {{
-                position: relative;
-                {padding_str}
-                {margin_str}
-                {width_str}
-                {height_str}
-                {color_str}
-                {decoration_str}
-                {alignment_str}
-                {clip_str}
-                box-sizing: border-box;
-            }}
-            """
-            return rule
-        except Exception as e:
-            # Log the error properly in a real app
-            print(f"Error generating CSS for {css_class} with key {style_key}: {e}")
-            return ""
+        """Returns the rules of every shared style registered so far."""
+        return "\n".join(Widget.css_rules.values())
 
 
     def run(self, title):
@@ -548,6 +698,15 @@ body {{
         Starts the framework and launches the webview window with the root widget. This method generates the HTML and 
         CSS content for the root widget.
 
+        When `startup_snapshot` is enabled in the config, the first rendered page is stored on disk keyed by a hash
+        of the app's source and config. Later launches write that page straight away and build the Python widget
+        tree once the window is up. That first render is compared with the snapshot: when they differ, for
+        example because `state_snapshot` restored State fields changed since, the page is replaced and the
+        snapshot is stored again, so the next launch with the same state shows the right page straight away.
+
+        With a `ReplayHarness` installed, its events are replayed: headless harnesses render the root widget and
+        return without opening a window.
+
         Args:
             title (str): The title to display in the browser tab.
         
@@ -556,87 +715,281 @@ body {{
         """
         if not self.root_widget:
             raise ValueError("Root widget not set. Use set_root() to define the root widget.")
+
+        harness = self.replay_harness
+        if harness is not None and harness.headless:
+            self._render_initial_page()
+            self.window = harness.window
+            harness.run_headless()
+            return
+
+        snapshot = None
+        cached = None
+        if config.get('startup_snapshot', False):
+            snapshot = StartupSnapshot(snapshot_dir=config.get('snapshot_dir', 'web/snapshots'))
+            cached = snapshot.load()
+
+        if cached:
+            html_content, css_content = cached['html'], cached['css']
+            logger.info("Loaded startup snapshot %s", snapshot.key())
+        else:
+            html_content, css_content = self._render_initial_page()
+            if snapshot:
+                snapshot.save(html_content, css_content)
+
+        html_file = self._write_initial_page(title, html_content, css_content)
+
+        self.window = webwidget.create_window(title, self.id, html_file=html_file, js_api=self.api, width=800, height=600,)
+        self._setup_window_pool(title)
+        if harness is not None:
+            harness.start_in_window()
+        #print("Debug:", 'True' )
+
+        if cached:
+            # The page is already on screen; build the widget tree (IDs and callbacks)
+            # as soon as the event loop starts instead of before the window opens.
+            QTimer.singleShot(0, lambda: self._hydrate(cached['html'], snapshot))
         
-        html_content = self.root_widget.to_html()
-        print("ROOT DRAWERWIDTH: ",self.root_widget.drawer.width)
+        webwidget.start(window=self.window, debug=bool(config.get("Debug")))
+
+    def _render_initial_page(self):
+        """
+        Builds the root widget tree and renders the first page.
+
+        Returns:
+            tuple: The HTML of the root widget and the CSS content to write for it.
+        """
+        with instrumentation.timer('to_html', widget_id=self.root_widget.widget_id()):
+            html_content = self.root_widget.to_html()
+        logger.debug("Root drawer width: %s", self.root_widget.drawer.width)
         # --- Initial Generation ---
-        active_classes = self._collect_active_css_classes(self.root_widget)
-        css_content = self._generate_css_for_active_classes(active_classes)
+        with instrumentation.timer('css'):
+            active_classes = self._collect_active_css_classes(self.root_widget)
+            css_content = self._generate_css_for_active_classes(active_classes)
+            self._atomic_rules_written = len(atomic_styles)
         #print('From core.py in Framework.run() {HTML From First Run:',html_content, '}')
-        html_file = os.path.abspath('web/index.html')
-        css_file = self.css_file_path # Use the stored path
 
+        if self.frameless:
+            css_content = f"""
+                    {self.default_css(self.root_widget.drawer.width, self.root_widget.endDrawer.width)}
+                    {css_content}
+                    """
+        return html_content, css_content
 
-        if not self.frameless:
-            with open(html_file, 'w') as f:
-                f.write(f"""
+    def _hydrate(self, snapshot_html=None, snapshot=None):
+        """
+        Builds the Python widget tree behind a page that was loaded from a startup snapshot.
+
+        Rendering registers the widgets and their callbacks. It is the first render of the
+        process, like the one the snapshot was taken from, so the resulting HTML is discarded
+        when it matches the snapshot. Otherwise (restored State fields changed since the
+        snapshot was taken) the page is replaced by it and the snapshot is stored again.
+
+        Args:
+            snapshot_html (str, optional): The HTML of the snapshot on screen.
+            snapshot (StartupSnapshot, optional): The store the snapshot was loaded from.
+        """
+        html_content, css_content = self._render_initial_page()
+        logger.info("Widget tree hydrated from startup snapshot")
+        if snapshot_html is None or html_content == snapshot_html:
+            return
+        if snapshot:
+            snapshot.save(html_content, css_content)
+        if not self.window:
+            return
+        try:
+            with open(self.css_file_path, 'w') as c:
+                c.write(css_content)
+        except IOError as e:
+            logger.error("Error updating CSS file: %s", e)
+        self.css_version = int(time.time())
+        self.window.evaluate_js(self.id, (
+            f"var link = document.getElementById('main-stylesheet');"
+            f"if (link) link.href = 'styles.css?v={self.css_version}';"
+            f"document.body.innerHTML = {json.dumps(html_content)};"
+        ))
+
+    def _icon_styles(self):
+        """
+        Returns the `<head>` markup that provides the icon font.
+
+        When `icon_subset` is enabled and the Font Awesome files exist under `font_dir` (they
+        ship in `fonts/font-awesome`), a font holding only the icons used by the app is written
+        to `web/fonts` and its CSS is inlined; the rules and glyphs of the other icons are
+        served locally as a fallback. Otherwise the Font Awesome stylesheet is linked from the CDN.
+
+        Returns:
+            str: A `<style>` or `<link>` element.
+        """
+        if config.get('icon_subset', True):
+            font_dir = config.get('font_dir', 'fonts')
+            subsetter = IconSubsetter(
+                css_file=os.path.join(font_dir, config.get('icon_font_css', 'font-awesome/css/font-awesome.css')),
+                font_file=os.path.join(font_dir, config.get('icon_font_file', 'font-awesome/fonts/fontawesome-webfont.ttf')),
+            )
+            icon_css = subsetter.build(Icon.used_names)
+            if icon_css is not None:
+                # Icons first shown later (names only known at run time) find their rule here
+                fallback = (
+                    f'<link rel="stylesheet" href="{subsetter.fallback_css_url}" media="print" onload="this.media=\'all\'">'
+                )
+                return f"<style id=\"pythra-icons\">\n{icon_css}\n</style>\n{fallback}"
+        return f'<link rel="stylesheet" href="{FONT_AWESOME_CDN}">'
+
+    def _page_html(self, title, html_content):
+        """
+        Returns a complete page loading the stylesheet, icon font and runtime scripts.
+
+        Args:
+            title (str): The title to display in the browser tab.
+            html_content (str): The body of the page.
+
+        Returns:
+            str: The page HTML.
+        """
+        head_scripts = '\n<script>window.pythraTracing = true;</script>' if tracer.enabled else ''
+        icon_styles = self._icon_styles()
+        if self.frameless:
+            stylesheet = f'<link id="main-stylesheet" type="text/css" rel="stylesheet" href="styles.css?v={self.css_version}">'
+        else:
+            stylesheet = '<link type="text/css" rel="stylesheet" href="styles.css">'
+        return f"""
                 <!DOCTYPE html>
                 <html>
                 <head>
                     <title>{title}</title>
-                    <link type="text/css" rel="stylesheet" href="styles.css">
-                    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.7.0/css/font-awesome.min.css">      
+                    {stylesheet}
+                    {icon_styles}
                     <script src="qwebchannel.js"></script>
-                    <script src="main.js"></script>
+                    <script src="main.js"></script>{head_scripts}
                     <script type="text/javascript" src="qrc:///qtwebchannel/qwebchannel.js"></script>
                 </head>
                 <body>
                         {html_content}
                 </body>
                 </html>
-                """)
+                """
+
+    def _write_initial_page(self, title, html_content, css_content):
+        """
+        Writes the initial `index.html` and `styles.css` files.
+
+        Args:
+            title (str): The title to display in the browser tab.
+            html_content (str): The rendered HTML of the root widget.
+            css_content (str): The CSS content to write.
 
-            f.close()
+        Returns:
+            str: The absolute path of the written HTML file.
+        """
+        html_file = os.path.abspath('web/index.html')
+        css_file = self.css_file_path # Use the stored path
+
+        if not self.frameless:
+            with open(html_file, 'w') as f:
+                f.write(self._page_html(title, html_content))
 
             with open(css_file, 'a') as c:
                 c.write(css_content)
-                print(f"Initial styles written to {css_file}")
-            c.close()
+                logger.info("Initial styles written to %s", css_file)
 
         else:
             # Write initial CSS file
             try:
                 with open(css_file, 'w') as c:
-                    c.write(f"""
-                    {self.default_css(self.root_widget.drawer.width, self.root_widget.endDrawer.width)}
-                    {css_content}
-                    """)
-                print(f"Initial styles written to {css_file}")
+                    c.write(css_content)
+                logger.info("Initial styles written to %s", css_file)
             except IOError as e:
-                print(f"Error writing initial CSS file: {e}")
+                logger.error("Error writing initial CSS file: %s", e)
                 # Decide how to handle this - maybe raise exception?
 
             # Write initial HTML file, including the versioned CSS link
             try:
                 with open(html_file, 'w') as f:
-                    f.write(f"""
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <title>{title}</title>
-                        <link id="main-stylesheet" type="text/css" rel="stylesheet" href="styles.css?v={self.css_version}">
-                        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.7.0/css/font-awesome.min.css">
-                        <script src="qwebchannel.js"></script>
-                        <script src="main.js"></script>
-                        <script type="text/javascript" src="qrc:///qtwebchannel/qwebchannel.js"></script>
-                    </head>
-                    <body>
-                            {html_content}
-                    </body>
-                    </html>
-                    """)
-                print(f"Initial HTML written to {html_file}")
+                    f.write(self._page_html(title, html_content))
+                logger.info("Initial HTML written to %s", html_file)
             except IOError as e:
-                print(f"Error writing initial HTML file: {e}")
+                logger.error("Error writing initial HTML file: %s", e)
                 # Handle error
 
-            
+        return html_file
+
+    def _setup_window_pool(self, title):
+        """
+        Writes the shell page of secondary windows and lets the window manager keep
+        `window_pool_size` of them warm (see `open_window`).
+
+        Args:
+            title (str): The default title of secondary windows.
+        """
+        size = config.get('window_pool_size', 1)
+        shell_file = os.path.abspath('web/window.html')
+        shell_html = self._page_html(title, '')
+        try:
+            with open(shell_file, 'w') as f:
+                f.write(shell_html)
+            shell_html = None  # Loaded from the file
+        except IOError as e:
+            logger.error("Error writing window shell page, loading it from memory: %s", e)
+        webwidget.window_manager.configure_pool(
+            shell_file, js_api=self.api, size=size,
+            idle_timeout=config.get('window_pool_idle_timeout', 120), html=shell_html,
+        )
+
+    def open_window(self, widget, title='', window_id=None, width=800, height=600):
+        """
+        Shows a widget in a secondary window, such as a detail view or a popout.
+
+        The window comes from the pre-warmed pool when one is available, so only the rendered
+        widget and its styles are sent to an already loaded page. Callbacks of the widget
+        work as in the main window.
+
+        Args:
+            widget (Widget): The widget to show.
+            title (str): The window title.
+            window_id (str, optional): The window ID. Defaults to the widget's ID; opening the
+                same ID again replaces the window's content.
+            width (int): The window width. Defaults to 800.
+            height (int): The window height. Defaults to 600.
+
+        Returns:
+            str: The window ID, to use with `evaluate_js` and `close_window`.
+        """
+        window_id = window_id or f"window-{widget.widget_id()}"
+        html_content = self.render_with_styles(widget)
+        with instrumentation.timer('open_window', window_id=window_id):
+            webwidget.window_manager.acquire(window_id, title, html_content, width=width, height=height)
+        return window_id
+
+    def render_with_styles(self, widget):
+        """
+        Renders a widget for insertion into a page, preceded by a `<style>` element with the
+        rules of its shared classes, so it displays correctly without rewriting the stylesheet.
+
+        Args:
+            widget (Widget): The widget to render.
+
+        Returns:
+            str: The widget's HTML.
+        """
+        with instrumentation.timer('to_html', widget_id=widget.widget_id()):
+            html_content = widget.to_html()
+        css_content = self._generate_css_for_active_classes(self._collect_active_css_classes(widget))
+        if css_content.strip():
+            html_content = f"<style>{css_content}</style>{html_content}"
+        return html_content
+
+    def close_window(self, window_id):
+        """
+        Closes a secondary window opened with `open_window`, returning it to the pool.
+
+        Args:
+            window_id (str): The window ID returned by `open_window`.
+        """
+        window = webwidget.window_manager.windows.get(window_id)
+        if window and window_id != self.id:
+            window.close()
 
-        self.window = webwidget.create_window(title, self.id, html_file=html_file, js_api=self.api, width=800, height=600,)
-        #print("Debug:", 'True' )
-        
-        webwidget.start(window=self.window, debug=bool(config.get("Debug")))
-        
     def body_margin(self):
         """
         Adjusts the margin of the body element to hide/show the side drawer based on its state.
@@ -651,96 +1004,45 @@ body {{
         Toggles the state of the side drawer (open/close).
         """
         if self.drawer:
-            self.drawer().toggle_true()
-            print(self.drawer.is_open)
-            #is_open = self.drawer.toggle()
-            """drawer_width = self.drawer.width + self.drawer.padding.to_int_horizontal() + self.drawer.borderRight.to_int()
-            drawer_transform = 'translateX(0)' if is_open else f'translateX(-{drawer_width}px)'
-            body_width = f'calc(100% - {drawer_width}px)' if is_open else '100%'
-            margin_left = '' if is_open else f'-{drawer_width}px' 
-            end_drawer_width = self.end_drawer.width + self.end_drawer.padding.to_int_horizontal() + self.end_drawer.borderLeft.to_int()
-            margin_right = '0px' if self.end_drawer.is_open else f'-{end_drawer_width}px'            
-            script_1 = f'document.getElementById("drawer").style.transform = "{drawer_transform}";'
-            script_2 = f'document.getElementById("body").style.width = "{body_width}";'
-            script_3 = f'document.getElementById("body").style.marginLeft = "{margin_left}";'
-            script1_4 = f'document.getElementById("body").style.marginRight = "{margin_right}";'
-            self.window.evaluate_js(script_1 + script_2 + script_3 + script1_4)
-            
-            #script1_2 = f'document.getElementById("body").style.paddingLeft = "{scaffold_position}";'
-            """
+            self.drawer.toggle(not self.drawer.is_open)
+            logger.debug("Drawer open: %s", self.drawer.is_open)
+
     def toggle_end_drawer(self):
         """
         Toggles the state of the end drawer (open/close).
         """
         if self.end_drawer:
-            is_open = self.end_drawer.toggle()
-            end_drawer_width = self.end_drawer.width + self.end_drawer.padding.to_int_horizontal() + self.end_drawer.borderLeft.to_int()
-            drawer_transform = 'translateX(0)' if is_open else f'translateX({end_drawer_width}px)'
-            body_width = f'calc(100% - {end_drawer_width}px)' if is_open else '100%'
-            margin_left = f'-{end_drawer_width}px' if is_open else f'-{end_drawer_width}px'
-            if self.drawer.is_open:
-                margin_left = '0px'
-            else:
-                drawer_width = self.drawer.width + self.drawer.padding.to_int_horizontal() + self.drawer.borderRight.to_int()
-                margin_left = f'-{drawer_width}px'
-            margin_right = '0px' if is_open else f'-{end_drawer_width}px'
-            script_1 = f'document.getElementById("endDrawer").style.transform = "{drawer_transform}";'
-            script_2 = f'document.getElementById("body").style.width = "{body_width}";'
-            script_3 = f'document.getElementById("body").style.marginRight = "{margin_right}";'
-            script_4 = f'document.getElementById("body").style.marginLeft = "{margin_left}"'
-            
-            self.window.evaluate_js(self.id, script_1 + script_2 + script_3 + script_4)
+            self.end_drawer.toggle(not self.end_drawer.is_open)
+            logger.debug("End drawer open: %s", self.end_drawer.is_open)
 
     def show_bottom_sheet(self):
         """
         Displays the bottom sheet widget.
         """
         if self.bottom_sheet:
-            self.bottom_sheet.is_open = True
-            script = 'document.getElementById("bottomSheet").style.transform = "translateY(0)";'
-            self.window.evaluate_js(self.id, script)
+            self.bottom_sheet.toggle(True)
 
     def hide_bottom_sheet(self):
         """
         Hides the bottom sheet widget.
         """
         if self.bottom_sheet:
-            self.bottom_sheet.is_open = False
-            script = f'document.getElementById("bottomSheet").style.transform = "translateY(100%)";'
-            self.window.evaluate_js(self.id, script)
-
+            self.bottom_sheet.toggle(False)
 
     def show_snack_bar(self):
         """
-        Displays the snack bar widget with a message. The snack bar is auto-hidden after a delay.
-        """
-        if self.snack_bar:
-            self.snack_bar.is_visible = True
-            script = 'document.getElementById("snackBar").style.display = "flex";'
-            self.window.evaluate_js(self.id, script)
-            # Start a thread to hide the SnackBar after the specified duration
-            threading.Thread(target=self._auto_hide_snack_bar, daemon=True).start()
-
-    def _auto_hide_snack_bar(self):
-        """
-        Helper function that waits for the snack bar's duration and hides it automatically.
+        Displays the snack bar widget. The page hides it again after the snack bar's duration.
         """
         if self.snack_bar:
-            time.sleep(self.snack_bar.duration / 1000)
-            self.hide_snack_bar()
+            self.snack_bar.toggle(True)
 
     def hide_snack_bar(self, widget_id=''):
         """
         Hides the snack bar widget.
         """
-        
         if self.root_widget.snackBar:
-            
-            #self.root_widget.snackBar.is_open = False
-            script = f"""document.getElementById('{widget_id}').style.display = 'none';"""
-            
-            self.window.evaluate_js(self.id, script)
-    
+            self.root_widget.snackBar.toggle(False)
+
 
 
     def update_content(self):
@@ -749,9 +1051,11 @@ body {{
         """
         
         if self.window:
-            html_content = self.root_widget.to_html()
+            with instrumentation.timer('to_html', widget_id=self.root_widget.widget_id()):
+                html_content = self.root_widget.to_html()
             script = f'document.body.innerHTML = `{html_content}`;'
-            self.window.evaluate_js(self.id, script)
+            with instrumentation.timer('evaluate_js', bytes_sent=len(script)):
+                self.window.evaluate_js(self.id, script)
 
     def update_widget_dub(self, widget_id, html_content):
         """
@@ -789,9 +1093,10 @@ body {{
                                 console.log("Element with ID {widget_id} not found.");
                             }}
                             '''
-                self.window.evaluate_js(self.id, script)
+                with instrumentation.timer('evaluate_js', widget_id=widget_id, bytes_sent=len(script)):
+                    self.window.evaluate_js(self.id, script)
             else:
-                print('Widget With ID: {widget_id} Not In Registry')
+                logger.warning("Widget With ID: %s Not In Registry", widget_id)
 
 
     # Rename update_widget_and_css for clarity
@@ -801,56 +1106,76 @@ body {{
         triggers browser reload, and updates HTML.
         """
         if not self.window:
-            print(f"Window not available for update {widget_id_to_replace}")
+            logger.warning("Window not available for update %s", widget_id_to_replace)
             return
 
-        # --- 1. Scan New Tree and Generate Filtered CSS ---
-        active_classes = self._collect_active_css_classes(new_widget_tree)
-        filtered_css_content = self._generate_css_for_active_classes(active_classes)
-
-        # --- 2. Overwrite CSS File ---
-        try:
-            with open(self.css_file_path, 'w') as c:
-                c.write(f"""
-                    {self.default_css(self.root_widget.drawer.width, self.root_widget.endDrawer.width)}
-                    {filtered_css_content}
-                    """)
-            # print(f"CSS file updated with active styles: {self.css_file_path}") # Debug
-        except IOError as e:
-            print(f"Error updating CSS file: {e}")
-            # Handle error
-
-        # --- 3. Increment CSS Version for Cache Busting ---
-        self.css_version = int(time.time())
-
-        # --- 4. Generate HTML for the new tree ---
-        # NOTE: Ensure to_html() is called on the NEW tree passed in
-        new_html_content = new_widget_tree.to_html()
-        print("New html Content: ", new_html_content)
-
-        # --- 5. Prepare and Execute JavaScript (Cache Bust + HTML Update) ---
-        escaped_html = new_html_content.replace('\\', '\\\\').replace('`', '\\`')
-        new_css_href = f"styles.css?v={self.css_version}"
-        print("Escaped html Content: ", escaped_html)
-        print("Widget to replace: ", widget_id_to_replace)
-
-        script = f'''
-            // Update CSS Link
-            var linkElement = document.getElementById('main-stylesheet');
-            if (linkElement) {{
-                linkElement.href = '{new_css_href}';
-            }} else {{
-                console.warn('Stylesheet link element "main-stylesheet" not found.');
-            }}
-
-            // Update HTML Element
-            var elementToUpdate = document.getElementById("{widget_id_to_replace}");
-            if (elementToUpdate) {{
-                console.log(`{escaped_html}`);
-                elementToUpdate.outerHTML = `{escaped_html}`;
-            }} else {{
-                // This might happen if the ID itself changed AND the old element was removed by parent update
-                console.warn("Element with ID {widget_id_to_replace} not found for HTML update.");
-            }}
-        '''
-        self.window.evaluate_js(self.id, script)
\ No newline at end of file
+        with instrumentation.update(widget_id_to_replace, widget_id=widget_id_to_replace):
+            # --- 1. Scan New Tree and Generate Filtered CSS ---
+            with instrumentation.timer('css'):
+                active_classes = self._collect_active_css_classes(new_widget_tree)
+                # With the atomic backend the stylesheet only changes when new declarations appear
+                css_changed = not atomic_styles.enabled or len(atomic_styles) != self._atomic_rules_written
+                if css_changed:
+                    filtered_css_content = self._generate_css_for_active_classes(active_classes)
+
+            if css_changed:
+                # --- 2. Overwrite CSS File ---
+                try:
+                    with instrumentation.timer('css_write'):
+                        with open(self.css_file_path, 'w') as c:
+                            c.write(f"""
+                                {self.default_css(self.root_widget.drawer.width, self.root_widget.endDrawer.width)}
+                                {filtered_css_content}
+                                """)
+                    self._atomic_rules_written = len(atomic_styles)
+                    logger.debug("CSS file updated with active styles: %s", self.css_file_path)
+                except IOError as e:
+                    logger.error("Error updating CSS file: %s", e)
+                    # Handle error
+
+                # --- 3. Increment CSS Version for Cache Busting ---
+                self.css_version = int(time.time())
+            else:
+                instrumentation.count('css_skipped')
+
+            # --- 4. Generate HTML for the new tree ---
+            # NOTE: Ensure to_html() is called on the NEW tree passed in
+            with instrumentation.timer('to_html'):
+                new_html_content = new_widget_tree.to_html()
+            logger.debug("New html Content: %s", new_html_content)
+
+            # --- 5. Prepare and Execute JavaScript (Cache Bust + HTML Update) ---
+            escaped_html = new_html_content.replace('\\', '\\\\').replace('`', '\\`')
+            new_css_href = f"styles.css?v={self.css_version}"
+            logger.debug("Widget to replace: %s", widget_id_to_replace)
+
+            css_link_script = f'''
+                // Update CSS Link
+                var linkElement = document.getElementById('main-stylesheet');
+                if (linkElement) {{
+                    linkElement.href = '{new_css_href}';
+                }} else {{
+                    console.warn('Stylesheet link element "main-stylesheet" not found.');
+                }}
+            ''' if css_changed else ''
+
+            script = f'''
+                {css_link_script}
+
+                // Update HTML Element
+                var elementToUpdate = document.getElementById("{widget_id_to_replace}");
+                if (elementToUpdate) {{
+                    var patchStart = performance.now();
+                    // Text typed into fields but not yet synced survives the patch
+                    var restoreFields = typeof pythraTextFields !== 'undefined' ? pythraTextFields.preserve(elementToUpdate) : null;
+                    elementToUpdate.outerHTML = `{escaped_html}`;
+                    if (restoreFields) restoreFields();
+                    if (window.pythraTracing) pythraTrace.patchApplied("{widget_id_to_replace}", patchStart);
+                }} else {{
+                    // This might happen if the ID itself changed AND the old element was removed by parent update
+                    console.warn("Element with ID {widget_id_to_replace} not found for HTML update.");
+                }}
+            '''
+            instrumentation.count('bytes_sent', len(script.encode('utf-8')))
+            with instrumentation.timer('evaluate_js'):
+                self.window.evaluate_js(self.id, script)
@@ -0,0 +1,222 @@
+# framework/diagnostics.py
+import gc
+import json
+import logging
+import os
+import time
+import tracemalloc
+from collections import Counter
+
+from .base import Widget
+
+logger = logging.getLogger(__name__)
+
+
+class Diagnostics:
+    """
+    A singleton reporting what a long-running session keeps alive.
+
+    A report lists the live widget objects per class (everything the garbage collector can
+    still reach, mounted or not), the registered widgets per class, the number of shared
+    styles interned by each widget class, the size of the callback table and, while
+    allocation tracing is on, the memory allocated between the last two `setState` cycles.
+
+    Comparing the live and registered counts shows widgets that left the registry but are
+    still referenced; a style or callback count that keeps growing across identical
+    interactions points at keys that are never reused.
+
+    Attributes:
+        tracing (bool): Whether a tracemalloc snapshot is taken after every `setState`.
+        frames (int): The number of stack frames stored per traced allocation.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the singleton instance of the Diagnostics class.
+
+        Returns:
+            Diagnostics: The singleton instance.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.tracing = False
+        self.frames = 1
+        self._snapshots = []  # The snapshots taken after the last two setState cycles
+
+    def _framework(self):
+        return Widget._framework_ref() if Widget._framework_ref else None
+
+    def start_tracing(self, frames=1):
+        """
+        Starts tracemalloc and takes a snapshot after every `setState` from now on.
+
+        Tracing slows allocations down noticeably; enable it only while investigating.
+
+        Args:
+            frames (int): The number of stack frames stored per allocation. Defaults to 1.
+        """
+        self.frames = frames
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self._snapshots = []
+        self.tracing = True
+
+    def stop_tracing(self):
+        """
+        Stops taking snapshots and stops tracemalloc.
+        """
+        self.tracing = False
+        self._snapshots = []
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def record_set_state(self):
+        """
+        Takes a snapshot at the end of a `setState` cycle. Called by `State.setState`.
+        """
+        if not self.tracing:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        self._snapshots = self._snapshots[-1:] + [snapshot]
+
+    def live_widgets(self):
+        """
+        Counts the widget objects still reachable by the garbage collector, per class.
+
+        Returns:
+            dict: Class name -> count, largest first.
+        """
+        counts = Counter(type(obj).__name__ for obj in gc.get_objects() if isinstance(obj, Widget))
+        return dict(counts.most_common())
+
+    def registered_widgets(self):
+        """
+        Counts the widgets in the framework's registry, per class.
+
+        Returns:
+            dict: Class name -> count, largest first.
+        """
+        framework = self._framework()
+        if framework is None:
+            return {}
+        counts = Counter(type(widget).__name__ for widget in framework.get_all_widgets().values())
+        return dict(counts.most_common())
+
+    def shared_styles(self):
+        """
+        Counts the style keys interned in each widget class's `shared_styles`.
+
+        Returns:
+            dict: Class name -> number of shared styles, largest first. Classes without
+                any are left out.
+        """
+        counts = {}
+        pending = [Widget]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            styles = cls.__dict__.get('shared_styles')
+            if styles:
+                counts[cls.__name__] = counts.get(cls.__name__, 0) + len(styles)
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+    def callback_count(self):
+        """
+        Returns the number of callbacks registered with the web channel API.
+
+        Returns:
+            int: The size of the callback table.
+        """
+        framework = self._framework()
+        api = getattr(framework, 'api', None)
+        return len(getattr(api, 'callbacks', ()))
+
+    def set_state_diff(self, limit=10):
+        """
+        Compares the allocations after the last two `setState` cycles.
+
+        Args:
+            limit (int): The number of source lines reported. Defaults to 10.
+
+        Returns:
+            dict or None: The total growth in bytes and the lines that grew the most, or None
+                unless tracing is on and two cycles have been recorded.
+        """
+        if len(self._snapshots) < 2:
+            return None
+        stats = self._snapshots[1].compare_to(self._snapshots[0], 'lineno')
+        return {
+            'size_diff': sum(stat.size_diff for stat in stats),
+            'count_diff': sum(stat.count_diff for stat in stats),
+            'top': [
+                {
+                    'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    'size_diff': stat.size_diff,
+                    'count_diff': stat.count_diff,
+                }
+                for stat in stats[:limit]
+            ],
+        }
+
+    def report(self, limit=10):
+        """
+        Collects a diagnostics report.
+
+        Args:
+            limit (int): The number of source lines in the allocation diff. Defaults to 10.
+
+        Returns:
+            dict: The report, serialisable as JSON.
+        """
+        framework = self._framework()
+        live = self.live_widgets()
+        styles = self.shared_styles()
+        return {
+            'time': time.time(),
+            'registry_size': framework.get_size() if framework is not None else 0,
+            'live_widgets': sum(live.values()),
+            'live_widgets_by_class': live,
+            'registered_widgets_by_class': self.registered_widgets(),
+            'shared_styles': sum(styles.values()),
+            'shared_styles_by_class': styles,
+            'callbacks': self.callback_count(),
+            'set_state_diff': self.set_state_diff(limit),
+        }
+
+    def dump(self, path=None, limit=10):
+        """
+        Logs a report and optionally writes it as JSON.
+
+        Args:
+            path (str, optional): The file to write the report to.
+            limit (int): The number of source lines in the allocation diff. Defaults to 10.
+
+        Returns:
+            dict: The report.
+        """
+        report = self.report(limit)
+        logger.info(
+            "Diagnostics: %d registered, %d live widgets, %d shared styles, %d callbacks",
+            report['registry_size'], report['live_widgets'], report['shared_styles'], report['callbacks'],
+        )
+        diff = report['set_state_diff']
+        if diff is not None:
+            logger.info("Diagnostics: last setState cycle allocated %+d bytes", diff['size_diff'])
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+        return report
+
+
+diagnostics = Diagnostics.instance()
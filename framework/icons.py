@@ -0,0 +1,251 @@
+# framework/icons.py
+import hashlib
+import os
+import re
+import sys
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:  # Optional: without fontTools the full local font is served
+    font_subset = None
+
+FONT_AWESOME_CDN = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.7.0/css/font-awesome.min.css"
+
+# Matches Icon("name"), Icon(icon_name="name") and Icon(icon_name='name', ...)
+_ICON_CALL = re.compile(r"""\bIcon\(\s*(?:icon_name\s*=\s*)?['"]([\w-]+)['"]""")
+# Matches one rule of the Font Awesome stylesheet, e.g. `.fa-home:before { content: "\f015"; }`
+_ICON_RULE = re.compile(r"""((?:\.fa-[\w-]+:before,?\s*)+)\{\s*content:\s*["']\\([0-9a-fA-F]+)["'];?\s*\}""")
+_ICON_SELECTOR = re.compile(r"\.fa-([\w-]+):before")
+
+# Directories never scanned for icon names
+_SKIPPED_DIRS = {'__pycache__', 'venv', 'env', 'site-packages', 'node_modules', 'build', 'dist', 'web'}
+
+_BASE_CSS = (
+    ".fa {{ display: inline-block; font: normal normal normal 14px/1 {family}; font-size: inherit; "
+    "text-rendering: auto; -webkit-font-smoothing: antialiased; -moz-osx-font-smoothing: grayscale; }}"
+)
+
+
+def parse_codepoints(css_text):
+    """
+    Reads the icon name to codepoint mapping from a Font Awesome stylesheet.
+
+    Args:
+        css_text (str): The contents of `font-awesome.css`.
+
+    Returns:
+        dict: Icon names (without the 'fa-' prefix) mapped to integer codepoints.
+    """
+    codepoints = {}
+    for selectors, codepoint in _ICON_RULE.findall(css_text):
+        for name in _ICON_SELECTOR.findall(selectors):
+            codepoints[name] = int(codepoint, 16)
+    return codepoints
+
+
+class IconSubsetter:
+    """
+    Builds a local icon font that contains only the icons used by the application.
+
+    Icon names are collected from `Icon(...)` calls in the application's source files and
+    from the Icon widgets rendered so far. The glyphs for those names are cut out of the
+    local Font Awesome font (with fontTools, when installed) and written to the web
+    directory, and the matching CSS is returned so it can be inlined in `index.html`.
+    Icons then render offline and without waiting for the CDN.
+
+    The full font is served too, as a fallback face limited by `unicode-range`: icons whose
+    names are only known at run time still render, and the browser downloads the full font
+    only once such an icon is shown.
+
+    Attributes:
+        css_file (str): Path of the local `font-awesome.css`.
+        font_file (str): Path of the local Font Awesome TTF font.
+        output_dir (str): Directory, inside the web root, for the generated font.
+        family (str): The font family name used in the generated CSS.
+        fallback_css_url (str): After `build()`, the URL (relative to the web root) of the
+            stylesheet with the rules of the icons that are not inlined.
+    """
+
+    def __init__(self, css_file, font_file, output_dir='web/fonts', family='PythraIcons'):
+        """
+        Initializes the subsetter.
+
+        Args:
+            css_file (str): Path of the local `font-awesome.css`.
+            font_file (str): Path of the local Font Awesome TTF font.
+            output_dir (str): Directory for the generated font. Defaults to 'web/fonts'.
+            family (str): The font family name. Defaults to 'PythraIcons'.
+        """
+        self.css_file = css_file
+        self.font_file = font_file
+        self.output_dir = output_dir
+        self.family = family
+        self.fallback_css_url = None
+
+    def available(self):
+        """
+        Checks whether the local stylesheet and font exist.
+
+        Returns:
+            bool: True if both files are present.
+        """
+        return os.path.exists(self.css_file) and os.path.exists(self.font_file)
+
+    def scan_sources(self):
+        """
+        Collects icon names from `Icon(...)` calls in the application's source files.
+
+        Every `.py` file under the current working directory is read, whether or not it has
+        been imported yet, so pages built later (lazy routes, drawers) are covered. Hidden
+        directories, virtual environments and installed packages are skipped.
+
+        Returns:
+            set: The icon names found.
+        """
+        names = set()
+        for directory, subdirectories, files in os.walk(os.path.abspath(os.getcwd())):
+            subdirectories[:] = [
+                name for name in subdirectories
+                if not name.startswith('.') and name not in _SKIPPED_DIRS
+            ]
+            for name in files:
+                if not name.endswith('.py'):
+                    continue
+                try:
+                    with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                        names.update(_ICON_CALL.findall(f.read()))
+                except (IOError, UnicodeDecodeError):
+                    continue
+        return names
+
+    def build(self, icon_names=()):
+        """
+        Writes the subsetted font and returns the CSS for the used icons.
+
+        Args:
+            icon_names (iterable): Names of icons known to be used, in addition to the
+                names found by `scan_sources()`.
+
+        Returns:
+            str or None: The CSS to inline, or None if no local font is available.
+        """
+        if not self.available():
+            logger.info("Local icon font not found at %s; using the CDN stylesheet", self.font_file)
+            return None
+
+        with open(self.css_file, 'r', encoding='utf-8') as f:
+            codepoints = parse_codepoints(f.read())
+
+        used = {}
+        for name in sorted(self.scan_sources() | set(icon_names)):
+            if name in codepoints:
+                used[name] = codepoints[name]
+            else:
+                logger.warning("Unknown icon name: %s", name)
+
+        # The full font backs names only known at run time (e.g. Icon(name) with a variable);
+        # the browser fetches it only when a glyph outside the subset is shown.
+        full_path = self._copy_font(os.path.join(self.output_dir, f"icons-full-{self._digest('full')}.ttf"))
+        faces = [(full_path, f"U+{min(codepoints.values()):X}-{max(codepoints.values()):X}")]
+        keep = [full_path]
+        if font_subset is not None:
+            subset_path = self._write_font(sorted(set(used.values())))
+            # Declared last, so it wins for the codepoints it covers
+            faces.append((subset_path, ', '.join(f"U+{codepoint:X}" for codepoint in sorted(set(used.values())))))
+            keep.append(subset_path)
+        else:
+            logger.info("fontTools is not installed; serving the full icon font")
+
+        rules = []
+        for path, unicode_range in faces:
+            if not unicode_range:
+                continue
+            font_url = os.path.relpath(path, 'web').replace(os.sep, '/')
+            font_format = 'woff2' if path.endswith('.woff2') else 'truetype'
+            rules.append(
+                f"@font-face {{ font-family: '{self.family}'; src: url('{font_url}') format('{font_format}'); "
+                f"font-weight: normal; font-style: normal; font-display: block; unicode-range: {unicode_range}; }}"
+            )
+        rules.append(_BASE_CSS.format(family=f"'{self.family}'"))
+        rules += [f'.fa-{name}:before {{ content: "\\{codepoint:x}"; }}' for name, codepoint in used.items()]
+
+        # The rules of the other icons go to a local stylesheet, loaded without blocking the page
+        fallback_css = '\n'.join(
+            f'.fa-{name}:before {{ content: "\\{codepoint:x}"; }}'
+            for name, codepoint in sorted(codepoints.items()) if name not in used
+        )
+        css_path = os.path.join(self.output_dir, f"icons-rules-{self._digest(sorted(used))}.css")
+        if not os.path.exists(css_path):
+            with open(css_path, 'w', encoding='utf-8') as f:
+                f.write(fallback_css)
+        keep.append(css_path)
+        self._remove_stale(keep)
+        self.fallback_css_url = os.path.relpath(css_path, 'web').replace(os.sep, '/')
+        logger.info("Icon font built with %s of %s icons", len(used), len(codepoints))
+        return '\n'.join(rules)
+
+    def _digest(self, variant):
+        """Returns a short hash of the source font and a variant, used in file names."""
+        digest = hashlib.sha256()
+        with open(self.font_file, 'rb') as f:
+            digest.update(f.read())
+        digest.update(repr(variant).encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def _write_font(self, codepoints):
+        """
+        Writes the subsetted font for the given codepoints, reusing an existing file with the same content.
+
+        Args:
+            codepoints (list): Sorted codepoints to keep.
+
+        Returns:
+            str: Path of the font file.
+        """
+        key = self._digest(codepoints)
+        os.makedirs(self.output_dir, exist_ok=True)
+        for extension in ('woff2', 'ttf'):
+            existing = os.path.join(self.output_dir, f"icons-{key}.{extension}")
+            if os.path.exists(existing):
+                return existing
+
+        target = os.path.join(self.output_dir, f"icons-{key}.woff2")
+        options = font_subset.Options()
+        options.flavor = 'woff2'
+        options.layout_features = ['*']
+        try:
+            font = font_subset.load_font(self.font_file, options)
+            subsetter = font_subset.Subsetter(options)
+            subsetter.populate(unicodes=codepoints)
+            subsetter.subset(font)
+            font_subset.save_font(font, target, options)
+        except ImportError:  # woff2 output needs brotli; keep the subset as TTF instead
+            options.flavor = None
+            target = os.path.join(self.output_dir, f"icons-{key}.ttf")
+            font = font_subset.load_font(self.font_file, options)
+            subsetter = font_subset.Subsetter(options)
+            subsetter.populate(unicodes=codepoints)
+            subsetter.subset(font)
+            font_subset.save_font(font, target, options)
+        return target
+
+    def _copy_font(self, target):
+        """Copies the full source font to `target` unless it is already there."""
+        if not os.path.exists(target):
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(self.font_file, 'rb') as source, open(target, 'wb') as f:
+                f.write(source.read())
+        return target
+
+    def _remove_stale(self, keep):
+        kept = {os.path.abspath(path) for path in keep}
+        for name in os.listdir(self.output_dir):
+            path = os.path.join(self.output_dir, name)
+            if name.startswith('icons-') and os.path.abspath(path) not in kept:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
@@ -0,0 +1,259 @@
+# framework/instrumentation.py
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+def configure_logging(level='WARNING'):
+    """
+    Configures the framework's logger, which replaces the old debug `print()` output.
+
+    Args:
+        level (str or int): A logging level name (e.g. 'DEBUG', 'INFO') or number. Defaults to 'WARNING'.
+    """
+    package_logger = logging.getLogger(__name__.rpartition('.')[0] or __name__)
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.WARNING
+    package_logger.setLevel(level)
+    if not package_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('[%(levelname)s] %(name)s: %(message)s'))
+        package_logger.addHandler(handler)
+
+
+class LogSink:
+    """
+    Writes instrumentation events to the framework logger.
+
+    Attributes:
+        level (int): The logging level used for the events.
+    """
+    def __init__(self, level=logging.INFO):
+        self.level = level
+
+    def emit(self, event):
+        if event['type'] == 'update':
+            logger.log(self.level, "update %s: %.2f ms, %s", event['label'], event['duration_ms'], event['counters'])
+        else:
+            logger.log(self.level, "%s: %.2f ms %s", event['name'], event['duration_ms'], event.get('tags', {}))
+
+
+class JsonLinesSink:
+    """
+    Appends every instrumentation event as one JSON object per line.
+
+    Attributes:
+        path (str): The file the events are appended to.
+    """
+    def __init__(self, path='web/metrics.jsonl'):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, event):
+        line = json.dumps(event, default=str)
+        with self._lock:
+            try:
+                with open(self.path, 'a') as f:
+                    f.write(line + '\n')
+            except IOError as e:
+                logger.warning("Error writing metrics to %s: %s", self.path, e)
+
+
+class OverlaySink:
+    """
+    Shows the metrics of the last update in a small overlay inside the app window.
+
+    Only 'update' events are displayed; individual timers are summarised in them.
+
+    Attributes:
+        framework (Framework): The framework whose window hosts the overlay.
+    """
+    def __init__(self, framework):
+        self.framework = framework
+
+    def emit(self, event):
+        if event['type'] != 'update':
+            return
+        window = getattr(self.framework, 'window', None)
+        if not window:
+            return
+        lines = [f"{event['label']}: {event['duration_ms']:.1f} ms"]
+        lines += [f"{name}: {value:.1f} ms" for name, value in event['timers'].items()]
+        lines += [f"{name}: {value}" for name, value in event['counters'].items()]
+        text = json.dumps('\n'.join(lines))
+        script = f"""
+            (function() {{
+                var overlay = document.getElementById('pythra-perf-overlay');
+                if (!overlay) {{
+                    overlay = document.createElement('pre');
+                    overlay.id = 'pythra-perf-overlay';
+                    overlay.style.cssText = 'position: fixed; top: 8px; right: 8px; z-index: 10000; margin: 0; padding: 6px 8px; font: 11px monospace; color: #0f0; background: rgba(0, 0, 0, 0.7); pointer-events: none; border-radius: 4px;';
+                    document.body.appendChild(overlay);
+                }}
+                overlay.textContent = {text};
+            }})();
+        """
+        window.evaluate_js(self.framework.id, script)
+
+
+class Instrumentation:
+    """
+    A singleton collecting timings and counters on the framework's hot paths.
+
+    Timers measure `build()`, `to_html()`, CSS generation and `evaluate_js` calls. Counters
+    (bytes sent, nodes rendered, ...) are accumulated per update and reported together with
+    the timer totals when the update ends. Events are passed to pluggable sinks such as
+    `LogSink`, `JsonLinesSink` or `OverlaySink`.
+
+    Attributes:
+        enabled (bool): Whether events are recorded. Timers are no-ops when disabled.
+        sinks (list): The sinks receiving events.
+        tracer (Tracer): When set, every timer is also recorded as a trace span.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the singleton instance of the Instrumentation class.
+
+        Returns:
+            Instrumentation: The singleton instance.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.enabled = False
+        self.sinks = []
+        self.tracer = None
+        self._local = threading.local()
+
+    def add_sink(self, sink):
+        """
+        Adds a sink and enables instrumentation.
+
+        Args:
+            sink: An object with an `emit(event)` method.
+        """
+        self.sinks.append(sink)
+        self.enabled = True
+
+    def remove_sink(self, sink):
+        """
+        Removes a sink. Instrumentation is disabled when no sinks remain.
+
+        Args:
+            sink: A previously added sink.
+        """
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+        self.enabled = bool(self.sinks)
+
+    def _emit(self, event):
+        for sink in list(self.sinks):
+            try:
+                sink.emit(event)
+            except Exception as e:
+                logger.warning("Instrumentation sink %r failed: %s", sink, e)
+
+    def _current_update(self):
+        return getattr(self._local, 'update', None)
+
+    @contextmanager
+    def timer(self, name, **tags):
+        """
+        Times the enclosed block.
+
+        Inside an update the duration is added to the update's timer totals; outside of one
+        it is emitted as a separate 'timer' event. When a tracer is attached, the block is
+        also recorded as a span on its timeline, tagged with the enclosing update's tags
+        (such as its widget ID) in addition to its own.
+
+        Args:
+            name (str): The name of the measured phase (e.g. 'build', 'to_html').
+            **tags: Extra data attached to the event, such as the widget ID.
+        """
+        tracer = self.tracer
+        if not self.enabled and tracer is None:
+            yield
+            return
+        update = self._current_update()
+        if update is not None and update['tags']:
+            tags = {**update['tags'], **tags}
+        wall_start = time.time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if tracer is not None:
+                tracer.record(name, wall_start, elapsed, **tags)
+            if self.enabled:
+                duration_ms = elapsed * 1000.0
+                if update is not None:
+                    update['timers'][name] = update['timers'].get(name, 0.0) + duration_ms
+                else:
+                    self._emit({'type': 'timer', 'name': name, 'duration_ms': duration_ms, 'tags': tags, 'time': time.time()})
+
+    def count(self, name, value=1):
+        """
+        Adds a value to a counter of the current update.
+
+        Args:
+            name (str): The counter name (e.g. 'bytes_sent', 'nodes_rendered').
+            value (int): The amount to add. Defaults to 1.
+        """
+        if not self.enabled:
+            return
+        update = self._current_update()
+        if update is not None:
+            update['counters'][name] = update['counters'].get(name, 0) + value
+
+    @contextmanager
+    def update(self, label, **tags):
+        """
+        Groups the timers and counters of one UI update into a single 'update' event.
+
+        The timers inside the update inherit its tags. When a tracer is attached, the
+        update is also recorded as an 'update' span.
+
+        Args:
+            label (str): A name for the update, for example the widget being replaced.
+            **tags: Extra data attached to the event, such as the widget ID.
+        """
+        tracer = self.tracer
+        if (not self.enabled and tracer is None) or self._current_update() is not None:
+            yield
+            return
+        self._local.update = {'timers': {}, 'counters': {}, 'tags': tags}
+        wall_start = time.time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            update = self._local.update
+            self._local.update = None
+            if tracer is not None:
+                tracer.record('update', wall_start, elapsed, label=label, **tags)
+            if self.enabled:
+                self._emit({
+                    'type': 'update',
+                    'label': label,
+                    'duration_ms': elapsed * 1000.0,
+                    'timers': update['timers'],
+                    'counters': update['counters'],
+                    'tags': tags,
+                    'time': time.time(),
+                })
+
+
+instrumentation = Instrumentation.instance()
@@ -0,0 +1,240 @@
+# framework/reactive.py
+import json
+import threading
+import weakref
+import logging
+from contextlib import contextmanager
+
+from .base import Widget
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+_batch = threading.local()
+
+
+@contextmanager
+def batch():
+    """
+    Collects the DOM patches of all value changes in the block and sends them as one script.
+
+    Example:
+        with batch():
+            fps.value = 60
+            frame_time.value = 16.6
+    """
+    if getattr(_batch, 'scripts', None) is not None:
+        yield
+        return
+    _batch.scripts = []
+    try:
+        yield
+    finally:
+        scripts = _batch.scripts
+        _batch.scripts = None
+        _send(''.join(scripts))
+
+
+def _send(script):
+    """Runs a patch script in the app window, on the Qt main thread."""
+    if not script:
+        return
+    framework = Widget._framework_ref() if Widget._framework_ref else None
+    window = getattr(framework, 'window', None)
+    if not window:
+        return
+    instrumentation.count('bytes_sent', len(script.encode('utf-8')))
+    if threading.current_thread() is threading.main_thread():
+        window.evaluate_js(framework.id, script)
+    else:
+        from .window import webwidget  # Imported once a window exists, not with the widgets
+        webwidget.call_on_main_thread(lambda: window.evaluate_js(framework.id, script))
+
+
+class ValueNotifier:
+    """
+    An observable value that can be bound to the text, attributes or styles of widgets.
+
+    Setting `value` calls the listeners and patches every bound node in place with a single
+    script: no `build()` runs and no subtree is re-rendered. Widgets are referenced weakly,
+    so bindings of widgets replaced by a rebuild disappear on their own.
+
+    A `Text` created with a ValueNotifier as its data is bound automatically:
+
+        counter = ValueNotifier(0)
+        Text(counter)
+        counter.value += 1  # Patches only that text node
+
+    Attributes:
+        listeners (list): Functions called with the new value after every change.
+    """
+
+    def __init__(self, value=None):
+        self._value = value
+        self.listeners = []
+        self._bindings = []  # (weakref to widget, kind, name, format)
+
+    @property
+    def value(self):
+        """The current value. Assigning a different value notifies listeners and bindings."""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if value == self._value:
+            return
+        self._value = value
+        # Derived notifiers and listeners changing other values join the same patch
+        with batch():
+            self.notify()
+
+    def __str__(self):
+        return str(self._value)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._value!r})"
+
+    def add_listener(self, listener):
+        """Adds a function called with the new value after every change."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Removes a listener added with `add_listener`."""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def map(self, transform):
+        """
+        Returns a derived notifier holding `transform(value)`, updated whenever this one changes.
+
+        The derived notifier is held weakly, so one created in `build()` disappears with the
+        widgets using it and stops being updated; keep a reference to use it on its own.
+
+        Args:
+            transform (callable): Computes the derived value, e.g. `lambda v: f"{v} fps"`.
+
+        Returns:
+            ValueNotifier: The derived notifier.
+        """
+        derived = ValueNotifier(transform(self._value))
+        derived_ref = weakref.ref(derived)
+
+        def update(value):
+            target = derived_ref()
+            if target is None:
+                self.remove_listener(update)  # Its widgets are gone
+            else:
+                target.value = transform(value)
+
+        self.add_listener(update)
+        return derived
+
+    def bind_text(self, widget, format=str):
+        """
+        Binds the value to the text content of a widget's element.
+
+        Args:
+            widget (Widget): The widget whose element shows the value.
+            format (callable): Converts the value to text. Defaults to `str`.
+
+        Returns:
+            ValueNotifier: This notifier, for chaining.
+        """
+        return self._bind(widget, 'text', None, format)
+
+    def bind_attribute(self, widget, name, format=str):
+        """
+        Binds the value to an attribute of a widget's element. A value of None removes it.
+
+        Args:
+            widget (Widget): The widget whose element is patched.
+            name (str): The attribute name.
+            format (callable): Converts the value to the attribute value. Defaults to `str`.
+
+        Returns:
+            ValueNotifier: This notifier, for chaining.
+        """
+        return self._bind(widget, 'attribute', name, format)
+
+    def bind_style(self, widget, name, format=str):
+        """
+        Binds the value to an inline style property of a widget's element.
+
+        Args:
+            widget (Widget): The widget whose element is patched.
+            name (str): The CSS property, e.g. 'width' or 'background-color'.
+            format (callable): Converts the value to a CSS value, e.g. `lambda v: f"{v}px"`.
+
+        Returns:
+            ValueNotifier: This notifier, for chaining.
+        """
+        return self._bind(widget, 'style', name, format)
+
+    def _bind(self, widget, kind, name, format):
+        self._bindings.append((weakref.ref(widget), kind, name, format))
+        return self
+
+    def notify(self):
+        """Calls the listeners and patches the bound nodes with the current value."""
+        for listener in list(self.listeners):
+            listener(self._value)
+
+        patches = []
+        live = []
+        for binding in self._bindings:
+            widget = binding[0]()
+            if widget is None or not self._is_mounted(widget):
+                continue
+            live.append(binding)
+            patches.append(self._patch(widget.widget_id(), binding[1], binding[2], binding[3]))
+        self._bindings = live
+        if not patches:
+            return
+
+        script = ''.join(patches)
+        if getattr(_batch, 'scripts', None) is not None:
+            _batch.scripts.append(script)
+        else:
+            _send(script)
+
+    @staticmethod
+    def _is_mounted(widget):
+        # A widget replaced by a rebuild has been deleted from the registry
+        framework = Widget._framework_ref() if Widget._framework_ref else None
+        if framework is None or not hasattr(framework, 'get_widget'):
+            return False
+        return framework.get_widget(widget.widget_id()) is widget
+
+    def _patch(self, element_id, kind, name, format):
+        value = self._value
+        target = f"document.getElementById('{element_id}')"
+        if kind == 'text':
+            return f"var e = {target}; if (e) e.textContent = {json.dumps(format(value))};"
+        if kind == 'attribute':
+            if value is None:
+                return f"var e = {target}; if (e) e.removeAttribute({json.dumps(name)});"
+            return f"var e = {target}; if (e) e.setAttribute({json.dumps(name)}, {json.dumps(format(value))});"
+        return f"var e = {target}; if (e) e.style.setProperty({json.dumps(name)}, {json.dumps(format(value))});"
+
+
+class Signal(ValueNotifier):
+    """
+    A ValueNotifier read by calling it, in the style of signal libraries.
+
+    Example:
+        count = Signal(0)
+        Text(count)
+        count.update(lambda v: v + 1)
+        count()  # 1
+    """
+
+    def __call__(self):
+        return self._value
+
+    def set(self, value):
+        """Sets a new value."""
+        self.value = value
+
+    def update(self, transform):
+        """Sets the value to `transform(value)`."""
+        self.value = transform(self._value)
@@ -0,0 +1,349 @@
+# framework/replay.py
+import json
+import logging
+import os
+import statistics
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def tap(callback, *args, delay_ms=0, label=None):
+    """
+    Returns a replay event calling a registered callback, as a click on its widget would.
+
+    Args:
+        callback (str): The registered callback name.
+        *args: Arguments passed to the callback (at most one int, like `handleClickOnTap`).
+        delay_ms (float): Time to wait before the event. Defaults to 0.
+        label (str, optional): The name the event is reported under. Defaults to the callback.
+
+    Returns:
+        dict: The event.
+    """
+    return {'callback': callback, 'args': list(args), 'delay_ms': delay_ms, 'label': label or callback}
+
+
+def switch_tab(callback, index, delay_ms=0):
+    """
+    Returns a replay event selecting a tab through an index callback (e.g. a BottomNavigationBar's).
+
+    Args:
+        callback (str): The registered tab callback name.
+        index (int): The tab to select.
+        delay_ms (float): Time to wait before the event. Defaults to 0.
+
+    Returns:
+        dict: The event.
+    """
+    return tap(callback, index, delay_ms=delay_ms, label=f"tab:{callback}")
+
+
+def toggle_drawer(side='left', callback=None, delay_ms=0):
+    """
+    Returns a replay event opening or closing a drawer.
+
+    Drawers are toggled in the page (see `pythraOverlays`), so without a callback the event
+    is a script and can only be replayed in a window.
+
+    Args:
+        side (str): 'left' or 'right'. Defaults to 'left'.
+        callback (str, optional): A registered callback toggling the drawer from Python.
+        delay_ms (float): Time to wait before the event. Defaults to 0.
+
+    Returns:
+        dict: The event.
+    """
+    label = f"drawer:{side}"
+    if callback:
+        return tap(callback, delay_ms=delay_ms, label=label)
+    return {'script': f"toggleDrawer({json.dumps(side)});", 'delay_ms': delay_ms, 'label': label}
+
+
+def load_events(path):
+    """
+    Reads recorded or scripted events, either a JSON list or one JSON event per line.
+
+    Args:
+        path (str): The events file.
+
+    Returns:
+        list: The events.
+    """
+    with open(path, 'r') as f:
+        text = f.read().strip()
+    if text.startswith('['):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def save_events(events, path):
+    """
+    Writes events as JSON lines, the format written by `EventRecorder`.
+
+    Args:
+        events (list): The events.
+        path (str): The output file.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        for event in events:
+            f.write(json.dumps(event) + '\n')
+
+
+def latency_summary(latencies):
+    """
+    Summarises latencies with their percentiles.
+
+    Args:
+        latencies (list): Latencies in milliseconds.
+
+    Returns:
+        dict: 'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms' and 'max_ms'. Empty when
+            there are no latencies.
+    """
+    if not latencies:
+        return {'count': 0}
+    if len(latencies) == 1:
+        p50 = p95 = p99 = latencies[0]
+    else:
+        cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    return {
+        'count': len(latencies),
+        'mean_ms': statistics.fmean(latencies),
+        'p50_ms': p50,
+        'p95_ms': p95,
+        'p99_ms': p99,
+        'max_ms': max(latencies),
+    }
+
+
+class EventRecorder:
+    """
+    Records the callbacks dispatched by the web channel API as replayable events.
+
+    The recorder is installed as the API's `dispatch_hook`; a hook already installed (such
+    as the tracer's) keeps running for every callback.
+
+    Attributes:
+        events (list): The recorded events, with the pause before each one as `delay_ms`.
+    """
+
+    def __init__(self, api):
+        """
+        Initializes the recorder.
+
+        Args:
+            api (Api): The web channel API whose callbacks are recorded.
+        """
+        self.api = api
+        self.events = []
+        self._previous_hook = None
+        self._last = None
+
+    def start(self):
+        """
+        Starts recording.
+        """
+        self._previous_hook = self.api.dispatch_hook
+        self.api.dispatch_hook = self._record
+        self._last = None
+
+    def stop(self):
+        """
+        Stops recording and restores the previous dispatch hook.
+        """
+        if self.api.dispatch_hook == self._record:
+            self.api.dispatch_hook = self._previous_hook
+
+    def save(self, path):
+        """
+        Writes the recorded events as JSON lines.
+
+        Args:
+            path (str): The output file.
+        """
+        save_events(self.events, path)
+
+    def _record(self, callback_name, callback, args):
+        now = time.perf_counter()
+        delay_ms = (now - self._last) * 1000.0 if self._last is not None else 0
+        self._last = now
+        self.events.append({'callback': callback_name, 'args': list(args), 'delay_ms': round(delay_ms, 1), 'label': callback_name})
+        if self._previous_hook:
+            return self._previous_hook(callback_name, callback, args)
+        return callback(*args)
+
+
+class HeadlessWindow:
+    """
+    Stands in for the app window when replaying without one. Scripts are counted, not run.
+
+    Attributes:
+        scripts (int): The number of scripts sent.
+        bytes_sent (int): The total size of the scripts sent.
+    """
+
+    def __init__(self):
+        self.scripts = 0
+        self.bytes_sent = 0
+
+    def evaluate_js(self, window_id, *scripts, callback=None):
+        for script in scripts:
+            self.scripts += 1
+            self.bytes_sent += len(script.encode('utf-8'))
+        if callback:
+            callback(None)
+
+    def run_js(self, window_id, script):
+        self.evaluate_js(window_id, script)
+
+    def close(self):
+        pass
+
+
+class ReplayHarness:
+    """
+    Replays a sequence of events against an app and reports latency percentiles and throughput.
+
+    Install the harness before the app calls `Framework.run()`:
+
+        harness = ReplayHarness(framework, load_events('session.jsonl'), repeat=20)
+        harness.install()
+        app.run()
+        print(harness.report)
+
+    Headless, `Framework.run()` renders the root widget without opening a window and calls the
+    callbacks directly; an event's latency is the time from the dispatch to the last patch
+    script handed to the window, which covers `build()`, rendering and CSS generation. In a
+    window, the events are fired from the page (see `pythraReplay` in main.js) and timed from
+    the bridge call to the last DOM mutation, and to the next painted frame; the
+    application quits once the report is ready. Throughput is the number of events per
+    second of replay time, not counting the `delay_ms` pauses between events.
+
+    Attributes:
+        events (list): The events of one round.
+        repeat (int): How many times the events are replayed.
+        headless (bool): Whether to replay without a window.
+        output (str): A file the report is written to as JSON, if set.
+        report (dict): The report of the last replay, or None.
+    """
+
+    def __init__(self, framework, events, repeat=1, headless=True, output=None, start_delay_ms=1000, quit_when_done=True):
+        """
+        Initializes the harness.
+
+        Args:
+            framework (Framework): The framework instance of the app.
+            events (list): The events of one round (see `tap`, `switch_tab`, `toggle_drawer`).
+            repeat (int): How many times the events are replayed. Defaults to 1.
+            headless (bool): Whether to replay without a window. Defaults to True.
+            output (str, optional): A file the report is written to as JSON.
+            start_delay_ms (int): In a window, the wait before the first event. Defaults to 1000.
+            quit_when_done (bool): In a window, whether to quit the app after the report.
+                Defaults to True.
+        """
+        self.framework = framework
+        self.events = list(events)
+        self.repeat = max(1, int(repeat))
+        self.headless = headless
+        self.output = output
+        self.start_delay_ms = start_delay_ms
+        self.quit_when_done = quit_when_done
+        self.window = HeadlessWindow() if headless else None
+        self.report = None
+
+    def install(self):
+        """
+        Makes `Framework.run()` replay the events instead of (headless) or after opening the window.
+        """
+        self.framework.replay_harness = self
+
+    def run_headless(self):
+        """
+        Replays the events without a window. Called by `Framework.run()`.
+
+        Returns:
+            dict: The report.
+        """
+        api = self.framework.api
+        latencies = {}
+        skipped = 0
+        busy = 0.0
+        for _ in range(self.repeat):
+            for event in self.events:
+                callback = event.get('callback')
+                if callback not in api.callbacks:
+                    skipped += 1
+                    continue
+                start = time.perf_counter()
+                api._dispatch(callback, tuple(event.get('args') or ()))
+                elapsed = time.perf_counter() - start
+                busy += elapsed
+                latencies.setdefault(event.get('label') or callback, []).append(elapsed * 1000.0)
+        if skipped:
+            logger.warning("Replay skipped %d events without a registered callback (scripts need a window)", skipped)
+        report = self._build_report('headless', latencies, busy, skipped)
+        report['bytes_sent'] = self.window.bytes_sent
+        report['scripts'] = self.window.scripts
+        return self._finish(report)
+
+    def start_in_window(self):
+        """
+        Schedules the replay in the page once the window is up. Called by `Framework.run()`.
+        """
+        from PySide6.QtCore import QTimer  # Only needed with a window
+
+        self.framework.api.replay_listener = self._on_window_results
+        script = f"pythraReplay.run({json.dumps(self.events)}, {self.repeat});"
+        QTimer.singleShot(self.start_delay_ms, lambda: self.framework.window.evaluate_js(self.framework.id, script))
+
+    def _on_window_results(self, payload):
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            logger.warning("Invalid replay payload from browser: %r", payload)
+            return
+        latencies = {}
+        paint = []
+        for result in data.get('results', ()):
+            latency = result['patch_ms'] if result.get('patch_ms') is not None else result['bridge_ms']
+            latencies.setdefault(result['label'], []).append(latency)
+            paint.append(result['paint_ms'])
+        report = self._build_report('window', latencies, data.get('busy_ms', 0) / 1000.0, 0)
+        report['paint'] = latency_summary(paint)
+        self._finish(report)
+        if self.quit_when_done:
+            from .window import webwidget
+            webwidget.app.quit()
+
+    def _build_report(self, mode, latencies, busy_seconds, skipped):
+        everything = [latency for values in latencies.values() for latency in values]
+        return {
+            'mode': mode,
+            'events': len(everything),
+            'skipped': skipped,
+            'throughput_per_s': len(everything) / busy_seconds if busy_seconds else 0.0,
+            'latency': latency_summary(everything),
+            'by_label': {label: latency_summary(values) for label, values in latencies.items()},
+        }
+
+    def _finish(self, report):
+        self.report = report
+        latency = report['latency']
+        if latency['count']:
+            logger.info(
+                "Replay (%s): %d events, p50 %.1f ms, p95 %.1f ms, p99 %.1f ms, %.1f events/s",
+                report['mode'], report['events'], latency['p50_ms'], latency['p95_ms'], latency['p99_ms'],
+                report['throughput_per_s'],
+            )
+        if self.output:
+            directory = os.path.dirname(self.output)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.output, 'w') as f:
+                json.dump(report, f, indent=2)
+        return report
@@ -0,0 +1,278 @@
+# framework/snapshot.py
+import hashlib
+import json
+import os
+import pickle
+import sys
+import weakref
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StartupSnapshot:
+    """
+    Stores the first rendered page of an application so later launches can show it
+    before the widget tree has been built.
+
+    A snapshot holds the initial HTML body and the full stylesheet. It is keyed by a
+    hash of the application's source files and its config file, so any change to the
+    code or the configuration produces a new key and the stale snapshot is ignored.
+
+    Attributes:
+        snapshot_dir (str): Directory where snapshot files are written.
+        config_file (str): Path of the YAML config file included in the key.
+        extra_files (list): Additional files whose contents are part of the key.
+    """
+
+    def __init__(self, snapshot_dir='web/snapshots', config_file='config.yaml', extra_files=None):
+        """
+        Initializes the snapshot store.
+
+        Args:
+            snapshot_dir (str): Directory where snapshot files are written. Defaults to 'web/snapshots'.
+            config_file (str): Path of the YAML config file. Defaults to 'config.yaml'.
+            extra_files (list, optional): Additional files to include in the key.
+        """
+        self.snapshot_dir = snapshot_dir
+        self.config_file = config_file
+        self.extra_files = list(extra_files or [])
+        self._key = None
+        self._files = None  # The source files, collected once
+
+    def _source_files(self):
+        """
+        Collects the Python source files of the application and the framework.
+
+        Only modules loaded from the current working directory are included, which
+        covers the app itself and the framework package but skips installed libraries.
+
+        Returns:
+            list: Sorted list of absolute file paths.
+        """
+        root = os.path.abspath(os.getcwd())
+        files = set()
+        for module in list(sys.modules.values()):
+            path = getattr(module, '__file__', None)
+            if not path or not path.endswith('.py'):
+                continue
+            path = os.path.abspath(path)
+            if path.startswith(root) and 'site-packages' not in path:
+                files.add(path)
+        return sorted(files)
+
+    def key(self):
+        """
+        Computes (once) the hash identifying the current source and config.
+
+        Returns:
+            str: A hex digest used as the snapshot file name.
+        """
+        if self._key is None:
+            if self._files is None:
+                self._files = self._source_files()
+            digest = hashlib.sha256()
+            for path in self._files + [self.config_file] + self.extra_files:
+                if not os.path.exists(path):
+                    continue
+                digest.update(os.path.relpath(path).encode('utf-8'))
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+            self._key = digest.hexdigest()[:32]
+        return self._key
+
+    def path(self):
+        """
+        Returns the path of the snapshot file for the current key.
+
+        Returns:
+            str: Absolute path of the snapshot JSON file.
+        """
+        return os.path.abspath(os.path.join(self.snapshot_dir, f"{self.key()}.json"))
+
+    def load(self):
+        """
+        Loads the snapshot matching the current key.
+
+        Returns:
+            dict or None: A dict with 'html' and 'css' entries, or None if no valid snapshot exists.
+        """
+        try:
+            with open(self.path(), 'r') as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return None
+        if not isinstance(data, dict) or 'html' not in data or 'css' not in data:
+            return None
+        return data
+
+    def save(self, html_content, css_content):
+        """
+        Writes the snapshot for the current key and removes snapshots of older keys.
+
+        Args:
+            html_content (str): The rendered HTML of the root widget.
+            css_content (str): The complete stylesheet written for the first page.
+        """
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        target = self.path()
+        tmp_path = target + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'key': self.key(), 'html': html_content, 'css': css_content}, f)
+            os.replace(tmp_path, target)
+        except IOError as e:
+            logger.error("Error writing startup snapshot: %s", e)
+            return
+
+        for name in os.listdir(self.snapshot_dir):
+            path = os.path.abspath(os.path.join(self.snapshot_dir, name))
+            if name.endswith('.json') and path != target:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+class StateSnapshot:
+    """
+    A singleton persisting opt-in `State` fields across launches.
+
+    A State lists the attributes to keep in `persistent_fields`. When snapshots are
+    enabled, those fields are restored as the State is created, before its first
+    `build()`, and written to a local pickle file by `save()` (at exit and, optionally, at
+    an interval). Each State is stored under its class's qualified name, followed by the
+    `key` of its StatefulWidget when one is given, so several instances of a class need
+    distinct keys. The values must be picklable; States whose fields are not are skipped
+    with a warning. Only load state files written by the app itself.
+
+    Attributes:
+        enabled (bool): Whether States are restored and saved.
+        path (str): The state file.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the singleton instance of the StateSnapshot class.
+
+        Returns:
+            StateSnapshot: The singleton instance.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, path='web/state.pickle'):
+        self.enabled = False
+        self.path = path
+        self._data = None  # Key -> {field: value}, read on the first restore
+        self._states = weakref.WeakValueDictionary()  # Key -> live State
+        self._written = None  # The bytes of the last file read or written
+
+    def enable(self, path=None):
+        """
+        Enables restoring and saving States.
+
+        Args:
+            path (str, optional): The state file. Defaults to `path`.
+        """
+        if path:
+            self.path = path
+        self.enabled = True
+
+    @staticmethod
+    def state_key(state, key=None):
+        """
+        Returns the key a State is stored under.
+
+        Args:
+            state (State): The state.
+            key (str, optional): The key of its StatefulWidget.
+
+        Returns:
+            str: The storage key.
+        """
+        name = f"{type(state).__module__}.{type(state).__qualname__}"
+        return f"{name}#{key}" if key is not None else name
+
+    def _load(self):
+        if self._data is not None:
+            return self._data
+        self._data = {}
+        try:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+            data = pickle.loads(raw)
+        except FileNotFoundError:
+            return self._data
+        except Exception as e:
+            logger.warning("Ignoring unreadable state file %s: %s", self.path, e)
+            return self._data
+        if isinstance(data, dict):
+            self._data = data
+            self._written = raw
+        return self._data
+
+    def restore(self, state, key=None):
+        """
+        Registers a State and sets its persistent fields from the state file.
+
+        Sets `state.restored` to True when stored values were applied.
+
+        Args:
+            state (State): The new state, not yet built.
+            key (str, optional): The key of its StatefulWidget.
+        """
+        if not self.enabled or not state.persistent_fields:
+            return
+        name = self.state_key(state, key)
+        if name in self._states and self._states[name] is not state:
+            logger.warning("Several live %s states share a snapshot key; give their widgets distinct keys.", name)
+        self._states[name] = state
+        values = self._load().get(name)
+        if not values:
+            return
+        for field in state.persistent_fields:
+            if field in values:
+                setattr(state, field, values[field])
+        state.restored = True
+
+    def save(self):
+        """
+        Writes the persistent fields of the live States to the state file.
+
+        States that are gone keep the values they had when last saved. The file is only
+        rewritten when its content changes.
+        """
+        if not self.enabled:
+            return
+        data = dict(self._load())
+        for name, state in list(self._states.items()):
+            values = {field: getattr(state, field) for field in state.persistent_fields if hasattr(state, field)}
+            try:
+                pickle.dumps(values)
+            except Exception as e:
+                logger.warning("Not saving state %s: %s", name, e)
+                continue
+            data[name] = values
+        raw = pickle.dumps(data)
+        self._data = data
+        if raw == self._written:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_path, self.path)
+        except IOError as e:
+            logger.error("Error writing state file: %s", e)
+            return
+        self._written = raw
+
+
+state_snapshot = StateSnapshot.instance()
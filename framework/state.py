@@ -6,6 +6,12 @@ import threading
 import asyncio
 from PySide6.QtCore import QTimer
 import time # Keep for potential use, but not for sleep here
+import logging
+from .instrumentation import instrumentation
+from .diagnostics import diagnostics
+from .snapshot import state_snapshot
+
+logger = logging.getLogger(__name__)
 
 class State:
     """
@@ -21,8 +27,14 @@ class State:
         framework (Framework): A reference to the framework instance managing the widget.
         _cached_widget (Widget): A cached version of the widget's state.
         _original_widget_id (str): The original ID of the widget when it was first created.
+        persistent_fields (tuple): Names of the attributes kept across launches when state
+            snapshots are enabled (see `StateSnapshot`). Values must be picklable.
+        restored (bool): Whether the persistent fields were restored from a snapshot.
 
     Methods:
+        initState():
+            Called once the state is linked to its widget and restored, before the first build.
+        
         setState():
             Triggers an update to the widget by regenerating the widget tree and applying the new state.
         
@@ -60,13 +72,16 @@ class State:
             Closes the bottom sheet in the root widget.
         
         openSnackBar():
-            Opens the snackbar and starts a timer to automatically close it after a duration.
+            Opens the snackbar; the page closes it automatically after its duration.
         
         closeSnackBar():
             Closes the snackbar in the root widget.
         
     """
+    persistent_fields = ()
+
     def __init__(self):
+        self.restored = False
         self._widget_id = None  # Store the widget's ID instead of the widget itself
         self._widget_ref = None
         self.framework = StatefulWidget._framework_ref()
@@ -81,37 +96,41 @@ class State:
         # Get the *current* widget ID before rebuilding
         current_widget_id = self._original_widget_id
         if not current_widget_id:
-            print(f"Warning: Original widget ID is missing before update.")
+            logger.warning("Original widget ID is missing before update.")
             # Maybe return early if no ID?
             # return
 
         if self.framework:
-            # 1. Build the new widget tree
-            new_widget_tree = self.build()
-            self._cached_widget = new_widget_tree # Update cache
-            new_widget_id = new_widget_tree.widget_id() # ID of the new tree root
-
-            # 2. Call framework update, passing the NEW tree for scanning
-            #    and the OLD ID for DOM replacement.
-            if current_widget_id:
-                self.framework.update_dom_and_css(current_widget_id, new_widget_tree) # Pass new tree
-            else:
-                print(f"Error: Cannot update DOM as original widget ID '{current_widget_id}' is invalid.")
-                # If you reach here, something is wrong with ID tracking.
-                return
+            with instrumentation.update(type(self).__name__, widget_id=current_widget_id):
+                # 1. Build the new widget tree
+                with instrumentation.timer('build'):
+                    new_widget_tree = self.build()
+                self._cached_widget = new_widget_tree # Update cache
+                new_widget_id = new_widget_tree.widget_id() # ID of the new tree root
+
+                # 2. Call framework update, passing the NEW tree for scanning
+                #    and the OLD ID for DOM replacement.
+                if current_widget_id:
+                    self.framework.update_dom_and_css(current_widget_id, new_widget_tree) # Pass new tree
+                else:
+                    logger.error("Cannot update DOM as original widget ID '%s' is invalid.", current_widget_id)
+                    # If you reach here, something is wrong with ID tracking.
+                    return
 
 
             # 3. Delete old widget instance from Python registry (as requested)
             if current_widget_id and current_widget_id != new_widget_id:
                 # Check if it still exists before trying to delete
                 if self.framework.get_widget(current_widget_id):
-                    self.framework.delete_widget(current_widget_id)
+                    # Instances reused by the new tree keep their registration and children
+                    self.framework.delete_widget(current_widget_id, keep=new_widget_tree)
                 #else: # Debugging
                 #    print(f"Attempted to delete {current_widget_id}, but it was already gone.")
 
-            print("Original Widget Id: ", current_widget_id, "New Widget Id: ",new_widget_id)
+            logger.debug("Original Widget Id: %s New Widget Id: %s", current_widget_id, new_widget_id)
             # 4. Update tracked ID for the *next* update cycle
             self._original_widget_id = new_widget_id
+            diagnostics.record_set_state()
 
         else:
             raise ValueError("Framework reference is not available in State.")
@@ -125,6 +144,15 @@ class State:
     def widget_id(self):
         return self._widget_id
 
+    def initState(self):
+        """
+        Called once before the first build, after persistent fields have been restored.
+
+        Expensive initial loading belongs here rather than in `__init__`, so it can be
+        skipped when `self.restored` is True.
+        """
+        pass
+
     def buildCache(self):
         if not self._cached_widget:
             self._cached_widget = self.build()
@@ -163,53 +191,15 @@ class State:
     def openSnackBar(self):
         snack_bar_widget = self.framework.root_widget.snackBar
         if not snack_bar_widget:
-            print("Snackbar widget not found in root widget.")
-            return
-
-        # 1. Make snackbar visible (assuming this involves JS too)
-        snack_bar_widget.toggle(True) # Let the toggle method handle showing it via JS
-
-        # 2. Schedule the hide operation using QTimer
-        duration_sec = snack_bar_widget.duration
-        duration_ms = int(duration_sec * 1000) # QTimer uses milliseconds
-
-        # Use a lambda or partial to call the hide method later
-        # Ensure the framework and snackbar ID are accessible when the timer fires
-        snack_bar_id = snack_bar_widget.widget_id() # Get ID now
-        if not snack_bar_id:
-            print("Error: Snackbar widget ID is missing.")
+            logger.warning("Snackbar widget not found in root widget.")
             return
 
-        print(f"Scheduling snackbar {snack_bar_id} to hide in {duration_ms} ms") # Debug
-        QTimer.singleShot(duration_ms, lambda: self._schedule_snackbar_hide(snack_bar_id))
-
-    # Remove the old threaded method
-    # def _auto_hide_snack_bar(self):
-    #    pass
-
-    def _schedule_snackbar_hide(self, snack_bar_id_to_hide):
-        """
-        This method is called by QTimer on the main GUI thread.
-        It safely calls the framework's hide method.
-        """
-        print(f"Timer fired: Hiding snackbar {snack_bar_id_to_hide}") # Debug
-        if self.framework:
-            # Verify the snackbar we intend to hide might still be relevant
-            # (Optional check: Is the *current* snackbar still the same one?)
-            current_snackbar = self.framework.root_widget.snackBar
-            if current_snackbar and current_snackbar.widget_id() == snack_bar_id_to_hide:
-                self.framework.hide_snack_bar(snack_bar_id_to_hide)
-                self.closeSnackBar()
-            else:
-                print(f"Snackbar {snack_bar_id_to_hide} is no longer the active snackbar or doesn't exist; not hiding.")
-        else:
-            print("Framework not available when trying to hide snackbar.")    
-
+        # The page hides the snack bar after its duration; no timer or render is needed here
+        snack_bar_widget.toggle(True)
 
     def closeSnackBar(self):
         self.framework.root_widget.snackBar.toggle(False)
-        
-        print("Snack CLOSED")
+        logger.debug("Snack CLOSED")
 
 
 
@@ -258,8 +248,11 @@ class StatefulWidget(Widget):
 
     def __init__(self, key=None):
         super().__init__(widget_id=self.widget_id) # Call the Widget's __init__ method
+        self.key = key
         self._state = self.createState()
         self._state._set_widget(self) # Link the state to the widget
+        state_snapshot.restore(self._state, key)
+        self._state.initState()
         self.framework = self._framework_ref()
  
 
@@ -1,20 +1,98 @@
 #framework/styles.py
 from enum import Enum
+from functools import lru_cache
 
 
-class EdgeInsets:
+class InternedStyle:
+    """
+    Base class for immutable style values that are interned by their constructor arguments.
+
+    Constructing a style with the same arguments twice returns the same instance, so repeated
+    calls in `build()` allocate nothing and identical styles compare and hash as one object.
+    The CSS string of each instance is computed once, when it is first created.
+
+    Subclasses list their fields in `_fields` (in constructor argument order), declare them in
+    `__slots__` together with `_css`, and implement `_build_css()`.
+    """
+    __slots__ = ()
+    _fields = ()
+    _cache = {}
+    _cache_limit = 10000  # Values past this many are still created, just not cached
+
+    @classmethod
+    def _get(cls, values):
+        """
+        Returns the canonical instance for a tuple of field values.
+
+        Args:
+            values (tuple): The field values, in `_fields` order.
+
+        Returns:
+            InternedStyle: The shared instance.
+        """
+        try:
+            instance = cls._cache.get(values)
+        except TypeError:  # Unhashable field value, e.g. a list
+            return cls._create(values)
+        if instance is None:
+            instance = cls._create(values)
+            if len(cls._cache) < cls._cache_limit:
+                cls._cache[values] = instance
+        return instance
+
+    @classmethod
+    def _create(cls, values):
+        instance = object.__new__(cls)
+        for name, value in zip(cls._fields, values):
+            object.__setattr__(instance, name, value)
+        object.__setattr__(instance, '_css', instance._build_css())
+        return instance
+
+    def _build_css(self):
+        raise NotImplementedError("Interned styles must implement _build_css.")
+
+    def to_css(self):
+        """
+        Returns the precomputed CSS string for this style.
+
+        Returns:
+            str: The CSS string.
+        """
+        return self._css
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, name) for name in self._fields))
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class EdgeInsets(InternedStyle):
     """
     A class representing the padding or margin for a widget, with values for left, top, right, and bottom edges.
 
+    EdgeInsets are immutable and interned: equal values return the same instance.
+
     Attributes:
         left (int): The padding/margin value on the left side.
         top (int): The padding/margin value on the top side.
         right (int): The padding/margin value on the right side.
         bottom (int): The padding/margin value on the bottom side.
     """
-    def __init__(self, left=0, top=0, right=0, bottom=0):
+    __slots__ = ('left', 'top', 'right', 'bottom', '_css')
+    _fields = ('left', 'top', 'right', 'bottom')
+    _cache = {}
+
+    def __new__(cls, left=0, top=0, right=0, bottom=0):
         """
-        Initializes the EdgeInsets object with values for left, top, right, and bottom edges.
+        Returns the EdgeInsets object with values for left, top, right, and bottom edges.
 
         Args:
             left (int): Padding/margin value for the left side (default is 0).
@@ -22,10 +100,7 @@ class EdgeInsets:
             right (int): Padding/margin value for the right side (default is 0).
             bottom (int): Padding/margin value for the bottom side (default is 0).
         """
-        self.left = left
-        self.top = top
-        self.right = right
-        self.bottom = bottom
+        return cls._get((left, top, right, bottom))
 
     @staticmethod
     def all(value):
@@ -70,7 +145,7 @@ class EdgeInsets:
         """
         return EdgeInsets(left=left, right=right, top=top, bottom=bottom)
 
-    def to_css(self):
+    def _build_css(self):
         """
         Converts the EdgeInsets object to a CSS string format.
 
@@ -99,25 +174,30 @@ class EdgeInsets:
     
 
 
-class Alignment:
+class Alignment(InternedStyle):
     """
     A class representing the alignment of a widget within a container. Defines how content is aligned in both 
     the horizontal and vertical directions.
 
+    Alignments are immutable and interned: equal values return the same instance.
+
     Attributes:
         justify_content (str): The alignment of the content in the main axis (e.g., 'center', 'flex-start').
         align_items (str): The alignment of the content in the cross axis (e.g., 'center', 'flex-start').
     """
-    def __init__(self, justify_content, align_items):
+    __slots__ = ('justify_content', 'align_items', '_css')
+    _fields = ('justify_content', 'align_items')
+    _cache = {}
+
+    def __new__(cls, justify_content, align_items):
         """
-        Initializes the Alignment object with horizontal and vertical alignment properties.
+        Returns the Alignment object with horizontal and vertical alignment properties.
 
         Args:
             justify_content (str): The alignment in the main axis (horizontal).
             align_items (str): The alignment in the cross axis (vertical).
         """
-        self.justify_content = justify_content
-        self.align_items = align_items
+        return cls._get((justify_content, align_items))
 
     @staticmethod
     def center():
@@ -209,7 +289,7 @@ class Alignment:
         """
         return Alignment('flex-end', 'flex-end')
 
-    def to_css(self):
+    def _build_css(self):
         """
         Converts the Alignment object to a CSS string for flexbox layout.
 
@@ -352,9 +432,10 @@ class Colors:
         return hex_code
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def rgba(red, blue, green, alpha):
         """
-        Returns an RGBA color string.
+        Returns an RGBA color string. Repeated calls with the same values return the cached string.
 
         Args:
             red (int): The red component of the color (0-255).
@@ -517,9 +598,11 @@ class Axis:
     VERTICAL = 'vertical'
     HORIZONTAL = 'horizontal'
     
-class TextStyle:
+class TextStyle(InternedStyle):
     """
     A class representing text style properties for a widget.
+
+    TextStyles are immutable and interned: equal values return the same instance.
     
     Attributes:
         color (str): The color of the text.
@@ -533,16 +616,14 @@ class TextStyle:
     Methods:
         to_css(): Converts the text style properties to a CSS string.
     """
-    def __init__(self, color=None, fontSize=None, fontWeight=None, fontStyle=None, letterSpacing=None, wordSpacing=None, textDecoration=None):
-        self.color = color
-        self.fontSize = fontSize
-        self.fontWeight = fontWeight
-        self.fontStyle = fontStyle
-        self.letterSpacing = letterSpacing
-        self.wordSpacing = wordSpacing
-        self.textDecoration = textDecoration
+    __slots__ = ('color', 'fontSize', 'fontWeight', 'fontStyle', 'letterSpacing', 'wordSpacing', 'textDecoration', '_css')
+    _fields = ('color', 'fontSize', 'fontWeight', 'fontStyle', 'letterSpacing', 'wordSpacing', 'textDecoration')
+    _cache = {}
 
-    def to_css(self):
+    def __new__(cls, color=None, fontSize=None, fontWeight=None, fontStyle=None, letterSpacing=None, wordSpacing=None, textDecoration=None):
+        return cls._get((color, fontSize, fontWeight, fontStyle, letterSpacing, wordSpacing, textDecoration))
+
+    def _build_css(self):
         """
         Converts the text style attributes to a CSS string.
 
@@ -858,3 +939,105 @@ class BoxFit:
     COVER = 'cover'
     FILL = 'fill'
     NONE = 'none'
+
+
+class EventPolicy:
+    """
+    Sampling policies for continuous events (scroll, pointer move, resize, input).
+
+    Events are batched in the page and delivered to Python at most once per animation frame.
+
+    Attributes:
+        RAF: Keeps the latest event and delivers it with the next frame's batch.
+        THROTTLE: Delivers at most one event per interval, including the last one.
+        DEBOUNCE: Delivers the last event once no new event arrived for the interval.
+        LATEST: Keeps only the latest event and delivers it when the previous batch has been handled.
+    """
+    RAF = 'raf'
+    THROTTLE = 'throttle'
+    DEBOUNCE = 'debounce'
+    LATEST = 'latest'
+
+
+class Curves:
+    """
+    Easing curves for implicit animations, as CSS timing functions.
+
+    Attributes:
+        LINEAR: Constant speed.
+        EASE: The CSS default ease.
+        EASE_IN: Starts slowly and accelerates.
+        EASE_OUT: Starts quickly and decelerates.
+        EASE_IN_OUT: Accelerates, then decelerates.
+        FAST_OUT_SLOW_IN: The Material standard curve.
+        DECELERATE: Starts fast and settles slowly.
+    """
+    LINEAR = 'linear'
+    EASE = 'ease'
+    EASE_IN = 'ease-in'
+    EASE_OUT = 'ease-out'
+    EASE_IN_OUT = 'ease-in-out'
+    FAST_OUT_SLOW_IN = 'cubic-bezier(0.4, 0.0, 0.2, 1)'
+    DECELERATE = 'cubic-bezier(0.0, 0.0, 0.2, 1)'
+
+
+class Containment:
+    """
+    CSS containment hints for a subtree that is often offscreen, such as list items, grid
+    cells and drawer contents.
+
+    `contain` keeps style and layout work inside the subtree, and `content-visibility: auto`
+    lets the browser skip rendering it while it is offscreen. A skipped subtree is sized
+    by `contain-intrinsic-size`; the `auto` keyword makes the browser use the last
+    rendered size once it has been on screen, so the given size only needs to be close.
+    Widgets leave the hints out of subtrees whose size they do not know.
+
+    Both `contain: paint` and `content-visibility: auto` clip the subtree to its box, so
+    shadows and popups drawing outside it are cut off; pass `containment=False` to the
+    widget holding such content.
+
+    Attributes:
+        contain (str): The `contain` value, or None to leave it out.
+        contentVisibility (str): The `content-visibility` value, or None to leave it out.
+        intrinsicWidth (int): The placeholder width in pixels, or None to use the size known to the widget.
+        intrinsicHeight (int): The placeholder height in pixels, or None to use the size known to the widget.
+    """
+    def __init__(self, contain='layout paint', contentVisibility='auto', intrinsicWidth=None, intrinsicHeight=None):
+        """
+        Initializes the containment hints.
+
+        Args:
+            contain (str): The `contain` value. Defaults to 'layout paint'.
+            contentVisibility (str): The `content-visibility` value. Defaults to 'auto'.
+            intrinsicWidth (int, optional): The placeholder width in pixels.
+            intrinsicHeight (int, optional): The placeholder height in pixels.
+        """
+        self.contain = contain
+        self.contentVisibility = contentVisibility
+        self.intrinsicWidth = intrinsicWidth
+        self.intrinsicHeight = intrinsicHeight
+
+    def to_css(self, width=None, height=None):
+        """
+        Converts the hints to CSS declarations.
+
+        Args:
+            width (int, optional): The width known to the widget, used unless `intrinsicWidth` is set.
+            height (int, optional): The height known to the widget, used unless `intrinsicHeight` is set.
+
+        Returns:
+            str: The declarations.
+        """
+        styles = []
+        if self.contain:
+            styles.append(f"contain: {self.contain};")
+        if self.contentVisibility:
+            styles.append(f"content-visibility: {self.contentVisibility};")
+        if self.contentVisibility == 'auto':
+            width = self.intrinsicWidth or width
+            height = self.intrinsicHeight or height
+            if width:
+                styles.append(f"contain-intrinsic-width: auto {width}px;")
+            if height:
+                styles.append(f"contain-intrinsic-height: auto {height}px;")
+        return " ".join(styles)
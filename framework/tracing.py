@@ -0,0 +1,223 @@
+# framework/tracing.py
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+PYTHON_PID = 1
+BROWSER_PID = 2
+
+
+class Tracer:
+    """
+    A singleton recording a frame timeline for each user interaction.
+
+    Python-side phases (the callback handler, `build()`, `to_html()`, CSS generation, the
+    stylesheet write and `evaluate_js`) are recorded as spans through the instrumentation
+    timers. Browser-side phases (QWebChannel round trip, DOM patch, layout and paint) are
+    measured in `main.js` with `performance.mark` and sent back over the web channel.
+    Every span carries the name of the callback that triggered it and, where known, the
+    widget ID. The timeline is exported in the Chrome `trace_event` JSON format.
+
+    Attributes:
+        enabled (bool): Whether spans are being recorded.
+        events (list): The recorded trace events.
+        max_events (int): Oldest events are dropped beyond this count.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the singleton instance of the Tracer class.
+
+        Returns:
+            Tracer: The singleton instance.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.max_events = 200000
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, api=None):
+        """
+        Starts recording spans.
+
+        Args:
+            api (Api, optional): The web channel API. When given, callback dispatch is traced
+                and timings reported by the browser are merged into the timeline.
+        """
+        self.enabled = True
+        instrumentation.tracer = self
+        if api is not None:
+            api.dispatch_hook = self.trace_callback
+            api.trace_listener = self.add_browser_events
+        self._add_metadata()
+
+    def disable(self):
+        """
+        Stops recording spans. Already recorded events are kept.
+        """
+        self.enabled = False
+        if instrumentation.tracer is self:
+            instrumentation.tracer = None
+
+    def clear(self):
+        """
+        Removes all recorded events.
+        """
+        with self._lock:
+            self.events = []
+        if self.enabled:
+            self._add_metadata()
+
+    def _add_metadata(self):
+        self._append({'name': 'process_name', 'ph': 'M', 'pid': PYTHON_PID, 'args': {'name': 'Python'}})
+        self._append({'name': 'process_name', 'ph': 'M', 'pid': BROWSER_PID, 'args': {'name': 'WebView'}})
+
+    def _append(self, event):
+        with self._lock:
+            self.events.append(event)
+            if len(self.events) > self.max_events:
+                del self.events[:len(self.events) - self.max_events]
+
+    def current_callback(self):
+        """
+        Returns the name of the callback being dispatched on this thread, if any.
+
+        Returns:
+            str or None: The callback name.
+        """
+        return getattr(self._local, 'callback', None)
+
+    def record(self, name, start, duration, cat='python', **args):
+        """
+        Records a completed span.
+
+        Args:
+            name (str): The phase name.
+            start (float): Start time in seconds since the epoch.
+            duration (float): Duration in seconds.
+            cat (str): The trace category. Defaults to 'python'.
+            **args: Extra span arguments such as `widget_id`.
+        """
+        if not self.enabled:
+            return
+        callback = self.current_callback()
+        if callback and 'callback' not in args:
+            args['callback'] = callback
+        self._append({
+            'name': name,
+            'cat': cat,
+            'ph': 'X',
+            'ts': start * 1e6,
+            'dur': duration * 1e6,
+            'pid': PYTHON_PID,
+            'tid': threading.get_ident(),
+            'args': args,
+        })
+
+    @contextmanager
+    def span(self, name, cat='python', **args):
+        """
+        Records the enclosed block as a span.
+
+        Args:
+            name (str): The phase name.
+            cat (str): The trace category. Defaults to 'python'.
+            **args: Extra span arguments such as `widget_id`.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.time()
+        start_counter = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - start_counter, cat=cat, **args)
+
+    def trace_callback(self, callback_name, callback, args):
+        """
+        Dispatches a web channel callback inside a 'handler' span.
+
+        This is installed as the `dispatch_hook` of the API, so every span recorded while
+        the callback runs is tagged with its name.
+
+        Args:
+            callback_name (str): The registered callback name.
+            callback (callable): The callback to run.
+            args (tuple): Positional arguments from JavaScript.
+
+        Returns:
+            The callback's return value.
+        """
+        previous = self.current_callback()
+        self._local.callback = callback_name
+        try:
+            with self.span('handler', cat='python', callback=callback_name):
+                return callback(*args)
+        finally:
+            self._local.callback = previous
+
+    def add_browser_events(self, payload):
+        """
+        Merges spans measured in the browser into the timeline.
+
+        Args:
+            payload (str): JSON list of spans with `name`, `ts` and `dur` in epoch
+                milliseconds and optional `args`.
+        """
+        if not self.enabled:
+            return
+        try:
+            spans = json.loads(payload)
+        except ValueError:
+            logger.warning("Invalid trace payload from browser: %r", payload)
+            return
+        for span in spans:
+            self._append({
+                'name': span.get('name', 'js'),
+                'cat': 'browser',
+                'ph': 'X',
+                'ts': float(span.get('ts', 0)) * 1000.0,
+                'dur': float(span.get('dur', 0)) * 1000.0,
+                'pid': BROWSER_PID,
+                'tid': 1,
+                'args': span.get('args', {}),
+            })
+
+    def export(self, path='web/trace.json'):
+        """
+        Writes the timeline as Chrome `trace_event` JSON, viewable in chrome://tracing or Perfetto.
+
+        Args:
+            path (str): The output file. Defaults to 'web/trace.json'.
+
+        Returns:
+            str: The absolute path of the written file.
+        """
+        with self._lock:
+            events = list(self.events)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        logger.info("Trace with %s events written to %s", len(events), path)
+        return os.path.abspath(path)
+
+
+tracer = Tracer.instance()
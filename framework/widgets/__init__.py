@@ -0,0 +1,70 @@
+# framework/widgets/__init__.py
+"""
+The widget library.
+
+The widgets are grouped in modules by family, and each module is imported the first time
+one of its names is looked up (PEP 562), so `from framework.widgets import Text` loads
+only the text module and what it depends on. `from framework.widgets import *` still
+provides every widget together with the style classes, `Colors` and `config`.
+"""
+import importlib
+
+from ..config import config
+
+# Module -> the public names it defines
+_FAMILIES = {
+    'layout': (
+        'Container', 'Column', 'Row', 'Stack', 'Positioned', 'Expanded', 'Spacer', 'SizedBox', 'Divider',
+        'Center', 'Placeholder', 'Padding', 'Align', 'AspectRatio', 'FittedBox', 'FractionallySizedBox',
+        'Flex', 'Wrap',
+    ),
+    'animation': ('ImplicitAnimation', 'AnimatedContainer', 'AnimatedOpacity'),
+    'text': ('Text',),
+    'buttons': ('TextButton', 'ElevatedButton', 'IconButton', 'FloatingActionButton'),
+    'media': ('Image', 'AssetImage', 'NetworkImage', 'Icon'),
+    'lists': ('ListView', 'GridView', 'ListTile'),
+    'scaffold': (
+        'AppBar', 'BottomNavigationBar', 'BottomNavigationBarItem', 'Scaffold', 'Body', 'Drawer', 'EndDrawer',
+        'BottomSheet', 'SnackBar', 'SnackBarAction', 'Dialog',
+    ),
+    'input': ('EventListener', 'TextEditingController', 'TextField'),
+    'data_table': ('DataColumn', 'DataTable'),
+    'log_view': ('LogView',),
+    'navigation': ('IndexedStackController', 'IndexedStack', 'NavigatorController', 'Navigator'),
+}
+
+# Names from other framework modules that have always been importable from here
+_REEXPORTS = {
+    'Widget': '..base',
+    'Api': '..api',
+    'ValueNotifier': '..reactive',
+    'Signal': '..reactive',
+    'batch': '..reactive',
+}
+
+_MODULES = {name: module for module, names in _FAMILIES.items() for name in names}
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    elif name in _REEXPORTS:
+        value = getattr(importlib.import_module(_REEXPORTS[name], __name__), name)
+    elif name == 'Colors':
+        value = importlib.import_module('..styles', __name__).Colors()
+    elif name == '__all__':
+        # Computed on `import *` only, as it needs the style module
+        styles = importlib.import_module('..styles', __name__)
+        value = sorted(set(_MODULES) | set(_REEXPORTS) | {'Colors', 'config'}
+                       | {n for n in vars(styles) if not n.startswith('_')})
+    else:
+        value = getattr(importlib.import_module('..styles', __name__), name, None)
+        if value is None or name.startswith('_'):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES) | set(_REEXPORTS) | {'Colors'})
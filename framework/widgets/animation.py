@@ -0,0 +1,162 @@
+# framework/widgets/animation.py
+import html
+import json
+from collections import OrderedDict
+
+from ..base import Widget, style_field
+from ..styles import *
+from .layout import Container
+
+
+class ImplicitAnimation:
+    """
+    Remembers the animated values of keyed widgets between builds.
+
+    When a keyed animated widget renders values that differ from its previous build, it
+    emits a `data-pythra-animate` attribute with the old and new values. `main.js` plays it
+    with the Web Animations API once the patched element is in the page, so the whole
+    animation costs one message. Only transform and opacity are animated, so it runs on
+    the compositor thread; size changes are played as a scale transform (FLIP).
+
+    The values of the `max_keys` most recently built keys are remembered.
+    """
+    max_keys = 1024
+    _previous = OrderedDict()  # Widget key -> (values, size) of the last build
+
+    @classmethod
+    def attribute(cls, key, values, duration, curve, size=None):
+        """
+        Returns the animation attribute for a widget's values, and stores them for the next build.
+
+        Args:
+            key: The widget key identifying it across builds. Without a key nothing animates.
+            values (dict): 'transform' and/or 'opacity' mapped to their new values.
+            duration (int): The duration in milliseconds.
+            curve (str): A `Curves` value.
+            size (tuple, optional): The (width, height) in pixels. A change is played by
+                scaling the element from its previous size.
+
+        Returns:
+            str: The attribute, with a leading space, or an empty string.
+        """
+        if key is None:
+            return ''
+        previous = cls._previous.pop(key, None)
+        cls._previous[key] = (values, size)
+        if len(cls._previous) > cls.max_keys:
+            cls._previous.popitem(last=False)
+        if previous is None or not duration:
+            return ''
+        previous_values, previous_size = previous
+
+        start, end = {}, {}
+        for name, value in values.items():
+            if name in previous_values and previous_values[name] != value:
+                start[name], end[name] = previous_values[name], value
+        flip = cls._flip(previous_size, size)
+        if flip:
+            start['transform'] = f"{flip} {previous_values.get('transform') or ''}".strip()
+            end['transform'] = values.get('transform') or 'none'
+        if not start:
+            return ''
+        animation = {'from': start, 'to': end, 'duration': duration, 'easing': curve}
+        return f' data-pythra-animate="{html.escape(json.dumps(animation), quote=True)}"'
+
+    @staticmethod
+    def _flip(previous_size, size):
+        """Returns the transform showing an element of `size` at `previous_size`, or ''."""
+        if not previous_size or not size or previous_size == size:
+            return ''
+        parts = []
+        for old, new, axis in ((previous_size[0], size[0], 'X'), (previous_size[1], size[1], 'Y')):
+            if not isinstance(old, (int, float)) or not isinstance(new, (int, float)) or not new or old == new:
+                continue
+            # Scaled around the centre, then moved back so the top-left corner stays put
+            parts.append(f"translate{axis}({(old - new) / 2}px) scale{axis}({old / new})")
+        return ' '.join(parts)
+
+
+class AnimatedContainer(Container):
+    """
+    A Container that animates to its new size and transform when rebuilt.
+
+    Give it the same `key` in every build; the change from the previous build's values is
+    played in the page over `duration` milliseconds. A new width or height is laid out at
+    once and played as a scale from the previous size, so the content is scaled during the
+    animation. Other properties, such as color, padding and margin, change immediately.
+
+    Args:
+        key: Identifies the container across builds.
+        duration (int): The animation duration in milliseconds. Defaults to 300.
+        curve (str): A `Curves` value. Defaults to `Curves.EASE_IN_OUT`.
+        transform (str, optional): A CSS transform, e.g. 'translateX(40px) scale(1.2)'.
+        Other arguments are those of Container.
+    """
+    __slots__ = ('key', 'duration', 'curve')
+
+    def __init__(self, child=None, key=None, duration=300, curve=Curves.EASE_IN_OUT, transform=None, **kwargs):
+        super().__init__(child=child, transform=transform, **kwargs)
+        self.key = key
+        self.duration = duration
+        self.curve = curve
+
+    def animated_values(self):
+        """Returns the animated CSS properties of this build."""
+        return {'transform': self.transform} if self.transform else {}
+
+    def to_html(self):
+        child_html = self.child.to_html() if self.child else ''
+        foreground_class = f"foreground-{self.widget_id()}" if self.foregroundDecoration else ''
+        animate = ImplicitAnimation.attribute(
+            self.key, self.animated_values(), self.duration, self.curve, size=(self.width, self.height)
+        )
+        style = f' style="transform: {self.transform};"' if self.transform else ''
+        return f"""
+        <div id="{self.widget_id()}" class="{self.css_class} {foreground_class}"{style}{animate}>
+            {child_html}
+            <div class="foreground-overlay"></div>
+        </div>
+        """
+
+
+class AnimatedOpacity(Widget):
+    """
+    Fades its child to a new opacity when rebuilt.
+
+    Args:
+        child (Widget): The widget to fade.
+        opacity (float): The opacity between 0.0 and 1.0.
+        key: Identifies the widget across builds.
+        duration (int): The animation duration in milliseconds. Defaults to 300.
+        curve (str): A `Curves` value. Defaults to `Curves.EASE_IN_OUT`.
+    """
+    __slots__ = ('key', 'duration', 'curve', 'style_key', 'css_class')
+
+    shared_styles = {}  # Shared CSS for opacity values
+    _style_keys = {}
+    opacity = style_field(0)
+    child = property(Widget._first_child)
+
+    def __init__(self, child, opacity=1.0, key=None, duration=300, curve=Curves.EASE_IN_OUT):
+        super().__init__(widget_id=None)
+        self.key = key
+        self.duration = duration
+        self.curve = curve
+        self.style_key, self.css_class = AnimatedOpacity._intern_style((opacity,), 'shared-opacity')
+        if child:
+            self.add_child(child)
+
+    @staticmethod
+    def css_declarations(style_key):
+        """Returns the CSS declarations for an opacity style key."""
+        opacity, = style_key
+        return f"opacity: {opacity};"
+
+    def to_html(self):
+        child_html = self.child.to_html() if self.child else ''
+        animate = ImplicitAnimation.attribute(self.key, {'opacity': str(self.opacity)}, self.duration, self.curve)
+        return f"""
+        <div id="{self.widget_id()}" class="{self.css_class}"{animate}>
+            {child_html}
+        </div>
+        """
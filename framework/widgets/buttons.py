@@ -0,0 +1,285 @@
+# framework/widgets/buttons.py
+from ..api import Api
+from ..base import Widget
+from ..styles import *
+
+
+class TextButton(Widget):
+    shared_styles = {}  # Stores unique style definitions for shared CSS
+    _style_keys = {}    # Canonical style key tuples
+
+    def __init__(self, child, onPressed=None, style=None):
+        super().__init__(widget_id=None)
+        self.child = child
+        self.onPressed = onPressed
+        self.style = style or ButtonStyle()
+
+        # Generate a unique style key for deduplication
+        self.style_key = (
+            self.style,
+        )
+
+        # Reuse the shared class of an identical style; its rule is formatted only once
+        self.style_key, self.css_class = TextButton._intern_style(self.style_key, 'shared-textbutton')
+
+        # Register the child widget with the framework
+        self.add_child(self.child) if self.child else None
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for a text button style key.
+
+        Args:
+            style_key (tuple): The button's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        style, = style_key
+        return style.to_css() if style else ""
+
+    def to_css(self):
+        """Return the shared CSS rules for TextButton styles."""
+        return TextButton.shared_css()
+
+    def to_html(self):
+        self.to_js()
+        """Generate the HTML for the text button."""
+        button_id = self.widget_id()
+        on_click_attr = f'onclick="handleClick(\'{self.onPressed.__name__}\')"' if self.onPressed else ''
+        child_html = self.child.to_html() if self.child else ''
+        return f"""
+        <button id="{button_id}" class="{self.css_class}" {on_click_attr}>
+            {child_html}
+        </button>
+        """
+
+    def to_js(self):
+        """Generate JavaScript for the button."""
+        if self.onPressed:
+            # Register the callback in the framework's API
+            Api().register_callback(self.onPressed.__name__, self.onPressed)
+        return ""
+
+
+class ElevatedButton(Widget):
+    shared_styles = {}  # Shared CSS for buttons
+    _style_keys = {}    # Canonical style key tuples
+
+    def __init__(self, child, onPressed=None, style=None):
+        super().__init__(widget_id=None)
+        self.child = child
+        self.onPressed = onPressed
+        self.style = style or ButtonStyle()
+
+        # Generate a unique style key for deduplication
+        self.style_key = (
+            self.style.backgroundColor,
+            self.style.foregroundColor,
+            self.style.overlayColor,
+            self.style.shadowColor,
+            self.style.elevation,
+            self.style.padding,
+            self.style.minimumSize,
+            self.style.side,
+            self.style.shape,
+            self.style.textStyle,
+            self.style.alignment,
+            self.style.icon,
+        )
+
+        # Reuse the shared class of an identical style; its rule is formatted only once
+        self.style_key, self.css_class = ElevatedButton._intern_style(self.style_key, 'shared-elevatedbutton')
+
+        # Register the child widget
+        self.add_child(self.child) if self.child else None
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for an elevated button style key.
+
+        Args:
+            style_key (tuple): The button's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        return ButtonStyle(*style_key).to_css()  # Recreate ButtonStyle from the style key
+
+    def to_css(self):
+        """Return the shared CSS rules for ElevatedButton styles."""
+        return ElevatedButton.shared_css()
+
+    def to_html(self):
+        self.to_js()
+        """Generate the HTML for the ElevatedButton."""
+        button_id = self.widget_id()
+        on_click_attr = f'onclick="handleClick(\'{self.onPressed.__name__}\')"' if self.onPressed else ''
+        child_html = self.child.to_html() if self.child else ''
+        return f"""
+        <button id="{button_id}" class="{self.css_class}" {on_click_attr}>
+            {child_html}
+        </button>
+        """
+
+    def to_js(self):
+        """Generate JavaScript for the button."""
+        if self.onPressed:
+            Api().register_callback(self.onPressed.__name__, self.onPressed)
+        return ""
+
+
+class IconButton(Widget):
+    shared_styles = {}  # Shared CSS for IconButton styles
+    _style_keys = {}    # Canonical style key tuples
+
+    def __init__(self, icon, onPressed=None, iconSize=None, style=None):
+        super().__init__(widget_id=None)
+        self.child = icon
+        self.onPressed = onPressed
+        self.iconSize = iconSize or 16
+        self.style = style or ButtonStyle()
+
+        # Generate a unique style key for deduplication
+        self.style_key = (
+            self.style.backgroundColor,
+            self.style.foregroundColor,
+            self.style.overlayColor,
+            self.style.shadowColor,
+            self.style.elevation,
+            self.style.padding,
+            self.style.minimumSize,
+            self.style.side,
+            self.style.shape,
+            self.style.textStyle,
+            self.style.alignment,
+            self.style.icon,
+        )
+
+        # Reuse the shared class of an identical style; its rule is formatted only once
+        self.style_key, self.css_class = IconButton._intern_style(self.style_key, 'shared-iconbutton')
+
+        # Register the child widget
+        self.add_child(self.child) if self.child else None
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for an icon button style key.
+
+        Args:
+            style_key (tuple): The button's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        style = ButtonStyle(*style_key)  # Recreate ButtonStyle from the style key
+        return f"{style.to_css()} background-color: transparent;"
+
+    def to_css(self):
+        """Return the shared CSS rules for IconButton styles."""
+        return IconButton.shared_css()
+
+    def to_html(self):
+        self.to_js()
+        self.child.size = self.iconSize if self.iconSize and isinstance(self.child, Widget) else 16
+
+        """Generate the HTML for the IconButton."""
+        button_id = self.widget_id()
+        on_click_attr = f'onclick="handleClick(\'{self.onPressed.__name__}\')"' if self.onPressed else ''
+        child_html = self.child.to_html() if isinstance(self.child, Widget) else self.child
+
+        return f"""
+        <button id="{button_id}" class="{self.css_class}" {on_click_attr}>
+            {child_html}
+        </button>
+        """
+
+    def to_js(self):
+        """Generate JavaScript for the button."""
+        if self.onPressed:
+            Api().register_callback(self.onPressed.__name__, self.onPressed)
+        return ""
+
+
+class FloatingActionButton(Widget):
+    shared_styles = {}  # Shared CSS for FloatingActionButton styles
+    _style_keys = {}    # Canonical style key tuples
+
+    def __init__(self, child=None, onPressed=None, key=None, style=None):
+        super().__init__(widget_id=None)
+        self.child = child
+        self.onPressed = onPressed
+        self.key = key
+        self.style = style or ButtonStyle()
+
+        # Generate a unique style key for deduplication
+        self.style_key = (
+            self.style.backgroundColor,
+            self.style.foregroundColor,
+            self.style.shadowColor,
+            self.style.elevation,
+            self.style.padding,
+            self.style.shape,
+        )
+
+        # Reuse the shared class of an identical style; its rule is formatted only once
+        self.style_key, self.css_class = FloatingActionButton._intern_style(self.style_key, 'shared-fab')
+
+        # Register the child widget
+        self.add_child(self.child) if self.child else None
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for a floating action button style key.
+
+        Args:
+            style_key (tuple): The button's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        backgroundColor, foregroundColor, shadowColor, elevation, padding, shape = style_key
+        style = ButtonStyle(backgroundColor=backgroundColor, foregroundColor=foregroundColor, shadowColor=shadowColor,
+                            elevation=elevation, padding=padding, shape=shape)
+        return f"""
+                {style.to_css()}
+                position: fixed;
+                bottom: 16px;
+                right: 16px;
+                border-radius: 50%;
+                width: 56px;
+                height: 56px;
+                display: flex;
+                justify-content: center;
+                align-items: center;
+                box-shadow: 0 2px 10px rgba(0,0,0,0.2);
+        """
+
+    def to_css(self):
+        """Return the shared CSS rules for FloatingActionButton styles."""
+        return FloatingActionButton.shared_css()
+
+    def to_html(self):
+        self.to_js()
+        """Generate the HTML for the FloatingActionButton."""
+        button_id = self.widget_id()
+        on_click_attr = f'onclick="handleClick(\'{self.onPressed.__name__}\')"' if self.onPressed else ''
+        child_html = self.child.to_html() if isinstance(self.child, Widget) else self.child or ""
+
+        return f"""
+        <button id="{button_id}" class="{self.css_class}" {on_click_attr}>
+            {child_html}
+        </button>
+        """
+
+    def to_js(self):
+        """Generate JavaScript for the button."""
+        if self.onPressed:
+            Api().register_callback(self.onPressed.__name__, self.onPressed)
+        return ""
+
+ 
@@ -0,0 +1,281 @@
+# framework/widgets/data_table.py
+import bisect
+import html
+import json
+
+from ..api import Api
+from ..base import Widget
+from ..styles import *
+
+try:
+    import numpy as np
+except ImportError:  # Optional: DataTable falls back to Python lists
+    np = None
+
+
+class DataColumn:
+    """
+    One column of a DataTable.
+
+    Args:
+        label (str): The header text.
+        values (sequence): The column values; converted to a NumPy array when NumPy is installed.
+        width (int): The column width in pixels. Defaults to 120.
+        format (callable, optional): Converts a value to its cell text. Defaults to `str`.
+        numeric (bool, optional): Right-aligns the cells. Detected from the values when omitted.
+    """
+
+    def __init__(self, label, values, width=120, format=None, numeric=None):
+        self.label = label
+        self.values = np.asarray(values) if np is not None else list(values)
+        self.width = width
+        self.format = format or str
+        if numeric is None:
+            numeric = np is not None and np.issubdtype(self.values.dtype, np.number)
+        self.numeric = numeric
+
+    def __len__(self):
+        return len(self.values)
+
+
+class DataTable(Widget):
+    """
+    A table for large columnar data, virtualized in both directions.
+
+    Only the rows and columns inside the viewport (plus `overscan` rows) are formatted and
+    rendered. Sorting and filtering work on index arrays with vectorized NumPy operations
+    (with a Python fallback when NumPy is missing) and then patch only the visible window.
+    Scrolling and the viewport size (observed from the moment the table is mounted, and
+    after every resize) are reported through the event channel once per frame, and the
+    window is re-rendered only when the visible range changes.
+
+    Keep the table in your State and return the same instance from `build()` to preserve
+    its sort order, filter and scroll position across rebuilds.
+
+    Args:
+        columns (list): The DataColumn objects.
+        height (int): The viewport height in pixels. Defaults to 400.
+        width (int, optional): The viewport width in pixels. Defaults to the full width.
+        rowHeight (int): The height of each row in pixels. Defaults to 32.
+        headerHeight (int): The height of the header row in pixels. Defaults to 36.
+        overscan (int): Extra rows rendered above and below the viewport. Defaults to 5.
+        onRowTap (callable, optional): Called with the data index of a tapped row.
+        sortable (bool): Sorts by a column when its header is tapped. Defaults to True.
+    """
+    shared_styles = {}  # Shared CSS for DataTable viewports
+    _style_keys = {}
+
+    base_css = (
+        ".pythra-dt-header { position: sticky; top: 0; z-index: 1; background: #f5f5f5; border-bottom: 1px solid #ddd; }"
+        ".pythra-dt-row { position: absolute; left: 0; border-bottom: 1px solid #eee; }"
+        ".pythra-dt-row:hover { background: #fafafa; }"
+        ".pythra-dt-cell { position: absolute; top: 0; height: 100%; padding: 0 8px; box-sizing: border-box; overflow: hidden;"
+        " white-space: nowrap; text-overflow: ellipsis; display: flex; align-items: center; }"
+        ".pythra-dt-numeric { justify-content: flex-end; font-variant-numeric: tabular-nums; }"
+        ".pythra-dt-header .pythra-dt-cell { font-weight: bold; cursor: pointer; user-select: none; }"
+    )
+
+    def __init__(self, columns, height=400, width=None, rowHeight=32, headerHeight=36, overscan=5, onRowTap=None, sortable=True):
+        super().__init__(widget_id=None)
+        self.columns = list(columns)
+        self.rowHeight = rowHeight
+        self.headerHeight = headerHeight
+        self.overscan = overscan
+        self.onRowTap = onRowTap
+        self.sortable = sortable
+        self.style_key, self.css_class = DataTable._intern_style((height, width), 'shared-datatable')
+
+        row_count = len(self.columns[0]) if self.columns else 0
+        self._rows = np.arange(row_count) if np is not None else list(range(row_count))  # Filtered, unsorted
+        self._order = self._rows  # Filtered and sorted
+        self._sort = None  # (column index, ascending)
+        self._offsets = [0]
+        for column in self.columns:
+            self._offsets.append(self._offsets[-1] + column.width)
+
+        # Viewport state, updated by scroll and resize events
+        self._scroll_top = 0
+        self._scroll_left = 0
+        self._viewport_height = height
+        self._viewport_width = width or 1200  # Until the page reports the real width
+        self._window = None
+
+    @staticmethod
+    def css_declarations(style_key):
+        """Returns the CSS declarations for a table viewport style key."""
+        height, width = style_key
+        return (
+            f"height: {height}px; {f'width: {width}px;' if width else 'width: 100%;'}"
+            "overflow: auto; position: relative; box-sizing: border-box;"
+        )
+
+    def _callback_name(self, action):
+        return f"__datatable_{self.widget_id()}_{action}"
+
+    def row_count(self):
+        """Returns the number of rows after filtering."""
+        return len(self._order)
+
+    def column(self, label):
+        """Returns the values of the column with the given label."""
+        for column in self.columns:
+            if column.label == label:
+                return column.values
+        raise KeyError(label)
+
+    def sort(self, column_index, ascending=True):
+        """
+        Sorts the rows by one column and patches the visible window.
+
+        Args:
+            column_index (int): The index of the column to sort by.
+            ascending (bool): The sort direction. Defaults to True.
+        """
+        values = self.columns[column_index].values
+        if np is not None:
+            order = self._rows[np.argsort(values[self._rows], kind='stable')]
+            self._order = order if ascending else order[::-1]
+        else:
+            self._order = sorted(self._rows, key=values.__getitem__, reverse=not ascending)
+        self._sort = (column_index, ascending)
+        self.refresh()
+
+    def filter(self, label=None, predicate=None):
+        """
+        Keeps only the rows where `predicate` holds for a column, keeping the current sort.
+
+        With NumPy, the predicate receives the whole column array and returns a boolean mask
+        (e.g. `lambda price: price > 10`); without it, it is called once per value.
+        Call without arguments to remove the filter.
+
+        Args:
+            label (str, optional): The column to filter on.
+            predicate (callable, optional): Returns whether a row is kept.
+        """
+        row_count = len(self.columns[0]) if self.columns else 0
+        if label is None or predicate is None:
+            self._rows = np.arange(row_count) if np is not None else list(range(row_count))
+        elif np is not None:
+            self._rows = np.flatnonzero(np.asarray(predicate(self.column(label)), dtype=bool))
+        else:
+            values = self.column(label)
+            self._rows = [index for index in range(row_count) if predicate(values[index])]
+        self._order = self._rows
+        if self._sort:
+            self.sort(*self._sort)
+        else:
+            self.refresh()
+
+    def _visible_window(self):
+        """Returns the (first row, last row, first column, last column) inside the viewport."""
+        first_row = max(0, int(self._scroll_top // self.rowHeight) - self.overscan)
+        visible_rows = int(self._viewport_height // self.rowHeight) + 1
+        last_row = min(self.row_count(), first_row + visible_rows + 2 * self.overscan)
+
+        left = self._scroll_left
+        right = left + self._viewport_width
+        first_col = min(max(0, bisect.bisect_right(self._offsets, left) - 1), max(0, len(self.columns) - 1))
+        last_col = min(bisect.bisect_left(self._offsets, right), len(self.columns))
+        return first_row, last_row, first_col, last_col
+
+    def _header_html(self, first_col, last_col):
+        cells = []
+        for index in range(first_col, last_col):
+            column = self.columns[index]
+            marker = ''
+            if self._sort and self._sort[0] == index:
+                marker = ' &#9650;' if self._sort[1] else ' &#9660;'
+            numeric = ' pythra-dt-numeric' if column.numeric else ''
+            on_click = f' onclick="handleClickOnTap(\'{self._callback_name("sort")}\', {index})"' if self.sortable else ''
+            cells.append(
+                f'<div class="pythra-dt-cell{numeric}" style="left: {self._offsets[index]}px; width: {column.width}px;"{on_click}>'
+                f'{html.escape(str(column.label))}{marker}</div>'
+            )
+        return ''.join(cells)
+
+    def _rows_html(self, first_row, last_row, first_col, last_col):
+        width = self._offsets[-1]
+        rows = []
+        on_tap = self._callback_name('tap')
+        for position in range(first_row, last_row):
+            data_index = int(self._order[position])
+            cells = []
+            for index in range(first_col, last_col):
+                column = self.columns[index]
+                numeric = ' pythra-dt-numeric' if column.numeric else ''
+                text = html.escape(column.format(column.values[data_index]))
+                cells.append(
+                    f'<div class="pythra-dt-cell{numeric}" style="left: {self._offsets[index]}px; width: {column.width}px;">{text}</div>'
+                )
+            on_click = f' onclick="handleClickOnTap(\'{on_tap}\', {data_index})"' if self.onRowTap else ''
+            rows.append(
+                f'<div class="pythra-dt-row" style="top: {position * self.rowHeight}px; height: {self.rowHeight}px; width: {width}px;"{on_click}>'
+                f'{"".join(cells)}</div>'
+            )
+        return ''.join(rows)
+
+    def _on_scroll(self, data):
+        self._scroll_top = data.get('scrollTop', 0)
+        self._scroll_left = data.get('scrollLeft', 0)
+        self._viewport_height = data.get('clientHeight') or self._viewport_height
+        self._viewport_width = data.get('clientWidth') or self._viewport_width
+        if self._visible_window() != self._window:
+            self.refresh()
+
+    def _on_resize(self, data):
+        self._viewport_height = data.get('height') or self._viewport_height
+        self._viewport_width = data.get('width') or self._viewport_width
+        if self._visible_window() != self._window:
+            self.refresh()
+
+    def _on_header_tap(self, index):
+        ascending = not (self._sort and self._sort[0] == index and self._sort[1])
+        self.sort(index, ascending)
+
+    def _on_row_tap(self, data_index):
+        if self.onRowTap:
+            self.onRowTap(data_index)
+
+    def refresh(self):
+        """Re-renders only the header and the visible rows in the page."""
+        framework = Widget._framework_ref() if Widget._framework_ref else None
+        window = getattr(framework, 'window', None)
+        if not window:
+            return
+        self._window = first_row, last_row, first_col, last_col = self._visible_window()
+        table_id = self.widget_id()
+        script = (
+            f"var header = document.getElementById('{table_id}-header');"
+            f"if (header) header.innerHTML = {json.dumps(self._header_html(first_col, last_col))};"
+            f"var body = document.getElementById('{table_id}-body');"
+            f"if (body) {{ body.style.height = '{self.row_count() * self.rowHeight}px';"
+            f"body.innerHTML = {json.dumps(self._rows_html(first_row, last_row, first_col, last_col))}; }}"
+        )
+        window.evaluate_js(framework.id, script)
+
+    def to_js(self):
+        """Register the scroll, resize, sort and row callbacks in the framework's API."""
+        api = Api()
+        api.register_callback(self._callback_name('scroll'), self._on_scroll)
+        api.register_callback(self._callback_name('resize'), self._on_resize)
+        api.register_callback(self._callback_name('sort'), self._on_header_tap)
+        api.register_callback(self._callback_name('tap'), self._on_row_tap)
+        return ""
+
+    def to_html(self):
+        self.to_js()
+        self._window = first_row, last_row, first_col, last_col = self._visible_window()
+        table_id = self.widget_id()
+        width = self._offsets[-1]
+        events = html.escape(json.dumps({
+            'scroll': {'callback': self._callback_name('scroll'), 'policy': EventPolicy.RAF, 'interval': 0},
+            # Observed from the mount, so the first report carries the real viewport size
+            'resize': {'callback': self._callback_name('resize'), 'policy': EventPolicy.RAF, 'interval': 0},
+        }), quote=True)
+        return f"""
+        <div id="{table_id}" class="{self.css_class}" data-pythra-events="{events}">
+            <style>{DataTable.base_css}</style>
+            <div id="{table_id}-header" class="pythra-dt-header" style="height: {self.headerHeight}px; width: {width}px;">{self._header_html(first_col, last_col)}</div>
+            <div id="{table_id}-body" style="position: relative; height: {self.row_count() * self.rowHeight}px; width: {width}px;">{self._rows_html(first_row, last_row, first_col, last_col)}</div>
+        </div>
+        """
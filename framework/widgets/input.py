@@ -0,0 +1,321 @@
+# framework/widgets/input.py
+import html
+import json
+
+from ..api import Api
+from ..base import Widget
+from ..styles import *
+
+
+class EventListener(Widget):
+    """
+    Subscribes to continuous DOM events on its child's subtree.
+
+    Scroll, pointer move, resize and input events are sampled in the page according to
+    `policy` and delivered in batches, at most once per animation frame, to the callbacks.
+    Each callback receives a dict with the event data:
+
+    - onScroll: scrollTop, scrollLeft, scrollHeight, scrollWidth, clientHeight, clientWidth
+    - onPointerMove: x, y (relative to the element), buttons
+    - onResize: width, height
+    - onInput: value, targetId
+
+    Args:
+        child (Widget): The widget whose events are observed.
+        onScroll (callable, optional): Called with scroll positions.
+        onPointerMove (callable, optional): Called with pointer positions.
+        onResize (callable, optional): Called with the element's size.
+        onInput (callable, optional): Called with the value of an input inside the child.
+        policy (str): An `EventPolicy` value. Defaults to `EventPolicy.RAF`.
+        interval (int): The interval in milliseconds for throttle and debounce. Defaults to 100.
+    """
+
+    def __init__(self, child, onScroll=None, onPointerMove=None, onResize=None, onInput=None, policy=EventPolicy.RAF, interval=100):
+        super().__init__(widget_id=None)
+        self.child = child
+        self.onScroll = onScroll
+        self.onPointerMove = onPointerMove
+        self.onResize = onResize
+        self.onInput = onInput
+        self.policy = policy
+        self.interval = interval
+
+        self.add_child(self.child) if self.child else None
+
+    def subscriptions(self):
+        """Returns the event subscriptions as a dict of event type -> callback and policy."""
+        handlers = {
+            'scroll': self.onScroll,
+            'pointermove': self.onPointerMove,
+            'resize': self.onResize,
+            'input': self.onInput,
+        }
+        return {
+            event_type: {'callback': handler.__name__, 'policy': self.policy, 'interval': self.interval}
+            for event_type, handler in handlers.items() if handler
+        }
+
+    def to_js(self):
+        """Register the event callbacks in the framework's API."""
+        for handler in (self.onScroll, self.onPointerMove, self.onResize, self.onInput):
+            if handler:
+                Api().register_callback(handler.__name__, handler)
+        return ""
+
+    def to_html(self):
+        self.to_js()
+        events = html.escape(json.dumps(self.subscriptions()), quote=True)
+        child_html = self.child.to_html() if self.child else ''
+        return f"""
+        <div id="{self.widget_id()}" class="pythra-events" data-pythra-events="{events}">
+            {child_html}
+        </div>
+        """
+
+
+class TextEditingController:
+    """
+    Holds the value of a TextField between rebuilds.
+
+    The text being typed lives in the page; it is synced to the controller after a pause
+    in typing, on blur, on submit, or on an explicit `read()`. Setting `text` updates the
+    field in place without rebuilding any State.
+
+    Keep the controller in your State, or give the TextField a `key` to get a controller
+    kept for that key. Call `dispose()` on a controller you stop using.
+
+    Attributes:
+        id (str): A stable identifier linking the controller to its input element.
+        listeners (list): Functions called with the new value after every sync.
+        error (str): The validation message shown below the field, or None.
+    """
+    _count = 0
+    _keyed = {}  # TextField key -> controller
+
+    def __init__(self, text=''):
+        TextEditingController._count += 1
+        self.id = f"text-controller-{TextEditingController._count}"
+        self.listeners = []
+        self.error = None
+        self._text = text
+        self._field = None  # The TextField currently rendering this controller
+
+    @classmethod
+    def keyed(cls, key, controller=None):
+        """
+        Returns the controller kept for a TextField key, creating it on first use.
+
+        Args:
+            key: The TextField key.
+            controller (TextEditingController, optional): Replaces the kept controller,
+                which is disposed.
+
+        Returns:
+            TextEditingController: The controller for the key.
+        """
+        current = cls._keyed.get(key)
+        if controller is None:
+            controller = current or cls()
+        elif current is not None and current is not controller:
+            current.dispose()
+        cls._keyed[key] = controller
+        return controller
+
+    def dispose(self):
+        """Unregisters the sync callback and forgets the field and the key of this controller."""
+        Api().unregister_callback(self.sync_callback_name())
+        self._field = None
+        for key, controller in list(TextEditingController._keyed.items()):
+            if controller is self:
+                del TextEditingController._keyed[key]
+
+    def sync_callback_name(self):
+        """Returns the name of the API callback receiving synced values."""
+        return f"__sync_{self.id.replace('-', '_')}"
+
+    @property
+    def text(self):
+        """str: The value as of the last sync."""
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+        self._run_js(
+            f"var field = document.querySelector('[data-pythra-controller=\"{self.id}\"]');"
+            f"if (field) {{ field.value = {json.dumps(value)}; field._pythraSynced = field.value; }}"
+        )
+
+    def clear(self):
+        """Empties the field."""
+        self.text = ''
+
+    def add_listener(self, listener):
+        """Adds a function called with the new value after every sync."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Removes a listener added with `add_listener`."""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def read(self, callback=None):
+        """
+        Reads the current value straight from the page, including unsynced typing.
+
+        Args:
+            callback (callable, optional): Called with the value once it has been read.
+        """
+        def on_result(value):
+            if value is not None:
+                self._sync({'value': value, 'reason': 'read'})
+            if callback:
+                callback(self._text)
+
+        self._run_js(
+            f"(function() {{ var field = document.querySelector('[data-pythra-controller=\"{self.id}\"]');"
+            f"return field ? field.value : null; }})()",
+            callback=on_result,
+        )
+
+    def _run_js(self, script, callback=None):
+        framework = Widget._framework_ref() if Widget._framework_ref else None
+        window = getattr(framework, 'window', None)
+        if window:
+            window.evaluate_js(framework.id, script, callback=callback)
+        elif callback:
+            callback(None)
+
+    def _sync(self, data):
+        """Receives a value from the page and runs the field's formatting and validation hooks."""
+        value = data.get('value', '')
+        reason = data.get('reason')
+        field = self._field
+
+        if field and field.inputFormatter:
+            formatted = field.inputFormatter(value)
+            if formatted != value:
+                # Only replace the text if the user has not typed on since this sync
+                self._run_js(
+                    f"var field = document.querySelector('[data-pythra-controller=\"{self.id}\"]');"
+                    f"if (field && field.value === {json.dumps(value)}) {{ field.value = {json.dumps(formatted)}; field._pythraSynced = field.value; }}"
+                )
+                value = formatted
+
+        changed = value != self._text
+        self._text = value
+
+        if field and field.validator:
+            field.show_error(field.validator(value))
+
+        if changed:
+            for listener in list(self.listeners):
+                listener(value)
+            if field and field.onChanged:
+                field.onChanged(value)
+        if reason == 'submit' and field and field.onSubmitted:
+            field.onSubmitted(value)
+
+
+class TextField(Widget):
+    """
+    A text input whose value is buffered in the page.
+
+    Keystrokes never reach Python: the value is sent through the event channel after
+    `syncDelay` milliseconds without typing, when the field loses focus, or when Enter is
+    pressed. The hooks then run in Python without rebuilding the surrounding State;
+    `validator` errors are patched into the field's error element only, and kept by the
+    controller so a rebuilt field still shows them.
+
+    A field needs a `controller` or a `key`: a field created by every `build()` would
+    otherwise start empty each time.
+
+    Args:
+        controller (TextEditingController, optional): Holds the value across rebuilds.
+        key (optional): Identifies the field across rebuilds; the controller kept for the
+            key is used (or replaced by `controller`, when both are given).
+        placeholder (str, optional): Hint shown while the field is empty.
+        onChanged (callable, optional): Called with the value after a sync that changed it.
+        onSubmitted (callable, optional): Called with the value when Enter is pressed.
+        validator (callable, optional): Returns an error message for a value, or None.
+        inputFormatter (callable, optional): Returns the formatted value; the field is updated if it differs.
+        obscureText (bool): Renders a password field. Defaults to False.
+        enabled (bool): Whether the field accepts input. Defaults to True.
+        maxLength (int, optional): The maximum number of characters.
+        width (int, optional): The width in pixels.
+        style (TextStyle, optional): The text style of the input.
+        syncDelay (int): Milliseconds without typing before the value is synced. Defaults to 300.
+    """
+    shared_styles = {}  # Shared CSS for TextField styles
+    _style_keys = {}
+
+    def __init__(self, controller=None, key=None, placeholder=None, onChanged=None, onSubmitted=None, validator=None,
+                 inputFormatter=None, obscureText=False, enabled=True, maxLength=None, width=None, style=None,
+                 syncDelay=300):
+        super().__init__(widget_id=None)
+        if key is not None:
+            controller = TextEditingController.keyed(key, controller)
+        elif controller is None:
+            raise ValueError("TextField needs a controller or a key to keep its value across rebuilds")
+        self.controller = controller
+        self.key = key
+        self.placeholder = placeholder
+        self.onChanged = onChanged
+        self.onSubmitted = onSubmitted
+        self.validator = validator
+        self.inputFormatter = inputFormatter
+        self.obscureText = obscureText
+        self.enabled = enabled
+        self.maxLength = maxLength
+        self.syncDelay = syncDelay
+
+        self.style_key, self.css_class = TextField._intern_style((width, style), 'shared-textfield')
+
+    @staticmethod
+    def css_declarations(style_key):
+        """Returns the CSS declarations for a text field style key."""
+        width, style = style_key
+        return (
+            f"{f'width: {width}px;' if width else ''}"
+            f"{style.to_css() if style else ''}"
+            "box-sizing: border-box;"
+        )
+
+    def error_id(self):
+        """Returns the DOM ID of the element showing validation errors."""
+        return f"{self.controller.id}-error"
+
+    def show_error(self, message):
+        """Shows a validation message below the field, or hides it when `message` is empty."""
+        self.controller.error = message or None
+        self.controller._run_js(
+            f"var error = document.getElementById('{self.error_id()}');"
+            f"if (error) {{ error.textContent = {json.dumps(message or '')}; error.hidden = {json.dumps(not message)}; }}"
+            f"var field = document.querySelector('[data-pythra-controller=\"{self.controller.id}\"]');"
+            f"if (field) {{ field.setAttribute('aria-invalid', {json.dumps('true' if message else 'false')}); }}"
+        )
+
+    def to_html(self):
+        # The latest widget supplies the hooks used by the controller's syncs
+        self.controller._field = self
+        Api().register_callback(self.controller.sync_callback_name(), self.controller._sync)
+        sync = html.escape(json.dumps({'callback': self.controller.sync_callback_name(), 'delay': self.syncDelay}), quote=True)
+        attributes = [
+            f'type="{"password" if self.obscureText else "text"}"',
+            f'value="{html.escape(self.controller.text or "", quote=True)}"',
+        ]
+        if self.placeholder:
+            attributes.append(f'placeholder="{html.escape(self.placeholder, quote=True)}"')
+        if self.maxLength:
+            attributes.append(f'maxlength="{self.maxLength}"')
+        if not self.enabled:
+            attributes.append('disabled')
+        error = self.controller.error if self.validator else None
+        if error:
+            attributes.append('aria-invalid="true"')
+        return f"""
+        <div id="{self.widget_id()}" class="pythra-textfield">
+            <input class="{self.css_class}" data-pythra-controller="{self.controller.id}" data-pythra-sync="{sync}" {' '.join(attributes)}>
+            <div id="{self.error_id()}" class="pythra-textfield-error"{'' if error else ' hidden'}>{html.escape(error or '')}</div>
+        </div>
+        """
@@ -0,0 +1,790 @@
+# framework/widgets/layout.py
+import logging
+
+from ..base import Widget, style_field
+from ..config import config
+from ..styles import *
+
+logger = logging.getLogger(__name__)
+
+Colors = Colors()
+
+
+def containment_css(containment, child=None, width=None, height=None, axis=None):
+    """
+    Returns the containment declarations for a subtree, or '' when they are turned off or
+    its size is unknown.
+
+    A skipped subtree is laid out at its placeholder size, so the hints are only emitted
+    when that size is real: along `axis`, it comes from `width`/`height` (e.g. a list's
+    `itemExtent`), then from the dimensions of a SizedBox or Container at the subtree's
+    root, then from the `Containment` itself. Without an axis, the element is sized by its
+    own style (grid cells, drawers) and the hints are always emitted.
+
+    Args:
+        containment: A `Containment`, True for the default hints, False for none, or None
+            to follow `containment` in the config.
+        child (Widget, optional): The root widget of the subtree.
+        width (int, optional): The known width of the subtree in pixels.
+        height (int, optional): The known height of the subtree in pixels.
+        axis (str, optional): The `Axis` along which the subtree takes the size of its
+            content, e.g. the scroll direction of a list.
+
+    Returns:
+        str: The CSS declarations.
+    """
+    if containment is None:
+        containment = config.get('containment', True)
+    if not containment:
+        return ''
+    if containment is True:
+        containment = Containment()
+    if isinstance(child, (SizedBox, Container)):
+        width = width or child.width or None
+        height = height or child.height or None
+    if axis == Axis.VERTICAL and not (height or containment.intrinsicHeight):
+        return ''
+    if axis == Axis.HORIZONTAL and not (width or containment.intrinsicWidth):
+        return ''
+    return containment.to_css(width, height)
+
+
+class Container(Widget):
+    __slots__ = ('foregroundDecoration', 'constraints', 'transform', 'style_key', 'css_class')
+
+    shared_styles = {}  # Stores unique style definitions for shared CSS
+    _style_keys = {}    # Canonical style key tuples, shared by all containers with the same style
+    shared_js = set()   # Tracks JS logic for optimization
+
+    # Style values live in the interned style key rather than on each instance
+    padding = style_field(0)
+    color = style_field(1)
+    decoration = style_field(2)
+    width = style_field(3)
+    height = style_field(4)
+    margin = style_field(5)
+    alignment = style_field(6)
+    clipBehavior = style_field(7)
+    child = property(Widget._first_child)
+
+    def __init__(self, child=None, padding=None, color=None, decoration=None, 
+                 foregroundDecoration=None, width=None, height=None, 
+                 constraints=None, margin=None, transform=None, alignment=None, 
+                 clipBehavior=None):
+        super().__init__(widget_id=None)
+        self.foregroundDecoration = foregroundDecoration
+        self.constraints = constraints
+        self.transform = transform
+
+        # Generate a unique style key for deduplication and reuse the shared class
+        self.style_key, self.css_class = Container._intern_style((
+            padding,
+            color,
+            decoration,
+            width,
+            height,
+            margin,
+            alignment,
+            clipBehavior,
+        ), 'shared-container')
+
+        # Register the child widget with the framework
+        if child:
+            self.add_child(child)
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for a container style key.
+
+        Used both for the shared per-key rule and, with the atomic style backend, to
+        compile the style into atomic classes.
+
+        Args:
+            style_key (tuple): The container's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        padding, color, decoration, width, height, margin, alignment, clipBehavior = style_key
+
+        padding_str = f'padding: {padding.to_css()};' if hasattr(padding, 'to_css') else (f'padding: {padding};' if padding else '')
+        margin_str = f'margin: {margin.to_css()};' if hasattr(margin, 'to_css') else (f'margin: {margin};' if margin else '')
+        width_str = f'width: {width}px;' if width is not None else ''
+        height_str = f'height: {height}px;' if height is not None else ''
+        color_str = f'background-color: {color};' if color else ''
+        decoration_str = decoration.to_css() if hasattr(decoration, 'to_css') else ''
+        clip_str = f'overflow: hidden;' if clipBehavior else '' # Assuming bool or similar
+        alignment_str = alignment.to_css() if hasattr(alignment, 'to_css') else ''
+
+        return f"""
+                position: relative;
+                {padding_str}
+                {margin_str}
+                {width_str}
+                {height_str}
+                {color_str}
+                {decoration_str}
+                {alignment_str}
+                {clip_str}
+                box-sizing: border-box;
+        """
+
+    def to_css(self):
+        """Return the shared CSS rules for the container's styles."""
+        return Container.shared_css()
+
+    def to_html(self):
+        # Make sure no self.to_css() call is here
+        child_html = self.child.to_html() if self.child else ''
+        foreground_class = f"foreground-{self.widget_id()}" if self.foregroundDecoration else ''
+
+        # Ensure the self.css_class derived in __init__ is used
+        if not getattr(self, 'css_class', None):
+            # Fallback or error handling if css_class wasn't set (shouldn't happen)
+            logger.warning("Container %s missing css_class.", self.widget_id())
+            effective_css_class = ""
+        else:
+            effective_css_class = self.css_class
+
+        return f"""
+        <div id="{self.widget_id()}" class="{effective_css_class} {foreground_class}">
+            {child_html}
+            <div class="foreground-overlay"></div>
+        </div>
+        """
+
+    def to_js(self):
+        """Generate JavaScript for the container."""
+        # Add shared JS logic if not already added
+        if "click_logger" not in Container.shared_js:
+            Container.shared_js.add("click_logger")
+            return """
+            document.querySelectorAll('.container').forEach(function(element) {
+                element.addEventListener('click', function() {
+                    console.log("Container clicked: " + element.id);
+                });
+            });
+            """
+        return ""  # No additional JS for already shared logic
+
+    def generate_foreground_css(self):
+        """Generate CSS for the foregroundDecoration."""
+        if not self.foregroundDecoration:
+            return ""
+        foreground_css = self.foregroundDecoration.to_css()
+        return f"""
+        .foreground-{self.widget_id()} .foreground-overlay {{
+            {foreground_css}
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            bottom: 0;
+            pointer-events: none;
+        }}
+        """
+
+
+class Column(Widget):
+    __slots__ = ('key', 'style_key', 'css_class')
+
+    shared_styles = {}  # Shared CSS for Column styles
+    _style_keys = {}    # Canonical style key tuples
+
+    mainAxisAlignment = style_field(0)
+    mainAxisSize = style_field(1)
+    crossAxisAlignment = style_field(2)
+    textDirection = style_field(3)
+    verticalDirection = style_field(4)
+    textBaseline = style_field(5)
+    children = property(Widget.get_children)
+
+    def __init__(self, children=None, key=None, mainAxisAlignment=MainAxisAlignment.START, mainAxisSize=MainAxisSize.MAX, crossAxisAlignment=CrossAxisAlignment.CENTER, textDirection=TextDirection.LTR, verticalDirection=VerticalDirection.DOWN, textBaseline=TextBaseline.alphabetic):
+        super().__init__(widget_id=None)
+        self.key = key
+
+        # Generate a unique style key for deduplication and reuse the shared class
+        self.style_key, self.css_class = Column._intern_style((
+            mainAxisAlignment,
+            mainAxisSize,
+            crossAxisAlignment,
+            textDirection,
+            verticalDirection,
+            textBaseline,
+        ), 'shared-column')
+
+        # Add children widgets in one step (empty entries are skipped)
+        self.set_children(children or ())
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for a column style key.
+
+        Args:
+            style_key (tuple): The column's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        (
+            mainAxisAlignment,
+            mainAxisSize,
+            crossAxisAlignment,
+            textDirection,
+            verticalDirection,
+            textBaseline,
+        ) = style_key
+
+        styles = (
+            f"display: flex; "
+            f"flex-direction: column; "
+            f"justify-content: {mainAxisAlignment}; "
+            f"align-items: {crossAxisAlignment}; "
+            f"direction: {textDirection}; "
+            f"vertical-align: {textBaseline};"
+        )
+        if mainAxisSize == 'min':
+            styles += "height: auto;"
+        elif mainAxisSize == 'max':
+            styles += "width: 100%;"
+        return styles
+
+    def to_css(self):
+        """Return the shared CSS rules for Column styles."""
+        return Column.shared_css()
+
+    def to_html(self):
+        """Generate HTML for the Column widget."""
+        children_html = ''.join([child.to_html() for child in self.children])
+
+        return f"<div id='{self.widget_id()}' class='{self.css_class}'>{children_html}</div>"
+
+
+class Row(Widget):
+    __slots__ = ('key', 'style_key', 'css_class')
+
+    shared_styles = {}  # Shared CSS for Row styles
+    _style_keys = {}    # Canonical style key tuples
+
+    mainAxisAlignment = style_field(0)
+    mainAxisSize = style_field(1)
+    crossAxisAlignment = style_field(2)
+    textDirection = style_field(3)
+    verticalDirection = style_field(4)
+    textBaseline = style_field(5)
+    children = property(Widget.get_children)
+
+    def __init__(self, children=None, key=None, mainAxisAlignment=MainAxisAlignment.START, mainAxisSize=MainAxisSize.MAX, crossAxisAlignment=CrossAxisAlignment.CENTER, textDirection=TextDirection.LTR, verticalDirection=VerticalDirection.DOWN, textBaseline=TextBaseline.alphabetic):
+        super().__init__(widget_id=None)
+        self.key = key
+
+        # Generate a unique style key for deduplication and reuse the shared class
+        self.style_key, self.css_class = Row._intern_style((
+            mainAxisAlignment,
+            mainAxisSize,
+            crossAxisAlignment,
+            textDirection,
+            verticalDirection,
+            textBaseline,
+        ), 'shared-row')
+
+        # Add children widgets in one step (empty entries are skipped)
+        self.set_children(children or ())
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for a row style key.
+
+        Args:
+            style_key (tuple): The row's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        (
+            mainAxisAlignment,
+            mainAxisSize,
+            crossAxisAlignment,
+            textDirection,
+            verticalDirection,
+            textBaseline,
+        ) = style_key
+
+        styles = (
+            f"display: flex; "
+            f"flex-direction: row; "
+            f"justify-content: {mainAxisAlignment}; "
+            f"align-items: {crossAxisAlignment}; "
+            f"direction: {textDirection}; "
+            f"vertical-align: {textBaseline};"
+        )
+        if mainAxisSize == 'min':
+            styles += "width: auto;"
+        elif mainAxisSize == 'max':
+            styles += "width: 100%;"
+        return styles
+
+    def to_css(self):
+        """Return the shared CSS rules for Row styles."""
+        return Row.shared_css()
+
+    def to_html(self):
+        """Generate HTML for the Row widget."""
+        children_html = ''.join([child.to_html() for child in self.children])
+
+        return f"<div id='{self.widget_id()}' class='{self.css_class}'>{children_html}</div>"
+    
+
+
+class Stack(Widget):
+    def __init__(self, children, alignment=Alignment.top_left(), textDirection=TextDirection.LTR, fit=StackFit.loose, clipBehavior=ClipBehavior.NONE, overflow=Overflow.VISIBLE, key=None):
+        super().__init__(widget_id=None)
+        self.children = children
+        self.alignment = alignment
+        self.textDirection = textDirection
+        self.fit = fit
+        self.clipBehavior = clipBehavior
+        self.overflow = overflow
+        self.key = key
+
+        # Add the children to the widget tree in one step
+        self.set_children(self.children)
+
+
+    def to_html(self):
+        alignment_style = self.alignment.to_css()
+        text_direction_style = f"direction: {self.textDirection};"
+        fit_style = "width: 100%; height: 100%;" if self.fit == StackFit.expand else ""
+        clip_style = ""
+        if self.clipBehavior == ClipBehavior.HARD_EDGE:
+            clip_style = "overflow: hidden;"
+        elif self.clipBehavior == ClipBehavior.ANTI_ALIAS or self.clipBehavior == ClipBehavior.ANTI_ALIAS_WITH_SAVE_LAYER:
+            clip_style = "overflow: hidden; clip-path: inset(0% round 0.5%);"
+
+        overflow_style = f"overflow: {self.overflow.value};"
+
+        children_html = ''.join([child.to_html() for child in self.children])
+
+        return f"""
+        <div id="{self.widget_id()}" style="position: relative; {alignment_style} {text_direction_style} {fit_style} {clip_style} {overflow_style}">
+            {children_html}
+        </div>
+        """
+        
+
+
+class Positioned(Widget):
+    __slots__ = ('top', 'right', 'bottom', 'left')
+
+    child = property(Widget._first_child)
+
+    def __init__(self, child, top=None, right=None, bottom=None, left=None):
+        super().__init__(widget_id=None)
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.left = left
+
+
+        self.add_child(child) if child else None # Use the add_child method to manage parent-child relationships
+
+    
+
+
+    def to_html(self):
+        top_style = f"top: {self.top}px;" if self.top is not None else ""
+        right_style = f"right: {self.right}px;" if self.right is not None else ""
+        bottom_style = f"bottom: {self.bottom}px;" if self.bottom is not None else ""
+        left_style = f"left: {self.left}px;" if self.left is not None else ""
+
+        return f"""
+        <div id='{self.widget_id()}' style="position: absolute; {top_style} {right_style} {bottom_style} {left_style}">
+            {self.child.to_html()}
+        </div>
+        """
+        
+
+
+class Expanded(Widget):
+    __slots__ = ('flex', 'key')
+
+    child = property(Widget._first_child)
+
+    def __init__(self, child, flex=1, key=None):
+        super().__init__(widget_id=None)
+        self.flex = flex
+        self.key = key
+
+
+        self.add_child(child) if child else None# Register the child widget with the framework
+
+
+
+    def to_html(self):
+        return f"<div id='{self.widget_id()}' style='flex: {self.flex};'>{self.child.to_html()}</div>"
+
+
+class Spacer(Widget):
+    __slots__ = ('flex', 'key')
+
+    def __init__(self, flex=1, key=None):
+        super().__init__(widget_id=None)
+        self.flex = flex
+        self.key = key
+    
+    def get_children(self):
+        return []  # SizedBox doesn't have children, so return an empty list
+
+    def remove_all_children(self):
+        pass
+
+
+    def widget_id(self):
+        return 'spacer'
+
+
+    def to_html(self):
+        return f"<div id='{self.widget_id()}' style='flex: {self.flex};'></div>"
+        
+
+
+class SizedBox(Widget):
+    __slots__ = ('height', 'width')
+
+    def __init__(self, height=0, width=0):
+        super().__init__(widget_id=None)
+        self.height = height
+        self.width = width
+
+    def get_children(self):
+        return []  # SizedBox doesn't have children, so return an empty list
+
+    def remove_all_children(self):
+        pass
+
+    def widget_id(self):
+        return 'sizedBox'
+
+    def to_html(self):
+        return f"<div id='{self.widget_id()}' style='height: {self.height}px; width: {self.width}px;'></div>"
+
+
+class Divider(Widget):
+    def __init__(self, height=1, margin=EdgeInsets.symmetric(8,0), color=Colors.hex('#ccc'), border=BorderStyle.NONE):
+        super().__init__(widget_id=None)
+        self.height = height
+        self.margin = margin
+        self.color = color
+        self.border = border
+
+    def get_children(self):
+        return []  # SizedBox doesn't have children, so return an empty list
+
+    def remove_all_children(self):
+        pass
+
+    
+
+
+    def to_html(self):
+        return f"""
+        <hr  id="{self.widget_id()}" style="height: {self.height}px; background-color: {self.color}; border: {self.border}; margin: {self.margin.to_css()};">
+        """
+
+
+class Center(Widget):
+    __slots__ = ()
+
+    child = property(Widget._first_child)
+
+    def __init__(self, child):
+        super().__init__(widget_id=None)
+
+
+
+        self.add_child(child) if child else None# Register the child widget with the framework    
+
+
+    def to_html(self):
+        return f"""
+        <div id="{self.widget_id()}" style="display: flex; justify-content: center; align-items: center; height: 100%;">
+            {self.child.to_html()}
+        </div>
+        """
+
+
+class Placeholder(Widget):
+    def __init__(self, 
+                 color=Colors.gray, 
+                 stroke_width=2, 
+                 height=100, 
+                 width=100, 
+                 child=None):
+        super().__init__(widget_id=None)
+        self.color = color
+        self.stroke_width = stroke_width
+        self.height = height
+        self.width = width
+        self.child = child
+
+        if self.child:
+            self.add_child(self.child)
+
+    def to_html(self):
+        if self.child:
+            return self.child.to_html()
+        else:
+            return f"""
+            <div id="{self.widget_id()}" style="
+                height: {self.height}px;
+                width: {self.width}px;
+                border: {self.stroke_width}px dashed {self.color};
+                display: flex;
+                justify-content: center;
+                align-items: center;
+            ">
+                <p style="
+                color: {self.color};
+                 font-size: 12px;
+                 ">Placeholder</p>
+            </div>
+            """
+
+
+class Padding(Widget):
+    __slots__ = ('padding',)
+
+    child = property(Widget._first_child)
+
+    def __init__(self, padding=EdgeInsets.all(10), child=None):
+        super().__init__(widget_id=None)
+        self.padding = padding
+
+        if child:
+            self.add_child(child)
+
+    def to_html(self):
+        child_html = self.child.to_html() if self.child else ''
+        return f"""
+        <div id="{self.widget_id()}" 
+        style="padding: {self.padding.to_css()};">
+            {child_html}
+        </div>
+        """
+
+
+class Align(Widget):
+    __slots__ = ('alignment',)
+
+    child = property(Widget._first_child)
+
+    def __init__(self, alignment=Alignment.center(), child=None):
+        super().__init__(widget_id=None)
+        self.alignment = alignment
+
+        if child:
+            self.add_child(child)
+
+    def to_html(self):
+        child_html = self.child.to_html() if self.child else ''
+        return f"""
+        <div id="{self.widget_id()}" 
+        style="display: flex; 
+        justify-content: {self.alignment.horizontal}; 
+        align-items: {self.alignment.vertical}; 
+        height: 100%; 
+        width: 100%;">
+            {child_html}
+        </div>
+        """
+
+
+class AspectRatio(Widget):
+    def __init__(self, aspect_ratio, child=None):
+        super().__init__(widget_id=None)
+        self.aspect_ratio = aspect_ratio
+        self.child = child
+
+        if self.child:
+            self.add_child(self.child)
+
+    def to_html(self):
+        child_html = self.child.to_html() if self.child else ''
+        
+        # Aspect ratio calculation for CSS: padding-bottom is used to maintain aspect ratio
+        padding_bottom = 100 / self.aspect_ratio
+
+        return f"""
+        <div id="{self.widget_id()}" 
+        style="position: relative; 
+        width: 100%; 
+        padding-bottom: {padding_bottom}%; 
+        height: 0; overflow: hidden;">
+            <div style="position: absolute; 
+            top: 0; left: 0; width: 100%; height: 100%;">
+                {child_html}
+            </div>
+        </div>
+        """
+
+
+class FittedBox(Widget):
+    def __init__(self, fit=BoxFit.CONTAIN, alignment=Alignment.center(), child=None):
+        super().__init__(widget_id=None)
+        self.fit = fit
+        self.alignment = alignment
+        self.child = child
+
+        if self.child:
+            self.add_child(self.child)
+
+    def to_html(self):
+        alignment_css = self.alignment.to_css()
+        child_html = self.child.to_html() if self.child else ''
+
+        # Using BoxFit values directly
+        object_fit = self.fit
+
+        return f"""
+        <div id="{self.widget_id()}" 
+        style="width: 100%; height: 100%; {alignment_css};">
+            <div style="flex: 0 0 auto; object-fit: {object_fit};">
+                {child_html}
+            </div>
+        </div>
+        """
+
+
+class FractionallySizedBox(Widget):
+    def __init__(self, widthFactor=None, heightFactor=None, alignment=Alignment.center(), child=None):
+        super().__init__(widget_id=None)
+        self.widthFactor = widthFactor
+        self.heightFactor = heightFactor
+        self.alignment = alignment
+        self.child = child
+
+        if self.child:
+            self.add_child(self.child)
+
+    def to_html(self):
+        alignment_css = self.alignment.to_css()
+
+        # Calculate the width and height percentages based on the factors
+        width = f"{self.widthFactor * 100}%" if self.widthFactor is not None else 'auto'
+        height = f"{self.heightFactor * 100}%" if self.heightFactor is not None else 'auto'
+        
+        child_html = self.child.to_html() if self.child else ''
+
+        return f"""
+        <div id="{self.widget_id()}" 
+        style="display: flex; 
+        {alignment_css}; 
+        width: 100%; height: 100%;">
+            <div style="width: {width}; height: {height};">
+                {child_html}
+            </div>
+        </div>
+        """
+
+
+class Flex(Widget):
+    def __init__(self, 
+                 direction=Axis.HORIZONTAL, 
+                 mainAxisAlignment=MainAxisAlignment.START, 
+                 crossAxisAlignment=CrossAxisAlignment.START, 
+                 children=None, 
+                 padding=None):
+        super().__init__()
+        self.direction = direction
+        self.mainAxisAlignment = mainAxisAlignment
+        self.crossAxisAlignment = crossAxisAlignment
+        self.children = children if children is not None else []
+        self.padding = padding if padding is not None else EdgeInsets.all(0)
+
+        if self.children:
+            for child in self.children:
+                self.add_child(child)
+        
+    def to_html(self):
+        direction_css = 'row' if self.direction == Axis.HORIZONTAL else 'column'
+        
+        # CSS for main axis and cross axis alignment
+        justify_content = self.mainAxisAlignment
+        align_items = self.crossAxisAlignment
+        
+        # Add padding to the Flex container
+        padding_css = self.padding.to_css()
+        
+        # Generate the CSS for the Flex container
+        container_css = f"""display: flex; 
+        flex-direction: {direction_css}; 
+        justify-content: {justify_content}; 
+        align-items: {align_items}; 
+        padding: {padding_css};"""
+        
+        # Build HTML for each child
+        children_html = ''.join([child.render() for child in self.children])
+        
+        return f'<div style="{container_css}">{children_html}</div>'
+
+
+class Wrap(Widget):
+    def __init__(self, 
+                 direction=Axis.HORIZONTAL, 
+                 alignment=MainAxisAlignment.START, 
+                 crossAxisAlignment=CrossAxisAlignment.START,
+                 runAlignment=MainAxisAlignment.START,
+                 spacing=0,
+                 runSpacing=0,
+                 clipBehavior=ClipBehavior.NONE,
+                 children=None):
+        self.direction = direction
+        self.alignment = alignment
+        self.crossAxisAlignment = crossAxisAlignment
+        self.runAlignment = runAlignment
+        self.spacing = spacing
+        self.runSpacing = runSpacing
+        self.clipBehavior = clipBehavior
+        self.children = children or []
+
+
+        if self.children:
+            for child in self.children:
+                self.add_child(child)
+    
+   
+
+    def to_html(self):
+        styles = []
+        # Flex properties for wrapping
+        flex_direction = 'row' if self.direction == Axis.HORIZONTAL else 'column'
+        styles.append(f"display: flex; flex-wrap: wrap; flex-direction: {flex_direction};")
+        
+        # Main Axis Alignment
+        styles.append(f"justify-content: {self.alignment};")
+        
+        # Cross Axis Alignment
+        styles.append(f"align-items: {self.crossAxisAlignment};")
+        
+        # Run Alignment (applies to multi-row or multi-column layout)
+        # In CSS, justify-content applies similarly to the "runAlignment"
+        styles.append(f"align-content: {self.runAlignment};")
+        
+        # Spacing (gap between items)
+        styles.append(f"gap: {self.spacing}px;")
+        
+        # Run Spacing (spacing between lines or rows of items)
+        # CSS does not directly support run-spacing, so we may have to adjust for this manually later
+        styles.append(f"row-gap: {self.runSpacing}px;" if self.direction == Axis.HORIZONTAL else f"column-gap: {self.runSpacing}px;")
+        
+        # Clip Behavior
+        if self.clipBehavior:
+            overflow_css = "overflow: hidden;" if self.clipBehavior != ClipBehavior.NONE else ""
+            styles.append(overflow_css)
+        
+        css = " ".join(styles)
+        children_html = "".join([child.to_html() for child in self.children])
+        return f'<div style="{css}">{children_html}</div>'
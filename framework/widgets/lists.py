@@ -0,0 +1,263 @@
+# framework/widgets/lists.py
+from ..api import Api
+from ..base import Widget
+from ..styles import *
+from .layout import containment_css
+
+
+class ListView(Widget):
+    shared_styles = {}  # Shared CSS for ListView configurations
+    _style_keys = {}    # Canonical style key tuples
+
+    def __init__(self, children, padding=None, scrollDirection=Axis.VERTICAL, reverse=False, primary=True, physics=ScrollPhysics.ALWAYS_SCROLLABLE, shrinkWrap=False, itemExtent=None, cacheExtent=None, semanticChildCount=None, containment=None):
+        super().__init__(widget_id=None)
+        self.containment = containment  # Containment hints for the items (None: config default)
+        self.children = children
+        self.padding = padding or EdgeInsets.all(0)
+        self.scrollDirection = scrollDirection
+        self.reverse = reverse
+        self.primary = primary
+        self.physics = physics
+        self.shrinkWrap = shrinkWrap
+        self.itemExtent = itemExtent
+        self.cacheExtent = cacheExtent
+        self.semanticChildCount = semanticChildCount
+
+        # Add children widgets to the tree
+        self.set_children(self.children)
+
+        # Generate a unique style key
+        self.style_key = (
+            self.padding.to_css(),
+            self.scrollDirection,
+            self.reverse,
+            self.primary,
+            self.physics,
+            self.itemExtent,
+            self.cacheExtent,
+        )
+
+        # Reuse the shared class of an identical style; its rule is formatted only once
+        self.style_key, self.css_class = ListView._intern_style(self.style_key, 'shared-listview')
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for a list view style key.
+
+        Args:
+            style_key (tuple): The list view's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        (padding, scrollDirection, reverse, primary, physics, itemExtent, cacheExtent) = style_key
+
+        # Convert style attributes to CSS
+        scroll_direction_style = "flex-direction: column;" if scrollDirection == Axis.VERTICAL else "flex-direction: row;"
+        reverse_style = "flex-direction: column-reverse;" if reverse else ""
+        primary_style = (
+            "overflow-y: auto;" if scrollDirection == Axis.VERTICAL and primary
+            else "overflow-x: auto;" if scrollDirection == Axis.HORIZONTAL and primary
+            else ""
+        )
+        padding_style = f"padding: {padding};"
+        physics_style = ""
+        if physics == ScrollPhysics.BOUNCING:
+            physics_style = "overflow: scroll; -webkit-overflow-scrolling: touch;"
+        elif physics == ScrollPhysics.CLAMPING:
+            physics_style = "overflow: hidden;"
+        cache_extent_style = f"scroll-margin-top: {cacheExtent}px;" if cacheExtent else ""
+
+        return f"""
+                display: flex;
+                {scroll_direction_style}
+                {reverse_style}
+                {primary_style}
+                {padding_style}
+                {physics_style}
+                {cache_extent_style}
+                height: 100%;
+                width: 100%;
+        """
+
+    def to_css(self):
+        """Return the shared CSS rules for ListView."""
+        return ListView.shared_css()
+
+    def to_html(self):
+        """Generate HTML for ListView."""
+        vertical = self.scrollDirection == Axis.VERTICAL
+        extent = f'flex-basis: {self.itemExtent}px;' if self.itemExtent else ''
+        children_html = ''.join(
+            [f"<div style='flex: none; {extent} {self._item_containment(child, vertical)}'>{child.to_html()}</div>" for child in self.children]
+        )
+        semantic_child_count_attr = f"aria-setsize='{self.semanticChildCount}'" if self.semanticChildCount else ""
+
+        return f"""
+        <div id="{self.widget_id()}" class="{self.css_class}" {semantic_child_count_attr}>
+            {children_html}
+        </div>
+        """
+
+    def _item_containment(self, child, vertical):
+        # Offscreen items skip rendering; itemExtent is their placeholder size along the axis
+        if vertical:
+            return containment_css(self.containment, child, height=self.itemExtent, axis=Axis.VERTICAL)
+        return containment_css(self.containment, child, width=self.itemExtent, axis=Axis.HORIZONTAL)
+
+
+class GridView(Widget):
+    shared_styles = {}  # Shared CSS for GridView configurations
+    _style_keys = {}    # Canonical style key tuples
+
+    def __init__(self, children, padding=None, scrollDirection=Axis.VERTICAL, reverse=False, primary=True, physics=ScrollPhysics.ALWAYS_SCROLLABLE, shrinkWrap=False, crossAxisCount=2, mainAxisSpacing=0, crossAxisSpacing=0, childAspectRatio=1.0, containment=None):
+        super().__init__(widget_id=None)
+        self.containment = containment  # Containment hints for the cells (None: config default)
+        self.children = children
+        self.padding = padding or EdgeInsets.all(0)
+        self.scrollDirection = scrollDirection
+        self.reverse = reverse
+        self.primary = primary
+        self.physics = physics
+        self.shrinkWrap = shrinkWrap
+        self.crossAxisCount = crossAxisCount
+        self.mainAxisSpacing = mainAxisSpacing
+        self.crossAxisSpacing = crossAxisSpacing
+        self.childAspectRatio = childAspectRatio
+
+        # Add children to the widget tree
+        self.set_children(self.children)
+
+        # Generate unique style key for shared CSS
+        self.style_key = (
+            self.padding.to_css(),
+            self.scrollDirection,
+            self.reverse,
+            self.primary,
+            self.physics,
+            self.crossAxisCount,
+            self.mainAxisSpacing,
+            self.crossAxisSpacing,
+            self.childAspectRatio,
+        )
+
+        # Reuse the shared class of an identical style; its rule is formatted only once
+        self.style_key, self.css_class = GridView._intern_style(self.style_key, 'shared-gridview')
+
+    @classmethod
+    def css_rule(cls, css_class, style_key):
+        """
+        Formats the rules of a grid view style key: the scroller, its grid and the grid items.
+
+        Args:
+            css_class (str): The shared CSS class of the style.
+            style_key (tuple): The grid view's style key.
+
+        Returns:
+            str: The CSS rules.
+        """
+        (
+            padding, scrollDirection, reverse, primary, physics,
+            crossAxisCount, mainAxisSpacing, crossAxisSpacing, childAspectRatio
+        ) = style_key
+
+        # Convert attributes to CSS
+        scroll_direction_style = "flex-direction: column;" if scrollDirection == Axis.VERTICAL else "flex-direction: row;"
+        reverse_style = "flex-direction: column-reverse;" if reverse else ""
+        primary_style = (
+            "overflow-y: auto;" if scrollDirection == Axis.VERTICAL and primary
+            else "overflow-x: auto;" if scrollDirection == Axis.HORIZONTAL and primary
+            else ""
+        )
+        padding_style = f"padding: {padding};"
+        physics_style = ""
+        if physics == ScrollPhysics.BOUNCING:
+            physics_style = "overflow: scroll; -webkit-overflow-scrolling: touch;"
+        elif physics == ScrollPhysics.CLAMPING:
+            physics_style = "overflow: hidden;"
+        grid_template_columns = f"repeat({crossAxisCount}, 1fr);"
+        grid_gap = f"{mainAxisSpacing}px {crossAxisSpacing}px;"
+
+        return f"""
+            .{css_class} {{
+                display: flex;
+                {scroll_direction_style}
+                {reverse_style}
+                {primary_style}
+                {padding_style}
+                {physics_style}
+                height: 100%;
+                width: 100%;
+            }}
+            .{css_class} .grid-container {{
+                display: grid;
+                grid-template-columns: {grid_template_columns}
+                gap: {grid_gap};
+                width: 100%;
+            }}
+            .{css_class} .grid-item {{
+                flex: 1;
+                aspect-ratio: {childAspectRatio};
+            }}
+            """
+
+    def to_css(self):
+        """Return the shared CSS rules for GridView."""
+        return GridView.shared_css()
+
+    def to_html(self):
+        """Generate HTML for GridView."""
+        children_html = ''.join(
+            [f"<div class='grid-item' style='{containment_css(self.containment, child)}'>{child.to_html()}</div>" for child in self.children]
+        )
+        return f"""
+        <div id="{self.widget_id()}" class="{self.css_class}" role="grid">
+            <div class="grid-container">
+                {children_html}
+            </div>
+        </div>
+        """
+
+          
+
+
+class ListTile(Widget):
+    def __init__(self, leading=None, title=None, subtitle=None, onTap=None):
+        super().__init__(widget_id=None)
+        self.leading = leading
+        self.title = title
+        self.subtitle = subtitle
+        self.onTap = onTap
+
+        self.api = Api()
+        self.onTapName = self.onTap.__name__ if self.onTap else ''
+
+
+
+        children = [
+            self.leading,
+            self.title,
+            self.subtitle
+        ]
+
+        for child in children:
+            self.add_child(child) if child else None# Register the child widget with the framework
+
+    def to_html(self):
+        self.api.register_callback(self.onTapName, self.onTap)
+
+        leading_html = self.leading.to_html() if self.leading else ""
+        title_html = self.title.to_html() if self.title else ""
+        subtitle_html = self.subtitle.to_html() if self.subtitle else ""
+        onClick = f'onclick="handleClick(\'{self.onTapName}\')"' if self.onTap else ""
+
+        return f"""
+        <div id="{self.widget_id()}" class="list-tile" style="display: flex; align-items: center; padding: 10px; cursor: pointer;" {onClick}>
+            <div style="margin-right: 10px;">{leading_html}</div>
+            <div>
+                <div>{title_html}</div>
+                <div style="color: grey;">{subtitle_html}</div>
+            </div>
+        </div>
+        """
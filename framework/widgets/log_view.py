@@ -0,0 +1,209 @@
+# framework/widgets/log_view.py
+import html
+import json
+import threading
+from collections import deque
+
+from PySide6.QtCore import QTimer
+
+from ..api import Api
+from ..base import Widget
+from ..instrumentation import instrumentation
+from ..reactive import _send
+
+
+class LogView(Widget):
+    """
+    An append-only view of text lines, backed by a bounded ring buffer.
+
+    Appending a line never rebuilds anything: the lines appended since the last flush are
+    collected and sent to the page as one patch every `flushInterval` milliseconds, where
+    they are added after the existing nodes and the oldest nodes past `maxLines` are
+    removed. The buffer keeps the last `maxLines` lines, so a burst larger than the cap
+    only sends its tail. `append` and `extend` can be called from any thread.
+
+    With `virtualized=True`, the page keeps the lines as strings and only creates nodes for
+    the lines inside the viewport, which keeps large caps cheap. While the view is scrolled
+    to the bottom, it stays pinned there as lines arrive; scrolling up unpins it.
+
+    Keep the view in your State and return the same instance from `build()` so the lines
+    survive rebuilds. Once rendered, a rebuild emits only a placeholder and the page moves
+    the existing element (with its lines and scroll position) into it; if the element is
+    gone, for example after a page reload, the page asks for a full render.
+
+    Args:
+        lines (iterable, optional): The initial lines.
+        maxLines (int): The number of lines kept, in Python and in the page. Defaults to 5000.
+        height (int): The viewport height in pixels. Defaults to 300.
+        width (int, optional): The viewport width in pixels. Defaults to the full width.
+        lineHeight (int): The height of each line in pixels. Defaults to 18.
+        autoScroll (bool): Pins the view to the newest line while scrolled to the bottom.
+            Defaults to True.
+        virtualized (bool): Renders only the lines inside the viewport. Defaults to False.
+        overscan (int): Extra lines rendered above and below the viewport when virtualized.
+            Defaults to 20.
+        flushInterval (int): The time in milliseconds appended lines are collected before
+            they are sent. Defaults to 50.
+    """
+    shared_styles = {}  # Shared CSS for LogView viewports
+    _style_keys = {}
+
+    base_css = (
+        ".pythra-log-view { position: relative; overflow: auto; box-sizing: border-box;"
+        " font-family: monospace; font-size: 12px; contain: strict; }"
+        ".pythra-log-body { position: relative; min-width: 100%; width: max-content; }"
+        ".pythra-log-line { white-space: pre; padding: 0 8px; box-sizing: border-box; overflow: hidden; }"
+        ".pythra-log-window { position: absolute; left: 0; right: 0; }"
+    )
+
+    def __init__(self, lines=None, maxLines=5000, height=300, width=None, lineHeight=18, autoScroll=True, virtualized=False, overscan=20, flushInterval=50):
+        super().__init__(widget_id=None)
+        self.maxLines = maxLines
+        self.lineHeight = lineHeight
+        self.autoScroll = autoScroll
+        self.virtualized = virtualized
+        self.overscan = overscan
+        self.flushInterval = flushInterval
+        self.style_key, self.css_class = LogView._intern_style((height, width, lineHeight), 'shared-logview')
+
+        self._lines = deque((str(line) for line in lines or ()), maxlen=maxLines)
+        self._pending = deque(maxlen=maxLines)  # Lines appended since the last flush
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        self._rendered = False  # Whether the page has received the full view
+
+    @staticmethod
+    def css_declarations(style_key):
+        """Returns the CSS declarations for a log viewport style key."""
+        height, width, lineHeight = style_key
+        return (
+            f"height: {height}px; {f'width: {width}px;' if width else 'width: 100%;'}"
+            f"line-height: {lineHeight}px;"
+        )
+
+    def __len__(self):
+        return len(self._lines)
+
+    def lines(self):
+        """Returns a copy of the buffered lines, oldest first."""
+        with self._lock:
+            return list(self._lines)
+
+    def append(self, line):
+        """
+        Appends a line. It reaches the page with the next flush.
+
+        Args:
+            line (str): The line; other values are converted with `str`.
+        """
+        self.extend((line,))
+
+    def extend(self, lines):
+        """
+        Appends several lines. They reach the page with the next flush.
+
+        Args:
+            lines (iterable): The lines; other values are converted with `str`.
+        """
+        lines = [str(line) for line in lines]
+        if not lines:
+            return
+        with self._lock:
+            self._lines.extend(lines)
+            if not self._is_mounted():
+                return  # Rendered from the buffer once mounted
+            self._pending.extend(lines)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self._schedule_flush()
+
+    def clear(self):
+        """Removes all lines, from the buffer and from the page."""
+        with self._lock:
+            self._lines.clear()
+            self._pending.clear()
+        if self._is_mounted():
+            _send(f"pythraLogView.clear('{self.widget_id()}');")
+
+    def flush(self):
+        """Sends the lines appended since the last flush. Called by the flush timer."""
+        with self._lock:
+            self._flush_scheduled = False
+            if not self._pending:
+                return
+            lines = list(self._pending)
+            self._pending.clear()
+        instrumentation.count('log_lines_sent', len(lines))
+        _send(f"pythraLogView.append('{self.widget_id()}', {json.dumps(lines)});")
+
+    def _schedule_flush(self):
+        if threading.current_thread() is threading.main_thread():
+            QTimer.singleShot(self.flushInterval, self.flush)
+        else:
+            from ..window import webwidget  # Imported once a window exists, not with the widgets
+            webwidget.call_on_main_thread(lambda: QTimer.singleShot(self.flushInterval, self.flush))
+
+    def _is_mounted(self):
+        # Tracked through rendering: a view reused by rebuilds keeps streaming
+        if not self._rendered:
+            return False
+        framework = Widget._framework_ref() if Widget._framework_ref else None
+        return framework is not None and bool(getattr(framework, 'window', None))
+
+    def _callback_name(self, action):
+        return f"__logview_{self.widget_id()}_{action}"
+
+    def _on_render_request(self):
+        # The page found a placeholder without the element it stands for
+        _send(f"pythraLogView.reset('{self.widget_id()}', {json.dumps(self._full_html())});")
+
+    def to_js(self):
+        """Register the render request callback in the framework's API."""
+        Api().register_callback(self._callback_name('render'), self._on_render_request)
+        return ""
+
+    def to_css(self):
+        """Return the shared CSS rules for LogView."""
+        return LogView.shared_css()
+
+    def to_html(self):
+        self.to_js()
+        if self._rendered:
+            # The page keeps the existing element; pending lines still arrive with the flush
+            return (
+                f'<div id="{self.widget_id()}" class="pythra-log-view {self.css_class}" '
+                f'data-pythra-log-keep="{self._callback_name("render")}"></div>'
+            )
+        return self._full_html()
+
+    def _full_html(self):
+        with self._lock:
+            lines = list(self._lines)
+            self._pending.clear()  # Already part of this render
+            self._rendered = True
+        view_id = self.widget_id()
+        options = {
+            'maxLines': self.maxLines,
+            'lineHeight': self.lineHeight,
+            'autoScroll': self.autoScroll,
+            'virtualized': self.virtualized,
+            'overscan': self.overscan,
+        }
+        if self.virtualized:
+            # The page creates nodes only for the visible lines
+            options['lines'] = lines
+            body = (
+                f'<div class="pythra-log-body" style="height: {len(lines) * self.lineHeight}px;">'
+                f'<div class="pythra-log-window"></div></div>'
+            )
+        else:
+            body = '<div class="pythra-log-body">{}</div>'.format(
+                ''.join(f'<div class="pythra-log-line">{html.escape(line)}</div>' for line in lines)
+            )
+        return f"""
+        <div id="{view_id}" class="pythra-log-view {self.css_class}" data-pythra-log="{html.escape(json.dumps(options), quote=True)}">
+            <style>{LogView.base_css}</style>
+            {body}
+        </div>
+        """
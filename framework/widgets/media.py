@@ -0,0 +1,184 @@
+# framework/widgets/media.py
+from ..assets import image_pipeline
+from ..base import Widget
+from ..config import config
+from ..styles import *
+
+
+class Image(Widget):
+    shared_styles = {}  # Shared CSS for Image styles
+    _style_keys = {}    # Canonical style key tuples
+
+    def __init__(self, image, width=None, height=None, fit=ImageFit.CONTAIN, alignment='center', lazy=False):
+        super().__init__(widget_id=None)
+        self.image = image
+        self.width = width
+        self.height = height
+        self.fit = fit
+        self.alignment = alignment
+        self.lazy = lazy  # Defer loading until near the viewport and show a blurred placeholder
+
+        # Generate a unique style key for deduplication
+        self.style_key = (self.fit, self.width, self.height, self.alignment)
+
+        # Reuse the shared class of an identical style; its rule is formatted only once
+        self.style_key, self.css_class = Image._intern_style(self.style_key, 'shared-image')
+
+        # AssetImage and NetworkImage are image sources, not widgets, so they are not added as children
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for an image style key.
+
+        Args:
+            style_key (tuple): The image's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        fit, width, height, alignment = style_key
+        return (
+            f"object-fit: {fit}; "
+            f"{f'width: {width}px; ' if width else ''}"
+            f"{f'height: {height}px; ' if height else 'height: auto; '}"
+            f"display: flex; "
+            f"justify-content: center; "
+            f"align-items: {alignment};"
+        )
+
+    def to_css(self):
+        """Return the shared CSS rules for Image styles."""
+        return Image.shared_css()
+
+    def get_source(self):
+        """
+        Returns the image URL, using a resized derivative when one is ready.
+
+        Asset images with a width or height ask the image pipeline for a variant sized for
+        the layout box times `image_pixel_ratio`. Until it has been built, the original
+        file is used and the pipeline swaps the source once the variant is written.
+        """
+        if isinstance(self.image, AssetImage) and (self.width or self.height):
+            ratio = config.get('image_pixel_ratio', 2)
+            variant = image_pipeline.request(
+                self.image.file_name,
+                width=int(self.width * ratio) if self.width else None,
+                height=int(self.height * ratio) if self.height else None,
+                fit=self.fit,
+                widget_id=self.widget_id(),
+            )
+            if variant:
+                return AssetImage(variant).get_source()
+        return self.image.get_source()
+
+    def to_html(self):
+        """
+        Generate HTML for the Image widget.
+
+        In lazy mode the source goes into `data-src` and is assigned by `main.js` when the
+        image nears the viewport. Asset images also get their intrinsic `width`/`height`
+        attributes, which reserve an aspect-ratio box before the file arrives, and a tiny
+        blurred placeholder from the image pipeline as background. When the pipeline has not
+        computed them yet, the image renders without them and they are patched in later.
+        """
+        src = self.get_source()
+        if not self.lazy:
+            return f"<img id='{self.widget_id()}' src='{src}' class='{self.css_class}' />"
+
+        attributes = ''
+        style = ''
+        info = image_pipeline.image_info(self.image.file_name, widget_id=self.widget_id()) if isinstance(self.image, AssetImage) else None
+        if info:
+            attributes = f" width='{info['width']}' height='{info['height']}'"
+            style = f" style=\"background: url('{info['placeholder']}') center / cover no-repeat;\""
+        return (
+            f"<img id='{self.widget_id()}' data-src='{src}' class='{self.css_class} pythra-lazy'"
+            f" loading='lazy' decoding='async'{attributes}{style} />"
+        )
+
+
+class AssetImage:
+    
+    def __init__(self, file_name):
+        # Use the local server to serve assets
+        self.file_name = file_name
+        self.src = f"http://localhost:{config.get('assets_server_port')}/{config.get('assets_dir', 'assets')}/{file_name}"
+
+    def get_source(self):
+        return self.src
+
+
+class NetworkImage:
+    def __init__(self, url):
+        self.src = url
+
+    def get_source(self):
+        return self.src
+
+
+class Icon(Widget):
+    __slots__ = ('icon_name', 'custom_icon', 'size', 'color', 'style_key', 'css_class')
+
+    shared_styles = {}  # Shared CSS for Icon styles
+    _style_keys = {}    # Canonical style key tuples
+    used_names = set()  # Icon names rendered so far, used to subset the icon font
+
+    def __init__(self, icon_name=None, custom_icon=None, size=16, color=None):
+        super().__init__(widget_id=None)
+        self.icon_name = icon_name
+        if icon_name:
+            Icon.used_names.add(icon_name)
+        self.custom_icon = custom_icon
+        self.size = size
+        self.color = color
+
+        # Generate a unique style key for deduplication
+        self.style_key = (
+                    self.size, 
+                    self.color
+            )
+
+        # Reuse the shared class of an identical style; its rule is formatted only once
+        self.style_key, self.css_class = Icon._intern_style(self.style_key, 'shared-icon')
+
+    def get_children(self):
+        """Icon doesn't have children, so return an empty list."""
+        return []
+
+    def remove_all_children(self):
+        """Icon has no children, so this is a no-op."""
+        pass
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for an icon style key.
+
+        Args:
+            style_key (tuple): The icon's size and color.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        size, color = style_key
+        return (
+            f"font-size: {size}px; "
+            f"width: {size}px; "
+            f"height: {size}px; "
+            f"{f'color: {color};' if color else ''}"
+        )
+
+    def to_css(self):
+        """Return the shared CSS rules for Icon styles."""
+        return Icon.shared_css()
+
+    def to_html(self):
+        """Generate HTML for the Icon widget."""
+        if self.custom_icon:
+            # Handle custom icons as image sources
+            src = AssetImage(self.custom_icon).get_source()
+            return f"<img id='{self.widget_id()}' src='{src}' class='{self.css_class}' />"
+        else:
+            # Predefined icons use the Font Awesome classes (local subset or CDN, see Framework._icon_styles)
+            return f"<i id='{self.widget_id()}' class='fa fa-{self.icon_name} {self.css_class}'></i>"
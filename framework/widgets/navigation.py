@@ -0,0 +1,374 @@
+# framework/widgets/navigation.py
+import html
+import json
+import logging
+from collections import OrderedDict
+
+from PySide6.QtCore import QTimer
+
+from ..base import Widget
+from ..instrumentation import instrumentation
+from ..reactive import _send
+
+logger = logging.getLogger(__name__)
+
+
+class _KeepAlivePage(Widget):
+    """
+    Wraps one page of an IndexedStack. When the stack's controller is kept by the caller,
+    the page is owned by it, so the framework does not delete it with the tree of a
+    rebuilt parent.
+    """
+    child = property(Widget._first_child)
+
+    @property
+    def keep_alive(self):
+        return self.controller.owned
+
+    def __init__(self, child, controller, index):
+        super().__init__(widget_id=None)
+        self.controller = controller
+        self.index = index
+        self.add_child(child) if child else None
+
+    def to_html(self):
+        active = " active" if self.index == self.controller.index else ""
+        child_html = self.child.to_html() if self.child else ""
+        return f'<div id="{self.widget_id()}" class="keep-alive-page{active}" data-index="{html.escape(str(self.index), quote=True)}">{child_html}</div>'
+
+
+class IndexedStackController:
+    """
+    Selects the visible page of an IndexedStack and keeps its visited pages alive.
+
+    The controller owns the pages, so keep it in your State: a page is built once and then
+    survives rebuilds of the parent together with its Python state, and `jump_to()` switches
+    pages by toggling a class in the page, without running any `build()`. Hidden pages stay
+    mounted with `content-visibility: hidden`, which skips their rendering but keeps their
+    DOM and scroll position. With `maxAlive`, the least recently shown pages beyond the
+    limit are dropped and built again on their next visit.
+
+    Attributes:
+        id (str): A stable identifier linking the controller to its stack element.
+        index (int): The visible page.
+        maxAlive (int): The most pages kept alive, or None for no limit.
+        listeners (list): Functions called with the new index after every switch.
+        owned (bool): Whether the caller keeps the controller across rebuilds. The pages of
+            a controller created by its stack are deleted with the stack.
+    """
+    _count = 0
+
+    def __init__(self, initialIndex=0, maxAlive=None):
+        IndexedStackController._count += 1
+        self.id = f"indexed-stack-{IndexedStackController._count}"
+        self.index = initialIndex
+        self.maxAlive = max(1, maxAlive) if maxAlive else None
+        self.listeners = []
+        self.owned = True
+        self._pages = OrderedDict()  # Index -> _KeepAlivePage, least recently shown first
+        self._pending_html = {}  # Index -> HTML of preloaded pages not yet in the page
+        self._children = ()  # The pages or page builders of the current stack
+
+    def add_listener(self, listener):
+        """Adds a function called with the new index after every switch."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Removes a listener added with `add_listener`."""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def is_alive(self, index):
+        """Returns whether the page at `index` is built and mounted."""
+        return index in self._pages
+
+    def jump_to(self, index):
+        """
+        Shows the page at `index`. A page shown before is only made visible; a new page is
+        built, rendered and inserted into the stack on its own.
+
+        Args:
+            index (int): The page to show.
+        """
+        if index == self.index and index in self._pages and index not in self._pending_html:
+            return
+        mounted = index in self._pages
+        page = self._page(index)
+        if page is None:
+            logger.warning("IndexedStack %s has no page %s", self.id, index)
+            return
+        self.index = index
+
+        key = json.dumps(index)
+        script = ''
+        if not mounted or index in self._pending_html:
+            html_content = self._pending_html.pop(index, None) or self._render(page)
+            script += f"pythraKeepAlive.mount('{self.id}', {key}, {json.dumps(html_content)});"
+        script += ''.join(f"pythraKeepAlive.evict('{self.id}', {json.dumps(evicted)});" for evicted in self._evict())
+        script += f"pythraKeepAlive.show('{self.id}', {key});"
+        _send(script)
+
+        for listener in list(self.listeners):
+            listener(index)
+
+    def invalidate(self, index):
+        """
+        Drops the page at `index`, so its builder runs again on the next visit. The visible
+        page is rebuilt and swapped in right away.
+
+        Args:
+            index (int): The page to drop.
+        """
+        if index not in self._pages:
+            return
+        self._drop(index)
+        key = json.dumps(index)
+        script = f"pythraKeepAlive.evict('{self.id}', {key});"
+        if index == self.index:
+            page = self._page(index)
+            if page is not None:
+                script += f"pythraKeepAlive.mount('{self.id}', {key}, {json.dumps(self._render(page))});"
+                script += f"pythraKeepAlive.show('{self.id}', {key});"
+        _send(script)
+
+    def preload(self, index):
+        """
+        Builds and renders the page at `index` ahead of time, so showing it later only sends
+        the rendered HTML. Nothing is sent to the page now, and a preload never evicts a page.
+
+        Args:
+            index (int): The page to preload.
+        """
+        if index in self._pages or (self.maxAlive and len(self._pages) >= self.maxAlive):
+            return
+        page = self._page(index)
+        if page is None:
+            return
+        self._pages.move_to_end(index, last=False)  # Not shown yet: first in line for eviction
+        self._pending_html[index] = self._render(page)
+
+    @staticmethod
+    def _render(page):
+        framework = Widget._framework_ref() if Widget._framework_ref else None
+        return framework.render_with_styles(page) if framework else page.to_html()
+
+    def _child(self, index):
+        """Returns the page widget or builder for `index`, or None."""
+        if isinstance(index, int) and 0 <= index < len(self._children):
+            return self._children[index]
+        return None
+
+    def _page(self, index):
+        """Returns the page at `index`, building it if needed, and marks it most recently shown."""
+        page = self._pages.get(index)
+        if page is None:
+            child = self._child(index)
+            if child is None:
+                return None
+            if callable(child):
+                child = child()  # A builder, run on the first visit only
+            page = self._pages[index] = _KeepAlivePage(child, self, index)
+        self._pages.move_to_end(index)
+        return page
+
+    def _evict(self):
+        """Drops the least recently shown pages beyond `maxAlive` and returns their indexes."""
+        evicted = []
+        while self.maxAlive and len(self._pages) > self.maxAlive:
+            index = next(i for i in self._pages if i != self.index)
+            self._drop(index)
+            evicted.append(index)
+        return evicted
+
+    def _drop(self, index):
+        """Forgets the page at `index` and deletes its widgets. The page element is left to the caller."""
+        page = self._pages.pop(index)
+        self._pending_html.pop(index, None)
+        framework = Widget._framework_ref() if Widget._framework_ref else None
+        if framework and framework.get_widget(page.widget_id()) is page:
+            framework.delete_widget(page.widget_id())
+
+
+class IndexedStack(Widget):
+    """
+    Shows one of its children and keeps the others that have been shown mounted but hidden.
+
+    Pages are built on their first visit, so children can be given as functions returning
+    the page; widgets work too but are then constructed on every build of the parent. With a
+    controller kept in the State, switching pages is a class toggle (see
+    IndexedStackController). Without one, the stack follows `index` like any other widget
+    and keeps nothing across rebuilds.
+
+    Args:
+        children (list): The pages, as widgets or as functions building them.
+        index (int, optional): The visible page. Defaults to the controller's index.
+        controller (IndexedStackController, optional): Owns the pages across rebuilds.
+        maxAlive (int, optional): The most pages kept alive when no controller is given.
+    """
+    base_css = ".keep-alive-page:not(.active) { content-visibility: hidden; }"
+
+    def __init__(self, children, index=None, controller=None, maxAlive=None):
+        super().__init__(widget_id=None)
+        if controller is None:
+            # Discarded with this stack on the next build, so its pages go with the tree
+            controller = IndexedStackController(index or 0, maxAlive)
+            controller.owned = False
+        self.controller = controller
+        if index is not None:
+            self.controller.index = index
+        self.controller._children = tuple(children)
+        self.controller._page(self.controller.index)
+        self.controller._evict()
+        self.set_children(self.controller._pages.values())
+
+    def to_html(self):
+        controller = self.controller
+        controller._pending_html.clear()  # Every alive page is part of this render
+        pages_html = ''.join(page.to_html() for page in controller._pages.values())
+        return f"""
+        <div id="{self.widget_id()}" class="indexed-stack" data-pythra-stack="{controller.id}">
+            <style>{IndexedStack.base_css}</style>
+            {pages_html}
+        </div>
+        """
+
+
+class NavigatorController(IndexedStackController):
+    """
+    Holds the routes and the history of a Navigator.
+
+    Route builders run on the first push of their route only. Routes that are popped or
+    pushed over stay mounted (hidden) in a cache of `maxCached` routes, so going back is a
+    class toggle, and routes listed in `prerender` are built and rendered in idle time
+    after startup, so their first push only sends the rendered HTML.
+
+    A cached route keeps the widgets its builder returned, so a route built from changing
+    data has to be rebuilt explicitly: push it with `rebuild=True`, or call `invalidate()`.
+
+    Keep the controller in your State and pass it to a Navigator in `build()`.
+
+    Example:
+        self.navigator = NavigatorController(
+            routes={
+                '/': HomePage,
+                '/settings': SettingsPage,
+                '/details': lambda: DetailsPage(self.selected),
+            },
+            prerender=['/settings'],
+        )
+        ...
+        self.selected = item
+        self.navigator.push('/details', rebuild=True)  # Built again for the new item
+
+    Attributes:
+        routes (dict): Route name -> function building the route's widget.
+        history (list): The route names, with the visible route last.
+    """
+
+    def __init__(self, routes, initialRoute='/', maxCached=5, prerender=(), prerenderDelay=200):
+        """
+        Initializes the controller.
+
+        Args:
+            routes (dict): Route name -> function building the route's widget.
+            initialRoute (str): The first route shown. Defaults to '/'.
+            maxCached (int): The most routes kept mounted, including the visible one. Defaults to 5.
+            prerender (iterable): Routes to build and render in idle time. Defaults to none.
+            prerenderDelay (int): Milliseconds between prerendered routes. Defaults to 200.
+        """
+        super().__init__(initialIndex=initialRoute, maxAlive=maxCached)
+        self.routes = dict(routes)
+        self.history = [initialRoute]
+        self.prerenderDelay = prerenderDelay
+        self._prerender_queue = []
+        self.prerender(*prerender)
+
+    @property
+    def current_route(self):
+        """str: The name of the visible route."""
+        return self.history[-1]
+
+    def push(self, name, rebuild=False):
+        """
+        Shows the route `name` on top of the current one.
+
+        Args:
+            name (str): The route name.
+            rebuild (bool): Runs the route builder again instead of showing the cached
+                route. Defaults to False.
+        """
+        if name not in self.routes:
+            raise KeyError(f"Unknown route: {name}")
+        self.history.append(name)
+        if rebuild:
+            self.invalidate(name)
+        self.jump_to(name)
+
+    def replace(self, name):
+        """
+        Shows the route `name` in place of the current one.
+
+        Args:
+            name (str): The route name.
+        """
+        if name not in self.routes:
+            raise KeyError(f"Unknown route: {name}")
+        self.history[-1] = name
+        self.jump_to(name)
+
+    def can_pop(self):
+        """Returns whether there is a route to go back to."""
+        return len(self.history) > 1
+
+    def pop(self):
+        """
+        Goes back to the previous route. The popped route stays cached.
+
+        Returns:
+            str or None: The popped route name, or None if there was nothing to pop.
+        """
+        if not self.can_pop():
+            return None
+        popped = self.history.pop()
+        self.jump_to(self.history[-1])
+        return popped
+
+    def prerender(self, *names):
+        """
+        Queues routes to be built and rendered in idle time, one at a time.
+
+        Args:
+            *names (str): The route names.
+        """
+        was_idle = not self._prerender_queue
+        self._prerender_queue.extend(name for name in names if name in self.routes)
+        if was_idle and self._prerender_queue:
+            QTimer.singleShot(self.prerenderDelay, self._prerender_next)
+
+    def _prerender_next(self):
+        if not self._prerender_queue:
+            return
+        name = self._prerender_queue.pop(0)
+        with instrumentation.timer('prerender', route=name):
+            self.preload(name)
+        if self._prerender_queue:
+            QTimer.singleShot(self.prerenderDelay, self._prerender_next)
+
+    def _child(self, index):
+        return self.routes.get(index)
+
+
+class Navigator(IndexedStack):
+    """
+    Shows the current route of a NavigatorController.
+
+    Navigating with the controller (`push`, `pop`, `replace`) does not rebuild the parent:
+    cached routes are shown by a class toggle and new routes are rendered and inserted on
+    their own, so the cost of a navigation is the size of that patch.
+
+    Args:
+        controller (NavigatorController): The routes and history.
+    """
+
+    def __init__(self, controller):
+        super().__init__((), controller=controller)
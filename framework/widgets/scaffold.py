@@ -0,0 +1,772 @@
+# framework/widgets/scaffold.py
+import logging
+import time
+
+from ..api import Api
+from ..base import Widget
+from ..reactive import _send
+from ..styles import *
+from .layout import containment_css
+
+logger = logging.getLogger(__name__)
+
+Colors = Colors()
+
+
+class AppBar(Widget):
+    def __init__(self, title=None, actions=None, leading=None, backgroundColor=None, elevation=None, centerTitle=None, titleSpacing=None, pinned=False, bottom=None, shadowColor=Colors.rgba(0,0,0,0.2)):
+        super().__init__(widget_id=None)
+        self.title = title
+        self.actions = actions or []
+        self.leading = leading
+        self.backgroundColor = backgroundColor
+        self.elevation = elevation
+        self.centerTitle = centerTitle
+        self.titleSpacing = titleSpacing
+        self.shadowColor = shadowColor
+        self.pinned = pinned
+        self.bottom = bottom
+        
+        self.add_child(self.title) if self.title else None
+        self.add_child(self.leading) if self.leading else None
+
+        for action in self.actions:
+            self.add_child(action) if action else None
+    
+
+
+
+    def to_html(self):
+        pinned_style = 'position: fixed; width: 100%;' if self.pinned else 'position: relative;'
+        app_bar_style = ""
+        if self.backgroundColor:
+            app_bar_style += f"background-color: {self.backgroundColor};"
+        if self.elevation:
+            app_bar_style += f"box-shadow: 0 {self.elevation}px 5px {self.shadowColor};"
+        
+        # Define height and ensure it affects layout
+        app_bar_style += f"box-shadow: 0 6px 5px rgba(0, 0, 0, 0.2); height: 56px; display: flex; align-items: center; position: relative; z-index: 1;"
+
+        leading_html = self.leading.to_html() if self.leading else ""
+        title_html = self.title.to_html() if self.title else ""
+        center_title = self.centerTitle.to_html() if self.centerTitle else ""
+        actions_html = ''.join([action.to_html() for action in self.actions])
+
+        bottom_html = self.bottom.to_html() if self.bottom else ""
+
+        leading_css = f'margin-left: 16px;' if self.leading else ""
+        action_css = f'margin-right: 16px;' if self.actions else ""
+        title_spacing = self.titleSpacing if self.titleSpacing else 10
+
+        return f"""
+        <div id="{self.widget_id()}" class="app-bar" style="{app_bar_style}">
+            <div style="{leading_css}">{leading_html}</div>
+            <div style="flex: 1; margin-left: {title_spacing}px;">{title_html}</div>
+            <div style="flex: 1; text-align: center;">{center_title}</div>
+            <div style="{action_css}">{actions_html}</div>
+            {bottom_html}
+        </div>
+        """
+
+
+class BottomNavigationBar(Widget):
+    def __init__(self, 
+                 items, 
+                 onTap=None, 
+                 currentIndex=0, 
+                 fixedColor=None, 
+                 backgroundColor= Colors.white , 
+                 elevation=10, 
+                 iconSize=30, 
+                 selectedFontSize=18, 
+                 unselectedFontSize=14, 
+                 selectedItemColor= Colors.blue , 
+                 unselectedItemColor= Colors.grey ,
+                 showSelectedLabels=True, 
+                 showUnselectedLabels=False, 
+                 landscapeLayout="centered",
+                 controller=None):
+        super().__init__(widget_id=None)
+        self.items = items
+        self.onTap = onTap
+        # With an IndexedStackController, taps switch its pages and patch only this bar
+        self.controller = controller
+        self.currentIndex = controller.index if controller else currentIndex
+        self.fixedColor = fixedColor
+        self.backgroundColor = backgroundColor
+        self.elevation = elevation
+        self.iconSize = iconSize
+        self.selectedFontSize = selectedFontSize
+        self.unselectedFontSize = unselectedFontSize
+        self.selectedItemColor = selectedItemColor
+        self.unselectedItemColor = unselectedItemColor
+        self.showSelectedLabels = showSelectedLabels
+        self.showUnselectedLabels = showUnselectedLabels
+        self.landscapeLayout = landscapeLayout
+
+        self.api = Api()
+        self.onTapName = self.onTap.__name__ if self.onTap else ''
+
+
+
+        for item in self.items:
+            self.add_child(item) if item else None
+
+
+    def to_html(self):
+        if self.controller:
+            self.onTapName = f"__bottomnav_{self.controller.id.replace('-', '_')}_tap"
+            self.api.register_callback(self.onTapName, self._on_controller_tap)
+        else:
+            self.api.register_callback(self.onTapName, self.onTap)
+        items_html = ''
+        for index, item in enumerate(self.items):
+            selected = index == self.currentIndex
+            color = self.selectedItemColor if selected else self.unselectedItemColor
+            font_size = self.selectedFontSize if selected else self.unselectedFontSize
+
+            item.icon.size = self.iconSize
+            
+
+            item_html = item.to_html(selected=selected, showSelectedLabels = self.showSelectedLabels, showUnselectedLabels= self.showUnselectedLabels, fixedColor=self.fixedColor)
+            item_style = f"color: {color}; font-size: {font_size}px; cursor: pointer; flex: 1;"
+            items_html += f"<div onclick='handleClickOnTap(\"{self.onTapName}\", {index})' style='{item_style}'>{item_html}</div>"
+
+        return f"""
+        <div id="{self.widget_id()}" class="bottom-nav" id="bottomNav">
+            {items_html}
+        </div>
+        """
+
+    def _on_controller_tap(self, index):
+        self.currentIndex = index
+        self.controller.jump_to(index)
+        framework = self._framework_ref()
+        if framework:
+            framework.update_widget(self.widget_id(), self.to_html())
+        if self.onTap:
+            self.onTap(index)
+
+
+class BottomNavigationBarItem(Widget):
+    def __init__(self, icon, label):
+        
+        super().__init__(widget_id=None)
+        self.icon = icon
+        self.label = label
+
+
+        self.add_child(self.icon) if self.icon else None
+        self.add_child(self.label) if self.label else None
+    
+
+
+    def to_html(self, selected=False, showSelectedLabels=True, showUnselectedLabels=False, iconSize=30, fixedColor=None):
+        # Set the color to fixedColor if provided, otherwise use default behavior
+        color = fixedColor if fixedColor else None
+        self.icon.color = color
+        
+        icon_html = self.icon.to_html()
+        should_show_label = (selected and showSelectedLabels) or (not selected and showUnselectedLabels)
+        should_color_label = (fixedColor and selected) or (not fixedColor and selected)
+        label_color = fixedColor if should_color_label else '#aaa'
+        label = self.label
+        #label.style()
+        label_html = f"<div style='color: {label_color};'>{self.label.to_html()}</div>" if should_show_label else ''
+
+        return f"<div id='{self.widget_id()}' style='text-align: center; '>{icon_html}{label_html}</div>"
+
+
+class Scaffold(Widget):
+    def __init__(self, 
+                 appBar=None, 
+                 body=None, 
+                 floatingActionButton=None, 
+                 bottomNavigationBar=None, 
+                 drawer=None, 
+                 endDrawer=None, 
+                 bottomSheet=None, 
+                 persistentFooterButtons=None,
+                 snackBar=None,
+                 backgroundColor=Colors.white,
+                 resizeToAvoidBottomInset=True,
+                 extendBody=False,
+                 extendBodyBehindAppBar=False,
+                 drawerDragStartBehavior=None,
+                 drawerEdgeDragWidth=None,
+                 drawerEnableOpenDragGesture=True,
+                 endDrawerEnableOpenDragGesture=True,
+                 drawerScrimColor=Colors.rgba(0, 0, 0, 0.5),
+                 onDrawerChanged=None,
+                 onEndDrawerChanged=None,
+                 persistentFooterAlignment=MainAxisAlignment.CENTER,
+                 primary=True,
+                 key=None):
+        super().__init__(widget_id=None)
+        self.appBar = appBar
+        self.body = body
+        self.floatingActionButton = floatingActionButton
+        self.bottomNavigationBar = bottomNavigationBar
+        self.drawer = drawer
+        self.endDrawer = endDrawer
+        self.bottomSheet = bottomSheet
+        self.persistentFooterButtons = persistentFooterButtons
+        self.snackBar = snackBar
+        self.backgroundColor = backgroundColor
+        self.resizeToAvoidBottomInset = resizeToAvoidBottomInset
+        self.extendBody = extendBody
+        self.extendBodyBehindAppBar = extendBodyBehindAppBar
+        self.drawerDragStartBehavior = drawerDragStartBehavior
+        self.drawerEdgeDragWidth = drawerEdgeDragWidth
+        self.drawerEnableOpenDragGesture = drawerEnableOpenDragGesture
+        self.endDrawerEnableOpenDragGesture = endDrawerEnableOpenDragGesture
+        self.drawerScrimColor = drawerScrimColor
+        self.onDrawerChanged = onDrawerChanged
+        self.onEndDrawerChanged = onEndDrawerChanged
+        self.persistentFooterAlignment = persistentFooterAlignment
+        self.primary = primary
+        self.key = key
+
+
+        children = [
+            self.appBar, 
+            self.body, 
+            self.floatingActionButton,
+            self.bottomNavigationBar,
+            self.drawer,
+            self.endDrawer,
+            self.bottomSheet,
+            self.snackBar
+            ]
+
+        for child in children:
+            self.add_child(child) if child else None
+        
+
+
+    def to_html(self):
+        appBar_html = self.appBar.to_html() if self.appBar else ""
+        body_html = self.body.to_html() if self.body else ""
+        # body_id = self.body._id if self.body else "" # Not used in JS currently
+        floating_action_button_html = self.floatingActionButton.to_html() if self.floatingActionButton else ""
+        bottom_navigation_bar_html = self.bottomNavigationBar.to_html() if self.bottomNavigationBar else "" # Ensure this renders id="bottomNav"
+        drawer_html = self.drawer.to_html() if self.drawer else ""
+        end_drawer_html = self.endDrawer.to_html() if self.endDrawer else ""
+        bottom_sheet_html = self.bottomSheet.to_html() if self.bottomSheet else ""
+        snack_bar_html = self.snackBar.to_html() if self.snackBar else ""
+        footer_buttons_html = ''.join([button.to_html() for button in (self.persistentFooterButtons or [])])
+
+        # Styles are better handled in CSS, but keep if needed for specific overrides
+        background_color_style = f"background-color: {self.backgroundColor};"
+        # These style calculations are complex and might be better handled purely in CSS flexbox/grid
+        # extend_body_style = "position: absolute; top: 56; bottom: 0; left: 0; right: 0;" if self.extendBody or self.extendBodyBehindAppBar else ""
+        # body_margin_top = "margin-top: 0px;" if self.appBar and not self.extendBodyBehindAppBar else ""
+
+
+        # Drawers opened in the page stay open across rebuilds
+        left_open = bool(self.drawer and self.drawer.is_open)
+        right_open = bool(self.endDrawer and self.endDrawer.is_open)
+        body_classes = "body" + (" left-open" if left_open else "") + (" right-open" if right_open else "")
+
+        return f"""
+        <div id="{self.widget_id()}" class="{body_classes}" style="{background_color_style}">
+            {appBar_html} 
+            <div class="drawer left{' open' if left_open else ''}" id="leftDrawer">
+                {drawer_html}
+            </div>
+
+            <div class="drawer right{' open' if right_open else ''}" id="rightDrawer">
+                {end_drawer_html}
+            </div>
+
+            <div class="content" id="content">
+                {body_html}
+            </div>
+
+            {floating_action_button_html}
+            {bottom_sheet_html}
+            {snack_bar_html}
+            <div style="position: absolute; bottom: 0; width: 100%; display: flex; justify-content: {self.persistentFooterAlignment};">
+                {footer_buttons_html}
+            </div>
+            <div id="bottomNav" class="bottom-nav">
+            {bottom_navigation_bar_html} 
+            </div>
+        </div>
+        """
+        
+
+
+class Body(Widget):
+    def __init__(self, child=None):
+        super().__init__(widget_id=None)
+        self.child = child
+        self.id = self.widget_id()
+
+        self.add_child(self.child) if self.child else None # Register the child widget with the framework
+        
+    def id(self):
+        #print("Body: ", self.widget_id())
+        return self.widget_id()
+
+    def to_html(self):
+        child_html = self.child.to_html() if self.child else ''
+        
+        return f"{child_html}"
+
+
+class Drawer(Widget):
+
+    _instance = None  # Class-level attribute to store the single instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            # If an instance doesn't exist, create one
+            cls._instance = super(Drawer, cls).__new__(cls)
+        return cls._instance  # Return the singleton instance
+
+    def __init__(self, child, width=250, divider=None, borderRight= BorderSide(width=0.1, style=BorderStyle.SOLID), elevation='', padding=EdgeInsets.all(20), backgroundColor=Colors.white, containment=None):
+        # Only initialize the instance once
+        if not hasattr(self, 'initialized'):
+            super().__init__(widget_id=None)
+            self.child = child
+            self.width = width
+            self.padding = padding
+            self.borderRight = borderRight
+            self.containment = containment  # Skips rendering the contents while closed (None: config default)
+            self.elevation = elevation
+            self.divider = divider
+            self.backgroundColor = backgroundColor
+            self.is_open = False
+            self.add_child(self.child) if self.child else None
+            self.initialized = True  # Mark the instance as initialized
+
+
+        self.add_child(self.child) if self.child else None# Register the child widget with the framework
+    
+
+
+    def to_html(self):
+        
+        divider = self.divider.to_html() if self.divider else ''
+        drawer_width = self.width + self.padding.to_int_horizontal() + self.borderRight.to_int()
+        border = self.borderRight.border_to_css() if self.borderRight else ''
+        drawer_width = '0px' if self.is_open else f'-{drawer_width}' 
+        logger.debug("Drawer width: %s %s open=%s", self.width, drawer_width, self.is_open)
+
+        return f"""
+        <div id="{self.widget_id()}" style="width: {self.width}px; padding: {self.padding.to_css()}; height: 100%; background: {self.backgroundColor}; box-shadow:{self.elevation}; overflow-y: auto; border-right: {border}; {containment_css(self.containment, width=self.width)}">
+            {self.child.to_html()}{divider}
+        </div>
+        """
+
+    def toggle(self, bool=False):
+        """
+        Opens or closes the drawer in the page. Only classes change: there is no rebuild and
+        the content slides with a transform.
+
+        Args:
+            bool (bool): True to open the drawer, False to close it.
+        """
+        self.is_open = bool  # A rebuild renders the drawer in this state
+        _send(f"pythraOverlays.drawer('left', {'true' if bool else 'false'});")
+
+
+class EndDrawer(Widget):
+    _instance = None  # Class-level attribute to store the single instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            # If an instance doesn't exist, create one
+            cls._instance = super(EndDrawer, cls).__new__(cls)
+        return cls._instance  # Return the singleton instance
+
+    def __init__(self, child, width=250, divider=None, borderLeft= BorderSide(width=0.1, style=BorderStyle.SOLID), elevation='', padding=EdgeInsets.all(20), backgroundColor=Colors.white, containment=None):
+        # Only initialize the instance once
+        if not hasattr(self, 'initialized'):
+            super().__init__(widget_id=None)
+            self.child = child
+            self.width = width
+            self.padding = padding
+            self.borderLeft = borderLeft
+            self.containment = containment  # Skips rendering the contents while closed (None: config default)
+            self.elevation = elevation
+            self.divider = divider
+            self.backgroundColor = backgroundColor
+            self.is_open = False
+            self.initialized = True  # Mark the instance as initialized
+
+
+        self.add_child(self.child) if self.child else None# Register the child widget with the framework
+    
+
+
+    def to_html(self):
+        divider = self.divider.to_html() if self.divider else ''
+        end_drawer_width = self.width + self.padding.to_int_horizontal() + self.borderLeft.to_int()
+        end_drawer_width = '0px' if self.is_open else end_drawer_width
+        border = self.borderLeft.border_to_css() if self.borderLeft else ''
+        return f"""
+        <div id="{self.widget_id()}" style="width: {self.width}px; padding: {self.padding.to_css()}; height: 100%; background: {self.backgroundColor}; overflow-y: auto; box-shadow:{self.elevation}; border-left: {border}; {containment_css(self.containment, width=self.width)}">
+            {self.child.to_html()}{divider}
+        </div>
+        """
+
+    def toggle(self, bool=False):
+        """
+        Opens or closes the end drawer in the page. Only classes change: there is no rebuild and
+        the content slides with a transform.
+
+        Args:
+            bool (bool): True to open the drawer, False to close it.
+        """
+        self.is_open = bool  # A rebuild renders the end drawer in this state
+        _send(f"pythraOverlays.drawer('right', {'true' if bool else 'false'});")
+
+
+class BottomSheet(Widget):
+    _instance = None  # Class-level attribute to store the single instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            # If an instance doesn't exist, create one
+            cls._instance = super(BottomSheet, cls).__new__(cls)
+        return cls._instance  # Return the singleton instance
+        
+    def __init__(self, child, height=300, backgroundColor=Colors.white, elevation='', padding=EdgeInsets.all(20), enableDrag=True):
+         # Only initialize the instance once
+        if not hasattr(self, 'initialized'):
+            super().__init__(widget_id=None)
+            self.child = child
+            self.height = height
+            self.backgroundColor = backgroundColor
+            self.elevation = elevation
+            self.padding = padding
+            self.enableDrag = enableDrag
+            self.is_open = False
+            self.show_barrier = False
+            self.barrier_color = Colors.rgba(0, 0, 0, 0.5) # Modal barrier color (overlay)
+            self.initialized = True  # Mark the instance as initialized
+
+
+
+            self.add_child(self.child) if self.child else None# Register the child widget with the framework
+
+
+    def to_html(self):
+        widget_id = self.widget_id()
+        open_class = ' open' if self.is_open else ''
+        # Barrier for background dimming (optional); it fades with the sheet
+        barrier_html = f'<div id="{widget_id}-barrier" class="bottom-sheet-barrier{open_class}" style="background-color: {self.barrier_color};"></div>' if self.show_barrier else ''
+        drag_behavior = 'cursor: grab;' if self.enableDrag else ''
+        return f"""
+        {barrier_html} 
+        <div id="{widget_id}" class="bottom-sheet{open_class}" style="height: {self.height}px; padding: {self.padding.to_css()}; background-color: {self.backgroundColor}; box-shadow:{self.elevation}; {drag_behavior}">
+            {self.child.to_html()}
+        </div>
+        """
+
+
+    def toggle(self, bool=False):
+        """
+        Opens or closes the bottom sheet in the page by toggling its class, without a rebuild.
+
+        Args:
+            bool (bool): True to open the sheet, False to close it.
+
+        Returns:
+            bool: The new state.
+        """
+        self.is_open = bool
+        _send(f"pythraOverlays.sheet('{self.widget_id()}', {'true' if bool else 'false'});")
+        return self.is_open
+
+
+class SnackBar(Widget):
+    """
+    A message shown at the bottom of the Scaffold, hidden by the page after `duration`.
+
+    Args:
+        content (Widget): The message.
+        action (SnackBarAction, optional): A button shown next to the message.
+        duration (int): Milliseconds the snack bar stays shown. Defaults to 3000. Values
+            below 100 are taken as seconds, as in earlier versions, with a warning.
+        backgroundColor (str): The background color. Defaults to grey.
+        padding (EdgeInsets): The inner padding.
+    """
+    _instance = None  # Class-level attribute to store the single instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            # If an instance doesn't exist, create one
+            cls._instance = super(SnackBar, cls).__new__(cls)
+        return cls._instance  # Return the singleton instance
+
+
+    def __init__(self, content, action=None, duration=3000, backgroundColor=Colors.grey, padding=EdgeInsets.symmetric(horizontal=24, vertical=16)):
+         # Only initialize the instance once
+        if not hasattr(self, 'initialized'):    
+            super().__init__(widget_id=None)
+            self.content = content
+            self.action = action
+            if duration < 100:
+                # Earlier versions took seconds; no snack bar is meant to last under 100 ms
+                logger.warning("SnackBar duration is in milliseconds now; treating %s as seconds.", duration)
+                duration = duration * 1000
+            self.duration = duration
+            self.backgroundColor = backgroundColor
+            self.padding = padding
+            self.is_open = False
+            self._hide_at = 0  # Monotonic time in ms at which the page hides the shown snack bar
+            self.initialized = True  # Mark the instance as initialized
+            self.current_id = None
+
+
+            children = [
+                self.content,
+                self.action,
+            ]
+        
+            for child in children:
+                self.add_child(child) if child else None# Register the child widget with the framework
+
+    def to_html(self):
+        self.current_id = self.widget_id()
+        action_html = self.action.to_html() if self.action else ""
+        # The page hides the snack bar on its own; a rebuild while it is shown keeps the remaining time
+        remaining = int(self._hide_at - time.monotonic() * 1000) if self.is_open else 0
+        self.is_open = remaining > 0
+        open_class = " open" if self.is_open else ""
+        duration = remaining if self.is_open else self.duration
+        return f"""
+        <div id="{self.current_id}" class="snack-bar{open_class}" data-duration="{duration}"
+        style="padding: {self.padding.to_css()}; 
+        background-color: {self.backgroundColor};">
+            <div>{self.content.to_html()}</div>
+            {action_html}
+        </div>
+        """
+
+    def get_id(self):
+        return self.current_id
+
+    def toggle(self, bool=False):
+        """
+        Shows or hides the snack bar in the page. A shown snack bar is hidden by the page
+        after `duration` milliseconds, without a round trip to Python.
+
+        Args:
+            bool (bool): True to show the snack bar, False to hide it.
+
+        Returns:
+            bool: The new state.
+        """
+        self.is_open = bool
+        self._hide_at = time.monotonic() * 1000 + self.duration if bool else 0
+        _send(f"pythraOverlays.snackBar('{self.widget_id()}', {'true' if bool else 'false'}, {int(self.duration)});")
+        return self.is_open
+
+
+class SnackBarAction(Widget):
+    _instance = None  # Class-level attribute to store the single instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            # If an instance doesn't exist, create one
+            cls._instance = super(SnackBarAction, cls).__new__(cls)
+        return cls._instance  # Return the singleton instance
+
+
+    def __init__(self, label, onPressed, textColor=Colors.blue):
+        # Only initialize the instance once
+        if not hasattr(self, 'initialized'): 
+            super().__init__(widget_id=None)
+            self.label = label
+            self.onPressed = onPressed
+            self.textColor = textColor
+
+            self.api = Api()
+            self.onPressedName = self.onPressed.__name__ if self.onPressed else ''
+
+            self.add_child(self.label) if self.label else None
+
+    
+
+    def to_html(self):
+        self.api.register_callback(self.onPressedName, self.onPressed)
+
+        return f"""
+        <button id="{self.widget_id()}" 
+        onclick="handleClick(\'{self.onPressedName}\')" 
+        style="background: none; 
+        border: none; 
+        color: {self.textColor}; 
+        font-size: 14px; 
+        cursor: pointer;">
+            {self.label.to_html()}
+        </button>
+        """
+
+
+class Dialog(Widget):
+
+    _instance = None  # Class-level attribute to store the single instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            # If an instance doesn't exist, create one
+            cls._instance = super(Dialog, cls).__new__(cls)
+        return cls._instance  # Return the singleton instance
+
+    def __init__(self,
+                 title=None,
+                 content=None,
+                 actions=None,
+                 title_alignment=TextAlign.center(),  # Allows title alignment customization
+                 title_padding=EdgeInsets.all(10),  # Padding around the title
+                 content_padding=EdgeInsets.all(5),  # Padding around the content
+                 dialog_shape=BorderRadius.all(10),  # Custom shape (border radius)
+                 elevation=8,  # Shadow depth for elevation
+                 background_color=Colors.hex("#fff"),  # Background color
+                 barrier_color=Colors.rgba(0, 0, 0, 0.5),  # Modal barrier color (overlay)
+                 padding=EdgeInsets.all(20)):  # Padding inside the dialog
+
+        # Only initialize the instance once
+        if not hasattr(self, 'initialized'):
+            super().__init__(widget_id=None)
+            self.title = title
+            self.content = content
+            self.actions = actions or []
+            self.title_alignment = title_alignment
+            self.title_padding = title_padding
+            self.content_padding = content_padding
+            self.dialog_shape = dialog_shape
+            self.elevation = elevation
+            self.background_color = background_color
+            self.barrier_color = barrier_color
+            self.padding = padding
+
+            if self.content:
+                self.add_child(self.content)
+                self.add_child(self.title)
+            for action in self.actions:
+                self.add_child(action)
+
+            self.initialized = True  # Mark the instance as initialized
+
+    def to_html(self):
+        # Title HTML
+        title_html = f'<div style="text-align: {self.title_alignment.to_css()}; padding: {self.title_padding.to_css()};">{self.title.to_html()}</div>' if self.title else ""
+        
+        # Content HTML
+        content_html = f'<div style="padding: {self.content_padding.to_css()}; margin-top: 4px;">{self.content.to_html()}</div>' if self.content else ""
+        
+        # Actions (buttons, etc.)
+        actions_html = "".join([action.to_html() for action in self.actions])
+
+        # Calculate box-shadow based on elevation for the dialog
+        box_shadow = f"0 {self.elevation}px {self.elevation * 2}px rgba(0, 0, 0, 0.2)"
+        
+        # Dialog CSS
+        dialog_css = (
+            f"{self.dialog_shape.to_css()}"  # Dialog shape (border-radius)
+            f"background-color: {self.background_color};"
+            f"padding: {self.padding.to_css()};"
+            f"position: fixed; top: 50%; left: 50%;"
+            f"transform: translate(-50%, -50%);"
+            f"box-shadow: {box_shadow};"  # Elevation (shadow)
+            f"max-width: 330px; min-width: 180px;"
+            f"z-index: 1000;"
+        )
+
+        # Barrier for background dimming (optional)
+        barrier_html = f'''<div style="position: fixed; 
+        top: 0; left: 0; width: 100vw; 
+        height: 100vh; background-color: {self.barrier_color}; 
+        z-index: 999;"></div>'''
+
+        # Full dialog HTML
+        return f'''
+        {barrier_html}  <!-- Barrier to block interaction outside the dialog -->
+        <div style="{dialog_css}">
+            {title_html}
+            {content_html}
+            <div class="dialog-actions" 
+            style="margin-top: 20px;">
+            {actions_html}
+            </div>
+        </div>
+        '''
+
+
+"""
+class Dialog(Widget):
+
+    _instance = None  # Class-level attribute to store the single instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            # If an instance doesn't exist, create one
+            cls._instance = super(Dialog, cls).__new__(cls)
+        return cls._instance  # Return the singleton instance
+    def __init__(
+            self,
+            title=None, 
+            content=None, 
+            actions=None, 
+            ):
+         # Only initialize the instance once
+        if not hasattr(self, 'initialized'):    
+            super().__init__(widget_id=None)
+            self.title = title
+            self.content = content
+            self.actions = actions or []
+            self.color = color=Colors.hex("#fff")
+            self.border = BorderSide(color=Colors.hex("#000"), style=BorderStyle.SOLID, width=1, borderRadius=5)
+            self.initialized = True  # Mark the instance as initialized
+
+            if self.content:
+                self.add_child(self.content)
+                self.add_child(self.title)
+            for action in self.actions:
+                self.add_child(action)
+
+    def css(self):
+        
+        
+        # Additional CSS for modal display
+        modal_css = (
+            f"{self.border.to_css()}"
+            f"background-color: {self.color};"
+            "padding: 15px;"
+            "position: fixed; "
+            "top: 50%; left: 50%; "
+            "transform: translate(-50%, -50%); "
+            "box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); "
+            "z-index: 1000;"
+        )
+        
+        return f"{modal_css}"
+
+    def to_html(self):
+        # Title HTML
+        title_html = self.title.to_html() if self.title else ""
+        
+        # Content HTML
+        content_html = f'<div style="margin-top: 4px;">{self.content.to_html()}</div>' if self.content else ""
+        
+        # Actions (buttons, etc.)
+        actions_html = "".join([action.to_html() for action in self.actions])
+
+        # Full dialog HTML
+        dialog_css = self.css()
+        return f'''
+        <div style="{dialog_css}">
+            {title_html}
+            {content_html}
+            <div class="dialog-actions">{actions_html}</div>
+        </div>
+        '''
+
+
+"""
@@ -0,0 +1,72 @@
+# framework/widgets/text.py
+from ..base import Widget, style_field
+from ..reactive import ValueNotifier
+from ..styles import *
+
+
+class Text(Widget):
+    __slots__ = ('data', 'key', 'style_key', 'css_class')
+
+    shared_styles = {}  # Stores unique style definitions for shared CSS
+    _style_keys = {}    # Canonical style key tuples
+
+    style = style_field(0)
+    textAlign = style_field(1)
+    overflow = style_field(2)
+
+    def __init__(self, data, key=None, style=None, textAlign=None, overflow=None, widget_id=None):
+        super().__init__(widget_id)
+        self.data = data
+        self.key = key
+        if isinstance(data, ValueNotifier):
+            # Changes patch this text node directly, without a rebuild
+            data.bind_text(self)
+
+        # Generate a unique style key for deduplication and reuse the shared class
+        self.style_key, self.css_class = Text._intern_style((
+            style or TextStyle(),
+            textAlign,
+            overflow,
+        ), 'shared-text')
+
+    @staticmethod
+    def css_declarations(style_key):
+        """
+        Returns the CSS declarations for a text style key.
+
+        Args:
+            style_key (tuple): The text's style key.
+
+        Returns:
+            str: The declarations, separated by semicolons.
+        """
+        style, textAlign, overflow = style_key
+
+        style_str = style.to_css() if style else ''
+        text_align_str = f"text-align: {textAlign};" if textAlign else ''
+        overflow_str = f"overflow: {overflow};" if overflow else ''
+
+        return f"""
+                margin-top: 0px;
+                margin-bottom: 0px;
+                {style_str}
+                {text_align_str}
+                {overflow_str}
+        """
+
+    def to_css(self):
+        """Return the shared CSS rules for the text's styles."""
+        return Text.shared_css()
+
+    def to_html(self):
+        """Generate the HTML for the text."""
+        return f"""
+        <p id="{self.widget_id()}" class="{self.css_class}">
+            {self.data}
+        </p>
+        """
+
+    def to_js(self):
+        """Generate JavaScript for the text widget."""
+        # Placeholder for any shared or specific JavaScript logic
+        return ""
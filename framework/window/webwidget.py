@@ -1,19 +1,171 @@
 from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout
-from PySide6.QtCore import Qt, QObject, Slot, QUrl
+from PySide6.QtCore import Qt, QObject, Slot, Signal, QUrl, QTimer
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import QWebEngineSettings
 from PySide6.QtWebChannel import QWebChannel
+import itertools
+import json
+import logging
+import os
 import sys
+import time
 
 app = QApplication(sys.argv)
 
+logger = logging.getLogger(__name__)
+
 class WindowManager:
+    """
+    Keeps track of the open windows and of a pool of pre-warmed, hidden web windows.
+
+    A pooled window has already created its web view and web channel and loaded the shell
+    page (runtime JS and base CSS, empty body), so `acquire()` only injects the rendered
+    body and shows it. Closed pooled windows go back to the pool; windows left unused in
+    the pool for longer than `pool_idle_timeout` seconds are destroyed, except the most
+    recently used one, so the next `acquire()` always finds a warm window. The rest of the
+    pool is refilled in the background the next time one is acquired.
+
+    Attributes:
+        windows (dict): Window ID -> open window.
+        pool_size (int): The number of windows kept warm. 0 disables the pool.
+        pool_idle_timeout (float): Seconds before an unused pooled window past the first is
+            evicted. 0 keeps them.
+    """
     def __init__(self):
         self.windows = {}
+        self.pool_size = 0
+        self.pool_idle_timeout = 0
+        self._pool = []  # (window, time it became idle)
+        self._pool_page = None
+        self._pool_html = None  # The shell page, when it is loaded from memory
+        self._pool_api = None
+        self._pool_ids = itertools.count()
+        self._eviction_timer = None
 
     def register_window(self, window_id, window):
         self.windows[window_id] = window
 
+    def configure_pool(self, html_file, js_api=None, size=1, idle_timeout=120, html=None):
+        """
+        Sets up the window pool. Call it once the main window exists; the pool fills up
+        when the event loop is idle, so it does not delay the first window.
+
+        Args:
+            html_file (str): The shell page loaded by pooled windows.
+            js_api (Api, optional): The object exposed to the pages as `pywebview`.
+            size (int): The number of windows kept warm. Defaults to 1.
+            idle_timeout (float): Seconds before an unused pooled window past the first is
+                evicted. Defaults to 120.
+            html (str, optional): The content of the shell page, loaded from memory with
+                `html_file` as its base URL, for when the file could not be written.
+        """
+        self._pool_page = html_file
+        self._pool_html = html
+        self._pool_api = js_api
+        self.pool_size = max(0, int(size or 0))
+        self.pool_idle_timeout = idle_timeout or 0
+        if self.pool_size:
+            QTimer.singleShot(0, self.prewarm)
+        if self.pool_idle_timeout and self._eviction_timer is None:
+            self._eviction_timer = QTimer()
+            self._eviction_timer.timeout.connect(self._evict_idle)
+            self._eviction_timer.start(int(min(self.pool_idle_timeout, 30) * 1000))
+
+    def prewarm(self):
+        """
+        Creates hidden windows until the pool holds `pool_size` of them.
+        """
+        while self._pool_page and len(self._pool) < self.pool_size:
+            window = self._new_window("", f"__pool_{next(self._pool_ids)}")
+            window.pooled = True
+            self._pool.append((window, time.monotonic()))
+            logger.debug("Pre-warmed window %s", window.window_id)
+
+    def acquire(self, window_id, title, body_html="", width=800, height=600, window_state="normal"):
+        """
+        Opens a window showing `body_html`, taken from the pool when one is warm.
+
+        Args:
+            window_id (str): The ID under which the window is registered.
+            title (str): The window title.
+            body_html (str): The rendered body of the page.
+            width (int): The window width. Defaults to 800.
+            height (int): The window height. Defaults to 600.
+            window_state (str): 'normal', 'minimized' or 'maximized'. Defaults to 'normal'.
+
+        Returns:
+            WebWindow: The shown window.
+
+        Raises:
+            RuntimeError: If the pool has not been configured, so there is no page to load.
+        """
+        if window_id in self.windows:
+            window = self.windows[window_id]
+            window.set_body(body_html)
+            window.show_window()
+            return window
+
+        if self._pool:
+            window, _ = self._pool.pop()
+            self.windows.pop(window.window_id, None)
+            window.window_id = window_id
+            self.register_window(window_id, window)
+            window.setWindowTitle(title)
+            window.resize(width, height)
+            logger.debug("Window %s taken from the pool", window_id)
+        else:
+            if not self._pool_page:
+                raise RuntimeError("No shell page to open windows with; configure_pool() has not been called")
+            window = self._new_window(title, window_id, width=width, height=height)
+            window.pooled = bool(self.pool_size)
+            logger.debug("Window pool empty, created %s", window_id)
+
+        window.set_body(body_html)
+        self.set_window_state(window_id, window_state)
+        window.show_window()
+        if len(self._pool) < self.pool_size:
+            QTimer.singleShot(0, self.prewarm)  # Refill once the new window is on screen
+        return window
+
+    def _new_window(self, title, window_id, **kwargs):
+        """Creates a hidden window loading the shell page."""
+        return WebWindow(title, window_id=window_id, html_file=self._pool_page, html=self._pool_html,
+                         js_api=self._pool_api, **kwargs)
+
+    def release(self, window):
+        """
+        Returns a closed pooled window to the pool.
+
+        Args:
+            window (WebWindow): The window being closed.
+
+        Returns:
+            bool: True if the window was kept, False if it should be destroyed.
+        """
+        self.windows.pop(window.window_id, None)
+        if not window.pooled or len(self._pool) >= self.pool_size:
+            return False
+        window.window_id = f"__pool_{next(self._pool_ids)}"
+        self.register_window(window.window_id, window)
+        window.set_body("")
+        self._pool.append((window, time.monotonic()))
+        return True
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        kept = []
+        # Newest first: the most recently used window always stays warm
+        for window, idle_since in sorted(self._pool, key=lambda entry: entry[1], reverse=True):
+            if not kept or now - idle_since <= self.pool_idle_timeout:
+                kept.append((window, idle_since))
+                continue
+            logger.debug("Evicting idle pooled window %s", window.window_id)
+            self.windows.pop(window.window_id, None)
+            window.pooled = False
+            window.close()
+            window.deleteLater()
+        self._pool = kept
+
     def set_window_state(self, window_id, state):
         if window_id in self.windows:
             window = self.windows[window_id]
@@ -24,9 +176,9 @@ class WindowManager:
             elif state == "normal":
                 window.setWindowState(Qt.WindowNoState)
             else:
-                print(f"Invalid state: {state}")
+                logger.warning("Invalid window state: %s", state)
         else:
-            print(f"Window ID {window_id} not found.")
+            logger.warning("Window ID %s not found.", window_id)
 
 
 
@@ -34,6 +186,12 @@ class Api(QObject):
     def __init__(self):
         super().__init__()
         self.callbacks = {}
+        # Optional hook called as dispatch_hook(name, callback, args) instead of callback(*args)
+        self.dispatch_hook = None
+        # Optional listener receiving timing reports (JSON) from the page
+        self.trace_listener = None
+        # Optional listener receiving replay results (JSON) from the page
+        self.replay_listener = None
 
     _instance = None
 
@@ -45,10 +203,19 @@ class Api(QObject):
     def register_callback(self, name, callback):
         self.callbacks[name] = callback
 
+    def unregister_callback(self, name):
+        self.callbacks.pop(name, None)
+
+    def _dispatch(self, callback_name, args):
+        callback = self.callbacks[callback_name]
+        if self.dispatch_hook:
+            return self.dispatch_hook(callback_name, callback, args)
+        return callback(*args)
+
     @Slot(str, int, result=str)
     def on_pressed(self, callback_name, *args):
         if callback_name in self.callbacks:
-            self.callbacks[callback_name](*args)
+            self._dispatch(callback_name, args)
 
             return f"Callback '{callback_name}' executed successfully."
         else:
@@ -57,25 +224,82 @@ class Api(QObject):
     @Slot(str, result=str)
     def on_pressed_str(self, callback_name):
         if callback_name in self.callbacks:
-            self.callbacks[callback_name]()
+            self._dispatch(callback_name, ())
 
             return f"Callback '{callback_name}' executed successfully."
         else:
             return f"Callback '{callback_name}' not found."
 
+    @Slot(str, result=str)
+    def on_events(self, payload):
+        """
+        Receives one batch of sampled continuous events (see EventListener) from the page.
+
+        Args:
+            payload (str): JSON list of events with `callback`, `type`, `widget_id` and `data`.
+        """
+        try:
+            events = json.loads(payload)
+        except ValueError:
+            return "Invalid event batch."
+        for event in events:
+            callback_name = event.get('callback')
+            if callback_name in self.callbacks:
+                self._dispatch(callback_name, (event.get('data') or {},))
+        return f"{len(events)} events dispatched."
+
+    @Slot(str)
+    def report_trace(self, payload):
+        if self.trace_listener:
+            self.trace_listener(payload)
+
+    @Slot(str)
+    def report_replay(self, payload):
+        if self.replay_listener:
+            self.replay_listener(payload)
+
     @Slot(str, int)
     def send_message(self, message, *args):
-        print(f"Frontend message: {message}, " ,*args)
+        logger.debug("Frontend message: %s %s", message, args)
         return "Message received!"
 
     @Slot(str)
     def on_button_clicked(self, message):
-        print(f"Message from JavaScript: {message}")
+        logger.debug("Message from JavaScript: %s", message)
 
 
 # Create a global instance of the WindowManager
 window_manager = WindowManager()
 
+
+class MainThreadInvoker(QObject):
+    """
+    Runs callables on the Qt main thread. Emitting `invoke` from a worker thread queues
+    the call on the main event loop, where it is safe to touch the webview.
+    """
+    invoke = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.invoke.connect(self._run, Qt.QueuedConnection)
+
+    @Slot(object)
+    def _run(self, callback):
+        callback()
+
+
+main_thread_invoker = MainThreadInvoker()
+
+
+def call_on_main_thread(callback):
+    """
+    Schedules a callable on the Qt main thread. Safe to call from any thread.
+
+    Args:
+        callback (callable): A function taking no arguments.
+    """
+    main_thread_invoker.invoke.emit(callback)
+
 class DebugWindow(QWebEngineView):
     """A separate window for inspecting HTML elements."""
     def __init__(self):
@@ -84,8 +308,12 @@ class DebugWindow(QWebEngineView):
         self.resize(800, 600)
 
 class WebWindow(QWidget):
-    def __init__(self, title, window_id="main_window", html_file=None, js_api=None, width=800, height=600, window_state="normal", frameless=False, on_top=True):
+    def __init__(self, title, window_id="main_window", html_file=None, js_api=None, width=800, height=600, window_state="normal", frameless=False, on_top=True, html=None):
         super().__init__()
+        self.window_id = window_id
+        self.pooled = False  # Closing a pooled window returns it to the WindowManager pool
+        self.loaded = False
+        self._pending_body = None
         self.setWindowTitle(title)
         self.setGeometry(100, 100, width, height)
         
@@ -118,11 +346,14 @@ class WebWindow(QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.addWidget(self.webview)
 
-        if html_file:
+        self.webview.loadFinished.connect(self._on_load_finished)
+        if html is not None:
+            # Loaded from memory; html_file, if given, is the base URL of its scripts and styles
+            self.webview.setHtml(html, QUrl.fromLocalFile(os.path.abspath(html_file or 'web/index.html')))
+        elif html_file:
             self.webview.setUrl(QUrl.fromLocalFile(html_file))
-            #print(js_api.callbacks)
         else:
-            print('HTML not loaded: ',html_file)
+            logger.warning("HTML not loaded: %s", html_file)
 
         self.layout.addWidget(self.webview)  # Webview occupies the entire space
 
@@ -142,6 +373,33 @@ class WebWindow(QWidget):
         # Add a toggle to show/hide the debug window
         self.debug_window.hide()
 
+    def _on_load_finished(self, ok):
+        self.loaded = True
+        if self._pending_body is not None:
+            body, self._pending_body = self._pending_body, None
+            self.set_body(body)
+
+    def set_body(self, body_html):
+        """
+        Replaces the page body, once the page has loaded.
+
+        Args:
+            body_html (str): The rendered body.
+        """
+        if not self.loaded:
+            self._pending_body = body_html
+            return
+        self.webview.page().runJavaScript(f"document.body.innerHTML = {json.dumps(body_html)};")
+
+    def closeEvent(self, event):
+        if self.pooled and window_manager.release(self):
+            # Kept warm for the next window instead of being destroyed
+            event.ignore()
+            self.hide()
+            return
+        window_manager.windows.pop(self.window_id, None)
+        super().closeEvent(event)
+
     def toggle_debug_window(self):
         if self.debug_window.isVisible():
             self.debug_window.hide()
@@ -154,16 +412,20 @@ class WebWindow(QWidget):
     def close_window(self):
         self.close()
 
-    def evaluate_js(self, window_id, *scripts):
+    def evaluate_js(self, window_id, *scripts, callback=None):
+        # callback, if given, receives the result of the last script
         if window_id in window_manager.windows:
             window = window_manager.windows[window_id]
             if hasattr(window, 'webview') and window.webview:
-                for script in scripts:
-                    window.webview.page().runJavaScript(script)
+                for index, script in enumerate(scripts):
+                    if callback and index == len(scripts) - 1:
+                        window.webview.page().runJavaScript(script, 0, callback)
+                    else:
+                        window.webview.page().runJavaScript(script)
             else:
-                print(f"Window {window_id} does not have a webview.")
+                logger.warning("Window %s does not have a webview.", window_id)
         else:
-            print(f"Window ID {window_id} not found.")
+            logger.warning("Window ID %s not found.", window_id)
 
 
 
@@ -12,14 +12,15 @@ class MyAppState(State):
     def __init__(self):
         super().__init__()
         self.currentIndex = 0
+        # Keeps both tabs mounted; switching tabs does not rebuild
+        self.tabs = IndexedStackController(initialIndex=0, maxAlive=2)
         self.bottom_sheet_visible = False
         self.snack_bar_visible = False
         self.drawer_visible = False
         self.end_drawer_visible = False
 
     def on_tab_selected(self, index):
-        self.currentIndex = index
-        self.setState()  # Update the UI when the tab is selected
+        self.currentIndex = index  # The tabs controller has already switched the page
 
     def open_drawer(self):
         self.openDrawer()
@@ -39,28 +40,24 @@ class MyAppState(State):
 
     def open_bottom_sheet(self):
         self.openBottomSheet()
-        self.setState()
 
     def hide_bottom_sheet(self):
         self.closeBottomSheet()
-        self.setState()
 
     def show_snack_bar(self):
         self.openSnackBar()
-        self.setState()
 
     def hide_snack_bar(self):
         self.closeSnackBar()
-        self.setState()
 
     def undo(self):
         print("Undo action")
         self.hide_snack_bar()
 
     def build(self):
-        # Define the content for each tab
+        # Builders for each tab; a tab is built on its first visit
         content = [
-            Container(
+            lambda: Container(
                 child=Column(
                     children=[
                         Text('Welcome to the Home Page!'),
@@ -82,7 +79,7 @@ class MyAppState(State):
                     borderRadius=25,
                 )
             ),
-            Container(
+            lambda: Container(
                 child=Text('Settings Page'),
                 padding=EdgeInsets.all(20),
                 margin=EdgeInsets.all(20),
@@ -94,8 +91,7 @@ class MyAppState(State):
             )
         ]
 
-        # Set the content based on the current index
-        body_content = content[self.currentIndex]
+        body_content = IndexedStack(children=content, controller=self.tabs)
 
         items = [
             Text(data=f'Item {i}', style=TextStyle(fontSize=16, color=Colors.black)) for i in range(20)
@@ -147,7 +143,7 @@ class MyAppState(State):
         snack_bar = SnackBar(
             content=Text("Item deleted"),
             action=snack_bar_action,
-            duration=3,
+            duration=3000,
             backgroundColor=Colors.pink, 
         ) 
         scaffold = Scaffold(
@@ -169,7 +165,7 @@ class MyAppState(State):
                         onPressed=self.open_end_drawer
                     ),
                 ],
-            ) if self.currentIndex == 0 else None,
+            ),
 
             body=Body(
                 child=body_content,
@@ -182,7 +178,7 @@ class MyAppState(State):
                     BottomNavigationBarItem(icon=Icon('gear'), label=Text('Settings')),
                 ],
                 onTap=self.on_tab_selected,
-                currentIndex=self.currentIndex,
+                controller=self.tabs,
                 backgroundColor=Colors.white,
                 elevation=10,
                 iconSize=30,
@@ -1,8 +1,71 @@
 // web/main.js
 
+// Frame-timeline tracing. Enabled when the page sets window.pythraTracing = true.
+// Spans are timestamped in epoch milliseconds so they line up with Python's spans.
+const pythraTrace = {
+    pending: null,
+
+    now() {
+        return performance.timeOrigin + performance.now();
+    },
+
+    begin(callbackName) {
+        if (!window.pythraTracing) return;
+        performance.mark(`pythra:${callbackName}:start`);
+        this.pending = { callback: callbackName, start: this.now(), spans: [] };
+    },
+
+    span(name, start, end, args) {
+        if (!this.pending) return;
+        this.pending.spans.push({
+            name: name,
+            ts: start,
+            dur: Math.max(0, end - start),
+            args: Object.assign({ callback: this.pending.callback }, args || {})
+        });
+    },
+
+    handlerReturned() {
+        if (!this.pending) return;
+        // Click to promise resolution: QWebChannel transport both ways plus the Python handler.
+        this.span('bridge_roundtrip', this.pending.start, this.now());
+        this.flushSoon();
+    },
+
+    patchApplied(widgetId, patchStart) {
+        if (!this.pending) return;
+        const patchStartEpoch = performance.timeOrigin + patchStart;
+        const patchEnd = this.now();
+        performance.mark(`pythra:${this.pending.callback}:patched`);
+        this.span('dom_patch', patchStartEpoch, patchEnd, { widget_id: widgetId });
+        // The frame is painted once the next animation frame has run.
+        requestAnimationFrame(() => {
+            setTimeout(() => {
+                this.span('layout_paint', patchEnd, this.now(), { widget_id: widgetId });
+                this.flushSoon();
+            }, 0);
+        });
+    },
+
+    flushSoon() {
+        if (!this.pending || this.flushTimer) return;
+        this.flushTimer = setTimeout(() => {
+            this.flushTimer = null;
+            const pending = this.pending;
+            if (!pending || !window.pywebview) return;
+            const spans = pending.spans.splice(0);
+            if (spans.length) {
+                window.pywebview.report_trace(JSON.stringify(spans));
+            }
+        }, 50);
+    }
+};
+
 function handleClick(callback_name) {
     if (window.pywebview) {
+        pythraTrace.begin(callback_name);
         window.pywebview.on_pressed_str(callback_name).then(function(response) {
+            pythraTrace.handlerReturned();
             console.log(response);
         }).catch(function(error) {
             console.error(error);
@@ -14,8 +77,9 @@ function handleClick(callback_name) {
 
 function handleClickOnTap(callback_name, ...args) {
     if (window.pywebview) {
-        console.log("index", args);
+        pythraTrace.begin(callback_name);
         window.pywebview.on_pressed(callback_name, ...args).then(function(response) {
+            pythraTrace.handlerReturned();
             console.log(response);
         }).catch(function(error) {
             console.error(error);
@@ -25,101 +89,774 @@ function handleClickOnTap(callback_name, ...args) {
     }
 }
 
-new QWebChannel(qt.webChannelTransport, function(channel) {
-    window.pywebview = channel.objects.pywebview;
-});
+// One MutationObserver for the page; helpers register for added and removed elements,
+// for example the subtrees inserted by outerHTML patches.
+const pythraDom = {
+    addedHandlers: [],
+    removedHandlers: [],
+
+    onAdded(handler) {
+        this.addedHandlers.push(handler);
+    },
+
+    onRemoved(handler) {
+        this.removedHandlers.push(handler);
+    },
 
+    start() {
+        new MutationObserver((mutations) => {
+            mutations.forEach((mutation) => {
+                mutation.removedNodes.forEach((node) => {
+                    if (node.nodeType === 1) this.removedHandlers.forEach((handler) => handler(node));
+                });
+                mutation.addedNodes.forEach((node) => {
+                    if (node.nodeType === 1) this.addedHandlers.forEach((handler) => handler(node));
+                });
+            });
+        }).observe(document.body, { childList: true, subtree: true });
+    }
+};
+
+// Lazy images. Image widgets with lazy=True render <img data-src="..."> with a small
+// placeholder as background; the real source is assigned here. Browsers with native
+// lazy loading defer the fetch themselves, others load it when it nears the viewport.
+const pythraLazyImages = {
+    nativeLazy: 'loading' in HTMLImageElement.prototype,
+    observer: null,
+
+    load(img) {
+        const src = img.dataset.src;
+        if (!src) return;
+        img.addEventListener('load', function() {
+            img.style.backgroundImage = '';
+            img.classList.remove('pythra-lazy');
+        }, { once: true });
+        img.removeAttribute('data-src');
+        img.src = src;
+    },
+
+    handle(img) {
+        if (this.nativeLazy || !('IntersectionObserver' in window)) {
+            this.load(img);
+            return;
+        }
+        if (!this.observer) {
+            this.observer = new IntersectionObserver((entries) => {
+                entries.forEach((entry) => {
+                    if (entry.isIntersecting) {
+                        this.observer.unobserve(entry.target);
+                        this.load(entry.target);
+                    }
+                });
+            }, { rootMargin: '200px' });
+        }
+        this.observer.observe(img);
+    },
+
+    scan(root) {
+        if (root.matches && root.matches('img[data-src]')) {
+            this.handle(root);
+            return;
+        }
+        root.querySelectorAll('img[data-src]').forEach((img) => this.handle(img));
+    },
+
+    start() {
+        this.scan(document);
+        // Patched subtrees (outerHTML replacements) bring new lazy images with them.
+        pythraDom.onAdded((node) => this.scan(node));
+    }
+};
+
+// Continuous event channel. EventListener widgets render data-pythra-events with their
+// subscriptions; events are sampled per policy and sent to Python in one batch per frame.
+const pythraEvents = {
+    queue: new Map(),       // "widgetId:type" -> pending event
+    timers: new Map(),      // "widgetId:type" -> throttle/debounce timer
+    lastSent: new Map(),    // "widgetId:type" -> time of the last throttled delivery
+    trailing: new Map(),    // "widgetId:type" -> newest event waiting for the throttle interval
+    frameRequested: false,
+    inFlight: false,
+    resizeObserver: null,
+
+    eventData(type, element, event) {
+        if (type === 'scroll') {
+            const target = event && event.target !== document ? event.target : element;
+            return {
+                scrollTop: target.scrollTop, scrollLeft: target.scrollLeft,
+                scrollHeight: target.scrollHeight, scrollWidth: target.scrollWidth,
+                clientHeight: target.clientHeight, clientWidth: target.clientWidth
+            };
+        }
+        if (type === 'pointermove') {
+            const rect = element.getBoundingClientRect();
+            return { x: event.clientX - rect.left, y: event.clientY - rect.top, buttons: event.buttons };
+        }
+        if (type === 'resize') {
+            return { width: event.contentRect.width, height: event.contentRect.height };
+        }
+        if (type === 'input') {
+            return { value: event.target.value, targetId: event.target.id };
+        }
+        return {};
+    },
 
-function updateLayout() {
-    {
-        // Find elements *inside* the function
-        const leftDrawer = document.getElementById('leftDrawer');
-        const rightDrawer = document.getElementById('rightDrawer');
-        const content = document.getElementById('content');
-        const appBar = document.querySelector('.app-bar'); // Assuming only one app-bar
+    receive(element, type, subscription, event) {
+        const key = `${element.id}:${type}`;
+        const entry = {
+            callback: subscription.callback,
+            type: type,
+            widget_id: element.id,
+            policy: subscription.policy,
+            data: this.eventData(type, element, event)
+        };
+        const interval = subscription.interval || 100;
 
-        // Basic null checks
-        if (!content || !appBar || !leftDrawer || !rightDrawer) {
-            {
-                console.warn("updateLayout: Could not find all required elements (content, appBar, leftDrawer, rightDrawer).");
-                return;
+        if (subscription.policy === 'debounce') {
+            clearTimeout(this.timers.get(key));
+            this.timers.set(key, setTimeout(() => {
+                this.timers.delete(key);
+                this.enqueue(key, entry);
+            }, interval));
+        } else if (subscription.policy === 'throttle') {
+            const wait = interval - (performance.now() - (this.lastSent.get(key) || -Infinity));
+            if (wait <= 0) {
+                this.lastSent.set(key, performance.now());
+                this.enqueue(key, entry);
+            } else {
+                // Keep the newest event for the trailing delivery.
+                this.trailing.set(key, entry);
+                if (!this.timers.has(key)) {
+                    this.timers.set(key, setTimeout(() => {
+                        this.timers.delete(key);
+                        this.lastSent.set(key, performance.now());
+                        this.enqueue(key, this.trailing.get(key));
+                        this.trailing.delete(key);
+                    }, wait));
+                }
             }
+        } else {
+            // 'raf' and 'latest': only the newest event per element and type is kept.
+            this.enqueue(key, entry);
+        }
+    },
+
+    enqueue(key, entry) {
+        this.queue.set(key, entry);
+        this.requestFlush();
+    },
+
+    requestFlush() {
+        if (!this.frameRequested) {
+            this.frameRequested = true;
+            requestAnimationFrame(() => this.flush());
         }
+    },
+
+    flush() {
+        this.frameRequested = false;
+        if (!window.pywebview || !this.queue.size) return;
+        const batch = [];
+        this.queue.forEach((entry, key) => {
+            // 'latest' events wait until Python has handled the previous batch.
+            if (entry.policy === 'latest' && this.inFlight) return;
+            batch.push(entry);
+            this.queue.delete(key);
+        });
+        if (!batch.length) return;
+        this.inFlight = true;
+        window.pywebview.on_events(JSON.stringify(batch)).then(() => {
+            this.inFlight = false;
+            if (this.queue.size) this.requestFlush();
+        }).catch((error) => {
+            this.inFlight = false;
+            console.error(error);
+        });
+    },
 
-        const leftOpen = leftDrawer.classList.contains('open');
-        const rightOpen = rightDrawer.classList.contains('open');
+    bind(element) {
+        if (element._pythraEvents) return;
+        let subscriptions;
+        try {
+            subscriptions = JSON.parse(element.dataset.pythraEvents);
+        } catch (error) {
+            console.error('Invalid data-pythra-events on', element.id, error);
+            return;
+        }
+        element._pythraEvents = subscriptions;
+        Object.keys(subscriptions).forEach((type) => {
+            const subscription = subscriptions[type];
+            if (type === 'resize') {
+                if (!this.resizeObserver) {
+                    this.resizeObserver = new ResizeObserver((entries) => {
+                        entries.forEach((entry) => {
+                            const subs = entry.target._pythraEvents;
+                            if (subs && subs.resize) this.receive(entry.target, 'resize', subs.resize, entry);
+                        });
+                    });
+                }
+                this.resizeObserver.observe(element);
+            } else {
+                // Capture, because scroll events of descendants do not bubble.
+                element.addEventListener(type, (event) => this.receive(element, type, subscription, event),
+                    { capture: type === 'scroll', passive: true });
+            }
+        });
+    },
 
-        // Get widths dynamically from the elements themselves
-        const leftDrawerWidth = leftDrawer.offsetWidth;
-        const rightDrawerWidth = rightDrawer.offsetWidth;
-        console.log(`${leftDrawerWidth}`);
+    scan(root) {
+        if (root.matches && root.matches('[data-pythra-events]')) this.bind(root);
+        root.querySelectorAll('[data-pythra-events]').forEach((element) => this.bind(element));
+    },
 
-        // Apply styles
-        content.style.marginLeft = leftOpen ? `${leftDrawerWidth}px` : '0px';
-        content.style.marginRight = rightOpen ? `${rightDrawerWidth}px` : '0px';
-        appBar.style.marginLeft = leftOpen ? `${leftDrawerWidth}px` : '0px';
-        appBar.style.marginRight = rightOpen ? `${rightDrawerWidth}px` : '0px';
+    unbind(root) {
+        if (!this.resizeObserver) return;
+        if (root.matches && root.matches('[data-pythra-events]')) this.resizeObserver.unobserve(root);
+        root.querySelectorAll('[data-pythra-events]').forEach((element) => this.resizeObserver.unobserve(element));
+    },
 
-        console.log(`Layout Updated: LeftOpen = ${leftOpen}, RightOpen = ${rightOpen}, LeftWidth = ${leftDrawerWidth}, RightWidth = ${rightDrawerWidth}`); // Debug
+    start() {
+        this.scan(document);
+        pythraDom.onAdded((node) => this.scan(node));
+        pythraDom.onRemoved((node) => this.unbind(node));
     }
-}
+};
 
-function toggleDrawer(side) {
-    {
-        // Find elements *inside* the function
-        const leftDrawer = document.getElementById('leftDrawer');
-        const rightDrawer = document.getElementById('rightDrawer');
-        const bottomNav = document.getElementById('bottomNav'); // Expects ID to exist
-
-        // Check if drawers exist
-        if (!leftDrawer || !rightDrawer) {
-            {
-                console.error("toggleDrawer: Cannot find left or right drawer element!");
-                return;
+// TextField values stay in the page while typing. They are sent to the field's
+// TextEditingController through the event channel after a pause, on blur or on Enter.
+const pythraTextFields = {
+    timers: new Map(),  // controller id -> debounce timer
+
+    config(field) {
+        if (!field._pythraSync) {
+            try {
+                field._pythraSync = JSON.parse(field.dataset.pythraSync);
+            } catch (error) {
+                field._pythraSync = {};
             }
         }
+        return field._pythraSync;
+    },
 
-        const drawer = side === 'left' ? leftDrawer : rightDrawer;
-        const isOpen = drawer.classList.contains('open');
+    synced(field) {
+        return field._pythraSynced !== undefined ? field._pythraSynced : field.defaultValue;
+    },
 
-        console.log(`Toggling drawer: ${side}, Currently Open: ${isOpen}`); // Debug
+    sync(field, reason) {
+        const controller = field.dataset.pythraController;
+        clearTimeout(this.timers.get(controller));
+        this.timers.delete(controller);
+        if (reason !== 'submit' && field.value === this.synced(field)) return;
+        field._pythraSynced = field.value;
+        const config = this.config(field);
+        if (!config.callback) return;
+        pythraEvents.enqueue(`${controller}:sync`, {
+            callback: config.callback,
+            type: 'sync',
+            widget_id: controller,
+            policy: 'raf',
+            data: { value: field.value, reason: reason }
+        });
+    },
 
-        if (isOpen) {
-            {
-                drawer.classList.remove('open');
-            }
-        } else {
-            {
-                drawer.classList.add('open');
-                if (bottomNav) {
-                    {
-                        bottomNav.classList.add('hidden');
-                    }
-                } else {
-                    {
-                        console.warn("toggleDrawer: bottomNav element not found to hide.");
+    // Returns a function restoring unsynced values, focus and selection after `element` is replaced.
+    preserve(element) {
+        const states = [];
+        const fields = element.matches('[data-pythra-controller]') ? [element] : element.querySelectorAll('[data-pythra-controller]');
+        fields.forEach((field) => {
+            const focused = document.activeElement === field;
+            if (field.value === this.synced(field) && !focused) return;
+            states.push({
+                controller: field.dataset.pythraController,
+                value: field.value,
+                dirty: field.value !== this.synced(field),
+                synced: this.synced(field),
+                focused: focused,
+                selectionStart: field.selectionStart,
+                selectionEnd: field.selectionEnd
+            });
+        });
+        if (!states.length) return null;
+        return () => {
+            states.forEach((state) => {
+                const field = document.querySelector(`[data-pythra-controller="${state.controller}"]`);
+                if (!field) return;
+                if (state.dirty) {
+                    field.value = state.value;
+                    field._pythraSynced = state.synced;
+                }
+                if (state.focused) {
+                    field.focus();
+                    try {
+                        field.setSelectionRange(state.selectionStart, state.selectionEnd);
+                    } catch (error) {
+                        // Not every input type has a selection.
                     }
                 }
+            });
+        };
+    },
+
+    start() {
+        // Delegated listeners, so fields inserted by patches need no binding.
+        document.addEventListener('input', (event) => {
+            const field = event.target;
+            if (!field.dataset || !field.dataset.pythraController) return;
+            const controller = field.dataset.pythraController;
+            clearTimeout(this.timers.get(controller));
+            this.timers.set(controller, setTimeout(() => this.sync(field, 'debounce'), this.config(field).delay || 300));
+        }, true);
+        document.addEventListener('focusout', (event) => {
+            const field = event.target;
+            if (field.dataset && field.dataset.pythraController) this.sync(field, 'blur');
+        }, true);
+        document.addEventListener('keydown', (event) => {
+            const field = event.target;
+            if (event.key === 'Enter' && field.dataset && field.dataset.pythraController) this.sync(field, 'submit');
+        }, true);
+    }
+};
+
+// Implicit animations. AnimatedContainer/AnimatedOpacity render data-pythra-animate with
+// the values of the previous and the new build; the element already carries the new
+// values, so the animation only plays the transition and leaves no state behind.
+const pythraAnimations = {
+    play(element) {
+        let animation;
+        try {
+            animation = JSON.parse(element.dataset.pythraAnimate);
+        } catch (error) {
+            return;
+        }
+        element.removeAttribute('data-pythra-animate');
+        if (!element.animate) return;
+        element.animate([animation.from, animation.to], {
+            duration: animation.duration,
+            easing: animation.easing || 'ease-in-out'
+        });
+    },
+
+    scan(root) {
+        if (root.matches && root.matches('[data-pythra-animate]')) this.play(root);
+        root.querySelectorAll('[data-pythra-animate]').forEach((element) => this.play(element));
+    },
+
+    start() {
+        this.scan(document);
+        pythraDom.onAdded((node) => this.scan(node));
+    }
+};
+
+// Replays events sent by framework.replay.ReplayHarness. Each event is timed from the bridge
+// call to the last DOM mutation it caused and to the next painted frame; the results are
+// reported back in one batch when all rounds have run.
+const pythraReplay = {
+    lastMutation: 0,
+
+    wait(ms) {
+        return new Promise((resolve) => setTimeout(resolve, ms));
+    },
+
+    nextPaint() {
+        return new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, 0)));
+    },
+
+    fire(event) {
+        if (event.script) return Promise.resolve(new Function(event.script)());
+        const args = event.args || [];
+        if (args.length) return window.pywebview.on_pressed(event.callback, ...args);
+        return window.pywebview.on_pressed_str(event.callback);
+    },
+
+    async measure(event) {
+        this.lastMutation = 0;
+        const start = performance.now();
+        await this.fire(event);
+        const returned = performance.now();
+        // Patches sent by the handler run before its reply arrives; wait for the frame painting them
+        await this.nextPaint();
+        const painted = performance.now();
+        return {
+            label: event.label || event.callback || 'script',
+            bridge_ms: returned - start,
+            patch_ms: this.lastMutation ? this.lastMutation - start : null,
+            paint_ms: painted - start
+        };
+    },
+
+    async run(events, repeat) {
+        while (!window.pywebview) await this.wait(50);
+        const observer = new MutationObserver(() => { this.lastMutation = performance.now(); });
+        observer.observe(document.body, { childList: true, subtree: true, attributes: true, characterData: true });
+        const results = [];
+        let busy = 0;
+        for (let round = 0; round < (repeat || 1); round++) {
+            for (const event of events) {
+                if (event.delay_ms) await this.wait(event.delay_ms);
+                const result = await this.measure(event);
+                busy += result.paint_ms;
+                results.push(result);
             }
         }
+        observer.disconnect();
+        window.pywebview.report_replay(JSON.stringify({ results: results, busy_ms: busy }));
+    }
+};
+
+// Ctrl+Shift+D asks Python for a diagnostics report (live widgets, styles, callbacks,
+// allocations). The callback is only registered when `diagnostics` is on in the config.
+const pythraDiagnostics = {
+    start() {
+        document.addEventListener('keydown', (event) => {
+            if (event.ctrlKey && event.shiftKey && (event.key === 'D' || event.key === 'd')) {
+                event.preventDefault();
+                handleClick('__pythra_diagnostics');
+            }
+        });
+    }
+};
 
-        // Call layout update AFTER changing class
-        updateLayout();
+// Append-only log views. LogView widgets render data-pythra-log with their options; Python
+// sends only the lines appended since its last flush, and the oldest lines past the cap are
+// dropped here. Virtualized views keep the lines as strings and render the visible window.
+// Rebuilds render a data-pythra-log-keep placeholder, which is swapped for the element the
+// patch removed, so existing lines are never rendered again.
+const pythraLogView = {
+    views: new WeakMap(),  // Element -> view state
+    detached: new Map(),   // Id -> view element removed by the current patch
 
-        // Check final state to decide on bottomNav visibility
-        const leftIsOpenAfter = leftDrawer.classList.contains('open');
-        const rightIsOpenAfter = rightDrawer.classList.contains('open');
+    view(id) {
+        const element = document.getElementById(id);
+        if (!element || element.hasAttribute('data-pythra-log-keep')) return null;
+        return this.views.get(element) || this.init(element);
+    },
 
-        if (!leftIsOpenAfter && !rightIsOpenAfter) {
-            {
-                if (bottomNav) {
-                    {
-                        bottomNav.classList.remove('hidden');
-                    }
-                }
+    init(element) {
+        let options;
+        try {
+            options = JSON.parse(element.dataset.pythraLog);
+        } catch (error) {
+            return null;
+        }
+        const body = element.querySelector(':scope > .pythra-log-body');
+        const view = {
+            element: element,
+            body: body,
+            window: options.virtualized ? body.querySelector('.pythra-log-window') : null,
+            lines: options.virtualized ? options.lines : null,
+            maxLines: options.maxLines,
+            lineHeight: options.lineHeight,
+            autoScroll: options.autoScroll,
+            overscan: options.overscan,
+            scrollTop: 0,      // Kept up to date, as a detached element reports 0
+            stuck: options.autoScroll,
+            first: -1,
+            last: -1
+        };
+        element.removeAttribute('data-pythra-log');
+        this.views.set(element, view);
+        element.addEventListener('scroll', () => {
+            if (!element.isConnected) return;
+            view.scrollTop = element.scrollTop;
+            view.stuck = view.autoScroll && this.pinned(view);
+            if (view.lines) this.render(view);
+        }, { passive: true });
+        if (view.autoScroll) element.scrollTop = element.scrollHeight;
+        if (view.lines) this.render(view);
+        return view;
+    },
+
+    reattach(placeholder) {
+        const element = this.detached.get(placeholder.id);
+        if (!element) {
+            // Nothing to keep (e.g. after a reload): ask Python for the full view
+            handleClick(placeholder.dataset.pythraLogKeep);
+            return;
+        }
+        this.detached.delete(placeholder.id);
+        placeholder.replaceWith(element);
+        const view = this.views.get(element);
+        element.scrollTop = view.stuck ? element.scrollHeight : view.scrollTop;
+        if (view.lines) {
+            view.first = -1;
+            this.render(view);
+        }
+    },
+
+    detach(node) {
+        const elements = node.matches('.pythra-log-view') ? [node] : node.querySelectorAll('.pythra-log-view');
+        elements.forEach((element) => {
+            if (this.views.has(element)) this.detached.set(element.id, element);
+        });
+        // Only the patch that removed them can put them back
+        if (this.detached.size) queueMicrotask(() => this.detached.clear());
+    },
+
+    reset(id, html) {
+        const element = document.getElementById(id);
+        if (element) element.outerHTML = html;
+    },
+
+    pinned(view) {
+        const element = view.element;
+        return element.scrollHeight - element.scrollTop - element.clientHeight <= view.lineHeight;
+    },
+
+    append(id, lines) {
+        const view = this.view(id);
+        if (!view) return;
+        const pin = view.autoScroll && this.pinned(view);
+        let removed;
+        if (view.lines) {
+            for (const line of lines) view.lines.push(line);
+            removed = Math.max(0, view.lines.length - view.maxLines);
+            if (removed) view.lines.splice(0, removed);
+            view.body.style.height = `${view.lines.length * view.lineHeight}px`;
+            view.first = -1;  // Indices have shifted
+        } else {
+            const fragment = document.createDocumentFragment();
+            for (const line of lines) {
+                const row = document.createElement('div');
+                row.className = 'pythra-log-line';
+                row.textContent = line;
+                fragment.appendChild(row);
             }
+            view.body.appendChild(fragment);
+            removed = Math.max(0, view.body.childElementCount - view.maxLines);
+            for (let i = 0; i < removed; i++) view.body.firstElementChild.remove();
+        }
+        if (pin) {
+            view.element.scrollTop = view.element.scrollHeight;
+        } else if (removed) {
+            // Keep the lines being read in place while older ones are dropped above them
+            view.element.scrollTop -= removed * view.lineHeight;
+        }
+        if (view.lines) this.render(view);
+    },
+
+    clear(id) {
+        const view = this.view(id);
+        if (!view) return;
+        if (view.lines) {
+            view.lines.length = 0;
+            view.body.style.height = '0px';
+            view.window.replaceChildren();
+            view.first = view.last = -1;
+        } else {
+            view.body.replaceChildren();
+        }
+    },
+
+    render(view) {
+        const element = view.element;
+        const count = view.lines.length;
+        const first = Math.max(0, Math.floor(element.scrollTop / view.lineHeight) - view.overscan);
+        const last = Math.min(count, Math.ceil((element.scrollTop + element.clientHeight) / view.lineHeight) + view.overscan);
+        if (first === view.first && last === view.last) return;
+        view.first = first;
+        view.last = last;
+        const fragment = document.createDocumentFragment();
+        for (let i = first; i < last; i++) {
+            const row = document.createElement('div');
+            row.className = 'pythra-log-line';
+            row.textContent = view.lines[i];
+            fragment.appendChild(row);
+        }
+        view.window.style.top = `${first * view.lineHeight}px`;
+        view.window.replaceChildren(fragment);
+    },
+
+    scan(root) {
+        if (root.matches && root.matches('[data-pythra-log]')) this.init(root);
+        root.querySelectorAll('[data-pythra-log]').forEach((element) => this.init(element));
+        if (root.matches && root.matches('[data-pythra-log-keep]')) this.reattach(root);
+        root.querySelectorAll('[data-pythra-log-keep]').forEach((placeholder) => this.reattach(placeholder));
+    },
+
+    start() {
+        this.scan(document);
+        pythraDom.onRemoved((node) => this.detach(node));
+        pythraDom.onAdded((node) => this.scan(node));
+    }
+};
+
+document.addEventListener('DOMContentLoaded', function() {
+    pythraDom.start();
+    pythraLazyImages.start();
+    pythraEvents.start();
+    pythraTextFields.start();
+    pythraAnimations.start();
+    pythraOverlays.start();
+    pythraDiagnostics.start();
+    pythraLogView.start();
+});
+
+new QWebChannel(qt.webChannelTransport, function(channel) {
+    window.pywebview = channel.objects.pywebview;
+});
+
+
+// Keep-alive pages of IndexedStack and Navigator widgets. Hidden pages stay in the DOM with
+// content-visibility: hidden, so switching is a class toggle; the scroll position of the
+// surrounding scroller is saved per page and restored when the page is shown again.
+const pythraKeepAlive = {
+    scroll: new WeakMap(),  // Page element -> scrollTop when it was hidden
+
+    stack(key) {
+        return document.querySelector(`[data-pythra-stack="${key}"]`);
+    },
+
+    page(stack, index) {
+        return stack ? stack.querySelector(`:scope > [data-index="${CSS.escape(String(index))}"]`) : null;
+    },
+
+    mount(key, index, html) {
+        const stack = this.stack(key);
+        if (stack && !this.page(stack, index)) stack.insertAdjacentHTML('beforeend', html);
+    },
+
+    evict(key, index) {
+        const page = this.page(this.stack(key), index);
+        if (page) page.remove();
+    },
+
+    show(key, index) {
+        const stack = this.stack(key);
+        const next = this.page(stack, index);
+        if (!next) return;
+        // A freshly mounted page is rendered active already
+        const current = Array.from(stack.querySelectorAll(':scope > .keep-alive-page.active')).filter((page) => page !== next);
+        if (!current.length && next.classList.contains('active')) return;
+        const scroller = stack.closest('.content') || document.scrollingElement;
+        // The only layout read happens before the class writes
+        if (current.length) this.scroll.set(current[0], scroller.scrollTop);
+        current.forEach((page) => page.classList.remove('active'));
+        next.classList.add('active');
+        scroller.scrollTop = this.scroll.get(next) || 0;
+    }
+};
+
+// Drawers, bottom sheets and snack bars. Opening or closing one only toggles classes,
+// queued and applied together in the next animation frame; the geometry lives in CSS,
+// where everything moves with transforms and the content follows the drawers through the
+// --pythra-left-width/--pythra-right-width custom properties. Nothing reads layout, so a
+// toggle never forces a synchronous reflow and never reflows the content area.
+const pythraOverlays = {
+    pending: new Map(),  // Element -> {class name: present}
+    frame: 0,
+    timers: new Map(),  // Snack bar ID -> auto-hide timeout
+    resizeObserver: null,
+
+    // Queues a class change for the next frame.
+    write(element, className, present) {
+        if (!element) return;
+        let classes = this.pending.get(element);
+        if (!classes) this.pending.set(element, classes = {});
+        classes[className] = present;
+        if (!this.frame) this.frame = requestAnimationFrame(() => this.flush());
+    },
+
+    // Whether an element has a class, counting queued changes. classList reads are layout free.
+    has(element, className) {
+        const classes = this.pending.get(element);
+        if (classes && className in classes) return classes[className];
+        return element.classList.contains(className);
+    },
+
+    flush() {
+        this.frame = 0;
+        const pending = this.pending;
+        this.pending = new Map();
+        pending.forEach((classes, element) => {
+            for (const name in classes) element.classList.toggle(name, classes[name]);
+        });
+    },
+
+    // Opens (true), closes (false) or toggles (undefined) the 'left' or 'right' drawer.
+    drawer(side, open) {
+        const drawer = document.getElementById(side === 'right' ? 'rightDrawer' : 'leftDrawer');
+        if (!drawer) {
+            console.warn(`pythraOverlays: no ${side} drawer on the page.`);
+            return;
         }
+        if (open === undefined) open = !this.has(drawer, 'open');
+        this.write(drawer, 'open', open);
+        // The scaffold class shifts the content and app bar and hides the bottom navigation
+        this.write(drawer.closest('.body'), side === 'right' ? 'right-open' : 'left-open', open);
+    },
+
+    // Opens, closes or toggles a bottom sheet together with its barrier.
+    sheet(id, open) {
+        const sheet = document.getElementById(id);
+        if (!sheet) return;
+        if (open === undefined) open = !this.has(sheet, 'open');
+        this.write(sheet, 'open', open);
+        this.write(document.getElementById(`${id}-barrier`), 'open', open);
+    },
+
+    // Shows, hides or toggles a snack bar. A shown snack bar hides itself after `duration`
+    // milliseconds (default: its data-duration attribute), without a round trip to Python.
+    snackBar(id, open, duration) {
+        clearTimeout(this.timers.get(id));
+        this.timers.delete(id);
+        const bar = document.getElementById(id);
+        if (!bar) return;
+        if (open === undefined) open = !this.has(bar, 'open');
+        this.write(bar, 'open', open);
+        if (open) this.autoHide(bar, duration);
+    },
+
+    autoHide(bar, duration) {
+        duration = duration || Number(bar.dataset.duration);
+        if (duration > 0) this.timers.set(bar.id, setTimeout(() => this.snackBar(bar.id, false), duration));
+    },
+
+    // Drawers whose content makes them wider than configured update the content offset.
+    // ResizeObserver reports sizes after layout, so measuring forces none.
+    observe(root) {
+        if (!this.resizeObserver) return;
+        ['leftDrawer', 'rightDrawer'].forEach((id) => {
+            const drawer = root.id === id ? root : root.querySelector(`#${id}`);
+            if (drawer) this.resizeObserver.observe(drawer);
+        });
+    },
+
+    measured(entries) {
+        entries.forEach((entry) => {
+            const scaffold = entry.target.closest('.body');
+            if (!scaffold) return;
+            const size = entry.borderBoxSize && entry.borderBoxSize[0];
+            const width = size ? size.inlineSize : entry.contentRect.width;
+            const name = entry.target.id === 'rightDrawer' ? '--pythra-right-width' : '--pythra-left-width';
+            scaffold.style.setProperty(name, `${width}px`);
+        });
+    },
+
+    start() {
+        if (window.ResizeObserver) this.resizeObserver = new ResizeObserver((entries) => this.measured(entries));
+        this.observe(document.body);
+        // A rebuild while a snack bar is shown renders it open with its remaining time
+        document.querySelectorAll('.snack-bar.open').forEach((bar) => this.autoHide(bar));
+        pythraDom.onAdded((node) => {
+            this.observe(node);
+            const bars = node.matches('.snack-bar.open') ? [node] : node.querySelectorAll('.snack-bar.open');
+            bars.forEach((bar) => {
+                if (!this.timers.has(bar.id)) this.autoHide(bar);
+            });
+        });
+        pythraDom.onRemoved((node) => {
+            if (!this.resizeObserver) return;
+            ['leftDrawer', 'rightDrawer'].forEach((id) => {
+                const drawer = node.id === id ? node : node.querySelector(`#${id}`);
+                if (drawer) this.resizeObserver.unobserve(drawer);
+            });
+        });
     }
+};
+
+// Kept for existing pages and callbacks: toggles the 'left' or 'right' drawer.
+function toggleDrawer(side) {
+    pythraOverlays.drawer(side);
 }
 
 